@@ -0,0 +1,8 @@
+"""
+כלים משותפים לכל השקפים
+Shared utilities for all slides
+"""
+
+__version__ = "1.0.0"
+__author__ = "Manus AI System"
+__description__ = "כלים משותפים - הגדרות רינדור והרצה"
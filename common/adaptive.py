@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Precision-Targeted Adaptive Simulation
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Instead of a number of iterations fixed in advance, run_until_precise()
+takes the accuracy that is wanted, a confidence-interval half-width or a
+relative error, and draws batches until the interval is that narrow.
+The half-width shrinks like 1/sqrt(n), so after each batch the number of
+samples still needed is projected from the current standard error; the
+next batch covers that projection, but at most doubles the samples drawn
+so far, so a poor early variance estimate cannot overshoot much.
+
+Samplers use the common.montecarlo convention sampler(rng, size). A
+statistic may turn each sample into several values (e.g. one indicator
+per dice face); the target must then be met by every one of them.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+
+from common.estimation import Estimate
+from common.streaming import RunningStats
+
+# Samples in the first batch, and the fewest drawn by any later batch
+DEFAULT_BATCH_SIZE = 1 << 12
+
+# Upper limit on the samples drawn when the target is not reached
+DEFAULT_MAX_SAMPLES = 1 << 28
+
+@dataclass
+class AdaptiveEstimate(Estimate):
+    """Estimate from a simulation that stopped at a requested precision"""
+    half_width: object
+    confidence: float
+    converged: bool
+    n_batches: int
+
+    def confidence_interval(self, level=None):
+        """Confidence interval (low, high), by default at the level the run targeted"""
+        return super().confidence_interval(self.confidence if level is None else level)
+
+def _targets(mean, half_width, relative_error):
+    """Largest acceptable half-width for each estimated quantity"""
+    if half_width is not None:
+        return np.full_like(mean, half_width)
+    return relative_error * np.abs(mean)
+
+def run_until_precise(sampler, half_width=None, relative_error=None, statistic=None,
+                      confidence=0.95, batch_size=DEFAULT_BATCH_SIZE,
+                      max_samples=DEFAULT_MAX_SAMPLES, seed=None):
+    """Estimate E[statistic(X)] with just enough samples for the target precision
+
+    Args:
+        sampler: Function sampler(rng, size) returning size samples
+        half_width: Target half-width of the confidence interval
+        relative_error: Target half-width relative to |mean| (give one
+            of half_width and relative_error)
+        statistic: Maps a batch of samples to one value, or one row of
+            values, per sample (default: the samples themselves)
+        confidence: Confidence level of the interval
+        batch_size: Size of the first batch and smallest later batch
+        max_samples: Stop here even if the target is not reached
+        seed: Seed, SeedSequence or Generator for the random numbers
+
+    The half-width uses the normal approximation with the sample standard
+    deviation, so a batch in which a rare event never occurs looks exact;
+    use relative_error for probabilities close to 0 or 1.
+    """
+    if (half_width is None) == (relative_error is None):
+        raise ValueError("Give exactly one of half_width and relative_error")
+    if not (half_width if half_width is not None else relative_error) > 0:
+        raise ValueError("The target precision must be positive")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if batch_size < 2 or max_samples < batch_size:
+        raise ValueError("Need batch_size >= 2 and max_samples >= batch_size")
+    statistic = statistic or (lambda samples: samples)
+    rng = np.random.default_rng(seed)
+    z = stats.norm.ppf(0.5 + confidence / 2)
+
+    running = None
+    size, n_batches = batch_size, 0
+    while True:
+        values = np.asarray(statistic(sampler(rng, size)), dtype=float)
+        if running is None:
+            shape = values.shape[1:]
+            running = [RunningStats() for _ in range(int(np.prod(shape)))]
+        values = values.reshape(size, -1)
+        for column, column_stats in zip(values.T, running):
+            column_stats.update(column)
+        n_batches += 1
+        n = running[0].count
+        mean = np.array([column_stats.mean for column_stats in running])
+        std_error = np.array([column_stats.std(ddof=1) for column_stats in running]) / np.sqrt(n)
+        targets = _targets(mean, half_width, relative_error)
+        converged = bool(np.all(z * std_error <= targets))
+        if converged or n >= max_samples:
+            break
+        # Samples needed if the standard error keeps shrinking like 1/sqrt(n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            needed = np.nanmax(n * (z * std_error / targets) ** 2) - n
+        size = int(min(max(np.nan_to_num(needed, posinf=n), batch_size), n, max_samples - n))
+
+    return AdaptiveEstimate(mean.reshape(shape)[()], std_error.reshape(shape)[()], n, "adaptive",
+                            (z * std_error).reshape(shape)[()], confidence, converged, n_batches)
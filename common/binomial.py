@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Binomial Distribution for Large n
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+B(n, p) puts all but a negligible fraction of its mass within a few
+standard deviations of n*p, so for large n only that window is
+evaluated: its bounds come from the quantile functions, and the PMF is
+computed in log space with Loader's saddle-point formula, which stays
+accurate to ~1e-13 where log(n choose k) is ~1e9. The cost therefore
+depends on the width of the window (about 16 standard deviations), not
+on n. Tail probabilities use survival functions instead of 1 - cdf,
+which rounds to 0 for rare events, and are also available as logarithms
+where the probability itself underflows.
+"""
+
+import numpy as np
+from scipy import stats
+from scipy.special import gammaln, logsumexp
+
+# Probability mass left out of the evaluated window on each side
+WINDOW_TAIL = 1e-15
+
+# Supports with at most this many points are evaluated in full
+FULL_SUPPORT_MAX = 10_000
+
+# Below this log-probability scipy's logsf is about to underflow to -inf
+LOG_SF_FLOOR = -700.0
+
+# PMF terms added at a time when summing a far tail
+TAIL_BLOCK = 4096
+
+# Terms of the power series of (1 + d) log(1 + d) - d used for |d| < 0.1
+_PHI_SERIES_TERMS = 18
+
+_LOG_SQRT_2PI = 0.5 * np.log(2 * np.pi)
+
+def _check(n, p):
+    if n < 0 or int(n) != n:
+        raise ValueError("n must be a non-negative integer")
+    if not 0 <= p <= 1:
+        raise ValueError("p must be between 0 and 1")
+
+def _stirling_error(m):
+    """log(m!) - log(sqrt(2 pi m) (m / e)^m) for m >= 1"""
+    m = np.asarray(m, dtype=float)
+    small = m <= 15
+    # Exact through gammaln for small m, asymptotic series otherwise
+    exact = gammaln(m + 1) - (m + 0.5) * np.log(m) + m - _LOG_SQRT_2PI
+    mm = m * m
+    series = (1/12 - (1/360 - (1/1260 - (1/1680 - 1/1188 / mm) / mm) / mm) / mm) / m
+    return np.where(small, exact, series)
+
+def _phi(d):
+    """(1 + d) log(1 + d) - d without cancellation for small d"""
+    direct = (1 + d) * np.log1p(d) - d
+    series = np.zeros_like(d)
+    power = d * d
+    for j in range(2, _PHI_SERIES_TERMS + 2):
+        series += power / (j * (j - 1)) if j % 2 == 0 else -power / (j * (j - 1))
+        power = power * d
+    return np.where(np.abs(d) < 0.1, series, direct)
+
+def binomial_log_pmf(k, n, p):
+    """log P(X = k) for X ~ B(n, p) (Loader's saddle-point formula)"""
+    _check(n, p)
+    if p in (0, 1) or n == 0:
+        return stats.binom.logpmf(k, n, p)
+    k = np.asarray(k, dtype=float)
+    q = 1 - p
+    inner = (k > 0) & (k < n)
+    # Other points get a placeholder that keeps the formula finite
+    ki = np.where(inner, k, n / 2)
+    log_pmf = (_stirling_error(n) - _stirling_error(ki) - _stirling_error(n - ki)
+               - n * p * _phi(ki / (n * p) - 1) - n * q * _phi((n - ki) / (n * q) - 1)
+               + 0.5 * np.log(n / (ki * (n - ki))) - _LOG_SQRT_2PI)
+    log_pmf = np.where(k == 0, n * np.log1p(-p), log_pmf)
+    log_pmf = np.where(k == n, n * np.log(p), log_pmf)
+    log_pmf = np.where((k < 0) | (k > n) | (k != np.floor(k)), -np.inf, log_pmf)
+    return log_pmf if log_pmf.ndim else float(log_pmf)
+
+def binomial_window(n, p, tail=WINDOW_TAIL):
+    """Smallest and largest number of successes worth evaluating
+
+    Returns (low, high) with P(X < low) and P(X > high) both at most tail.
+    Small supports (and tail=0) give the full range (0, n).
+    """
+    _check(n, p)
+    if n + 1 <= FULL_SUPPORT_MAX or tail <= 0 or p in (0, 1):
+        return 0, int(n)
+    low = int(stats.binom.ppf(tail, n, p))
+    high = int(stats.binom.isf(tail, n, p))
+    return max(low, 0), min(high, int(n))
+
+def binomial_pmf_window(n, p, tail=WINDOW_TAIL, log=False, max_points=None):
+    """Successes and their PMF (or log PMF) over binomial_window(n, p, tail)
+
+    With max_points, wider windows are evaluated only at that many evenly
+    spaced success counts (enough for plots), so the cost is bounded for
+    any n.
+    """
+    low, high = binomial_window(n, p, tail)
+    if max_points is not None and high - low + 1 > max_points:
+        x = np.unique(np.linspace(low, high, max_points).round().astype(np.int64))
+    else:
+        x = np.arange(low, high + 1)
+    log_pmf = binomial_log_pmf(x, n, p)
+    return x, (log_pmf if log else np.exp(log_pmf))
+
+def _far_tail_log_sf(k, n, p):
+    """log P(X > k) by adding log PMF terms, for k far above the mean"""
+    log_total = -np.inf
+    start = k + 1
+    while start <= n:
+        terms = binomial_log_pmf(np.arange(start, min(start + TAIL_BLOCK, n + 1)), n, p)
+        log_total = np.logaddexp(log_total, logsumexp(terms))
+        if len(terms) < 2:
+            break
+        # Terms shrink at least geometrically, so the rest is at most
+        # last * ratio / (1 - ratio)
+        log_ratio = terms[-1] - terms[-2]
+        if log_ratio >= 0:
+            raise ValueError("Far-tail summation requires k above the mean")
+        log_rest = terms[-1] + log_ratio - np.log(-np.expm1(log_ratio))
+        if log_rest < log_total + np.log(np.finfo(float).eps):
+            break
+        start += TAIL_BLOCK
+    return float(log_total)
+
+def binomial_log_sf(k, n, p):
+    """log P(X > k), finite even where P(X > k) underflows to 0"""
+    _check(n, p)
+    log_sf = np.asarray(stats.binom.logsf(k, n, p), dtype=float)
+    far = (log_sf < LOG_SF_FLOOR) & (np.asarray(k) < n)
+    if np.any(far):
+        log_sf = log_sf.copy()
+        for index in zip(*np.nonzero(far)) if log_sf.ndim else [()]:
+            log_sf[index] = _far_tail_log_sf(int(np.asarray(k)[index]), n, p)
+    return log_sf if log_sf.ndim else float(log_sf)
+
+def binomial_log_cdf(k, n, p):
+    """log P(X <= k), finite even where P(X <= k) underflows to 0"""
+    # X <= k exactly when the n - X failures exceed n - k - 1
+    return binomial_log_sf(n - np.asarray(k) - 1, n, 1 - p)
+
+def binomial_sf(k, n, p):
+    """P(X > k) without the cancellation of 1 - cdf"""
+    _check(n, p)
+    return stats.binom.sf(k, n, p)
+
+def binomial_cdf(k, n, p):
+    """P(X <= k)"""
+    _check(n, p)
+    return stats.binom.cdf(k, n, p)
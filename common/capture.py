@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File Descriptor Output Capture
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Captures stdout and stderr at the file descriptor level, so output from
+print(), C extensions and child processes is collected the same way.
+Captured bytes go into a bounded ring buffer that keeps only the most
+recent output, and streams that are not needed can be sent to os.devnull.
+"""
+
+import io
+import os
+import sys
+import threading
+
+# File descriptors captured for each stream
+STREAM_FDS = {"stdout": 1, "stderr": 2}
+
+# Default number of bytes kept per stream
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+# Size of each read from the capture pipe
+READ_CHUNK_SIZE = 64 * 1024
+
+class RingBuffer:
+    """Byte buffer that keeps only the last max_bytes written to it"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._data = bytearray()
+
+    def write(self, data):
+        """Append data, dropping the oldest bytes beyond max_bytes"""
+        self.total_bytes += len(data)
+        if len(data) >= self.max_bytes:
+            self._data[:] = data[-self.max_bytes:]
+            return
+        self._data += data
+        overflow = len(self._data) - self.max_bytes
+        if overflow > 0:
+            del self._data[:overflow]
+
+    @property
+    def dropped_bytes(self):
+        """Number of bytes that no longer fit in the buffer"""
+        return self.total_bytes - len(self._data)
+
+    def getvalue(self):
+        """Return the buffered bytes decoded as text"""
+        return self._data.decode("utf-8", errors="replace")
+
+def _flush_c_streams():
+    """Flush C stdio buffers so extension output reaches the captured descriptors"""
+    try:
+        import ctypes
+        ctypes.CDLL(None).fflush(None)
+    except (OSError, AttributeError, TypeError):
+        pass  # No C runtime access (e.g. Windows); Python streams are still flushed
+
+class FDOutputCapture:
+    """Capture stdout and stderr at the file descriptor level
+
+    Args:
+        stdout: Capture standard output
+        stderr: Capture standard error
+        max_bytes: Bytes kept per stream; older output is dropped
+        discard: Stream names ("stdout", "stderr") sent to os.devnull instead
+
+    Python-level output is block-buffered, as with a piped stdout; flush
+    sys.stdout before mixing it with raw descriptor writes.
+    """
+
+    def __init__(self, stdout=True, stderr=True, max_bytes=DEFAULT_MAX_BYTES, discard=()):
+        unknown = set(discard) - set(STREAM_FDS)
+        if unknown:
+            raise ValueError(f"Unknown stream(s) to discard: {', '.join(sorted(unknown))}")
+        self.streams = [name for name, enabled in (("stdout", stdout), ("stderr", stderr)) if enabled]
+        self.discard = set(discard)
+        self.buffers = {name: RingBuffer(max_bytes) for name in self.streams}
+        self._saved_fds = {}
+        self._saved_streams = {}
+        self._readers = []
+
+    def __enter__(self):
+        self._flush_all()
+        for name in self.streams:
+            fd = STREAM_FDS[name]
+            self._saved_fds[name] = os.dup(fd)
+            if name in self.discard:
+                target = os.open(os.devnull, os.O_WRONLY)
+            else:
+                read_fd, target = os.pipe()
+                reader = threading.Thread(target=self._drain, args=(read_fd, self.buffers[name]),
+                                          daemon=True)
+                reader.start()
+                self._readers.append(reader)
+            os.dup2(target, fd)
+            os.close(target)
+
+            # sys.stdout may have been replaced (e.g. by pytest), so route it to the descriptor
+            self._saved_streams[name] = getattr(sys, name)
+            raw = io.FileIO(fd, "w", closefd=False)
+            setattr(sys, name, io.TextIOWrapper(io.BufferedWriter(raw, READ_CHUNK_SIZE),
+                                                encoding="utf-8", errors="replace"))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._flush_all()
+        for name in self.streams:
+            setattr(sys, name, self._saved_streams.pop(name))
+            # Restoring the descriptor closes the pipe's write end, ending the reader
+            os.dup2(self._saved_fds[name], STREAM_FDS[name])
+            os.close(self._saved_fds.pop(name))
+        for reader in self._readers:
+            reader.join()
+        self._readers = []
+
+    def _flush_all(self):
+        for name in self.streams:
+            try:
+                getattr(sys, name).flush()
+            except (AttributeError, ValueError, OSError):
+                pass
+        _flush_c_streams()
+
+    @staticmethod
+    def _drain(read_fd, buffer):
+        """Reader thread: move pipe data into the ring buffer until EOF"""
+        try:
+            while True:
+                data = os.read(read_fd, READ_CHUNK_SIZE)
+                if not data:
+                    break
+                buffer.write(data)
+        finally:
+            os.close(read_fd)
+
+    def get_stdout(self):
+        """Get captured stdout"""
+        return self.buffers["stdout"].getvalue() if "stdout" in self.buffers else ""
+
+    def get_stderr(self):
+        """Get captured stderr"""
+        return self.buffers["stderr"].getvalue() if "stderr" in self.buffers else ""
+
+    def get_combined(self):
+        """Get combined stdout and stderr"""
+        return self.get_stdout() + self.get_stderr()
+
+    @property
+    def truncated(self):
+        """True if any stream produced more output than was kept"""
+        return any(buffer.dropped_bytes for buffer in self.buffers.values())
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Discrete Probability Distributions
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+A finite discrete distribution stored as two NumPy arrays (outcomes and
+their probabilities). Events are boolean masks over the outcomes, so union,
+intersection and complement are the array operators |, & and ~, and
+probabilities are a single masked sum. Sums of independent integer-valued
+variables are computed by convolution over the integer lattice (FFT-based
+for large lattices), which keeps queries on multi-dice sample spaces such
+as 20d6 fast.
+"""
+
+import numpy as np
+from scipy.signal import fftconvolve
+
+# Convolutions with len(a) * len(b) above this use the FFT. Direct convolution
+# only adds non-negative terms, so tiny tail probabilities keep full relative
+# precision; the FFT is faster but accurate only to ~1e-16 absolute.
+FFT_MIN_WORK = 1_000_000
+
+def _convolve(a, b):
+    """Convolve two probability vectors, using the FFT for large inputs"""
+    if len(a) * len(b) < FFT_MIN_WORK:
+        return np.convolve(a, b)
+    return fftconvolve(a, b)
+
+def _support_convolve(a, b):
+    """Support (possible outcomes) of the sum of two supports"""
+    # Counts of pairs are integers, so rounding removes the FFT noise
+    return np.rint(_convolve(a.astype(float), b.astype(float))) > 0
+
+class DiscreteDistribution:
+    """Finite discrete distribution backed by NumPy arrays
+
+    Args:
+        values: Possible outcomes (duplicates are merged)
+        probabilities: Probability or weight of each outcome; omitted means
+            equally likely. Weights are normalized to sum to 1.
+    """
+
+    def __init__(self, values, probabilities=None):
+        values = np.asarray(values)
+        if values.ndim != 1 or len(values) == 0:
+            raise ValueError("values must be a non-empty 1-D sequence")
+        if probabilities is None:
+            probabilities = np.ones(len(values))
+        probabilities = np.asarray(probabilities, dtype=float)
+        if probabilities.shape != values.shape:
+            raise ValueError("values and probabilities must have the same length")
+        if np.any(probabilities < 0) or not np.all(np.isfinite(probabilities)):
+            raise ValueError("probabilities must be finite and non-negative")
+        total = probabilities.sum()
+        if total <= 0:
+            raise ValueError("probabilities must not all be zero")
+
+        # Merge duplicate outcomes and keep the outcomes sorted
+        unique_values, inverse = np.unique(values, return_inverse=True)
+        if len(unique_values) != len(values):
+            probabilities = np.bincount(inverse, weights=probabilities)
+        else:
+            probabilities = probabilities[np.argsort(values, kind="stable")]
+
+        self._values = unique_values
+        self._probabilities = probabilities / total
+        self._values.flags.writeable = False
+        self._probabilities.flags.writeable = False
+        self._sampler = None
+
+    @classmethod
+    def die(cls, sides=6, n_dice=1):
+        """Sum of n_dice fair dice with the given number of sides"""
+        single = cls(np.arange(1, sides + 1))
+        return single if n_dice == 1 else single.sum_iid(n_dice)
+
+    @property
+    def values(self):
+        """Sorted outcomes"""
+        return self._values
+
+    @property
+    def probabilities(self):
+        """Probability of each outcome in values"""
+        return self._probabilities
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"DiscreteDistribution({len(self)} outcomes in [{self._values[0]}, {self._values[-1]}])"
+
+    # Events
+
+    def event(self, outcomes):
+        """Boolean mask over values describing an event
+
+        outcomes may be a vectorized predicate (e.g. lambda x: x % 2 == 0),
+        a collection of outcomes, or an existing boolean mask.
+        """
+        if callable(outcomes):
+            mask = np.asarray(outcomes(self._values))
+            if mask.shape != self._values.shape:
+                raise ValueError("Event predicates must be vectorized: "
+                                 "they receive the array of outcomes and return a mask")
+            return mask.astype(bool)
+        outcomes = np.asarray(outcomes)
+        if outcomes.dtype == bool:
+            if outcomes.shape != self._values.shape:
+                raise ValueError(f"Event mask has {outcomes.size} entries, expected {len(self)}")
+            return outcomes
+        return np.isin(self._values, outcomes)
+
+    def outcomes(self, event):
+        """Outcomes that belong to an event"""
+        return self._values[self.event(event)]
+
+    def prob(self, event):
+        """Probability of an event"""
+        return float(self._probabilities[self.event(event)].sum())
+
+    def conditional_prob(self, event, given):
+        """Conditional probability P(event | given)"""
+        given = self.event(given)
+        prob_given = self._probabilities[given].sum()
+        if prob_given == 0:
+            raise ValueError("Cannot condition on an event with probability 0")
+        return float(self._probabilities[given & self.event(event)].sum() / prob_given)
+
+    def condition(self, given):
+        """Distribution conditioned on an event"""
+        given = self.event(given)
+        if self._probabilities[given].sum() == 0:
+            raise ValueError("Cannot condition on an event with probability 0")
+        return DiscreteDistribution(self._values[given], self._probabilities[given])
+
+    # Summary statistics
+
+    def pmf(self, x):
+        """Probability of each outcome in x (0 for impossible outcomes)"""
+        x = np.asarray(x)
+        index = np.clip(np.searchsorted(self._values, x), 0, len(self) - 1)
+        return np.where(self._values[index] == x, self._probabilities[index], 0.0)
+
+    def cdf(self, x):
+        """P(X <= x)"""
+        cumulative = np.concatenate(([0.0], np.cumsum(self._probabilities)))
+        return np.minimum(cumulative[np.searchsorted(self._values, x, side="right")], 1.0)
+
+    @property
+    def mean(self):
+        """Expected value"""
+        return float(np.dot(self._values, self._probabilities))
+
+    @property
+    def variance(self):
+        """Variance"""
+        return float(np.dot((self._values - self.mean) ** 2, self._probabilities))
+
+    @property
+    def std(self):
+        """Standard deviation"""
+        return float(np.sqrt(self.variance))
+
+    def sample(self, size=None, rng=None):
+        """Draw samples with an alias table that is built on first use"""
+        if self._sampler is None:
+            from common.sampling import AliasSampler
+            self._sampler = AliasSampler(self._values, self._probabilities)
+        return self._sampler.sample(size, rng)
+
+    # Sums of independent variables
+
+    @property
+    def is_integer(self):
+        """True if every outcome is an integer"""
+        return bool(np.all(self._values == np.round(self._values)))
+
+    def _lattice(self):
+        """Dense probability vector over the integers from min to max value"""
+        offset = int(round(self._values[0]))
+        dense = np.zeros(int(round(self._values[-1])) - offset + 1)
+        dense[np.round(self._values).astype(np.int64) - offset] = self._probabilities
+        return offset, dense
+
+    @classmethod
+    def _from_lattice(cls, offset, dense, support):
+        """Build a distribution from a dense vector, keeping only the support"""
+        dense = np.clip(dense, 0.0, None)  # Remove FFT round-off below zero
+        outcomes = np.flatnonzero(support)
+        return cls(outcomes + offset, dense[outcomes])
+
+    def __add__(self, other):
+        """Distribution of X + Y for independent X and Y (or X + constant)"""
+        if not isinstance(other, DiscreteDistribution):
+            return DiscreteDistribution(self._values + other, self._probabilities)
+
+        if self.is_integer and other.is_integer:
+            offset_a, dense_a = self._lattice()
+            offset_b, dense_b = other._lattice()
+            support = _support_convolve(dense_a > 0, dense_b > 0)
+            return self._from_lattice(offset_a + offset_b, _convolve(dense_a, dense_b), support)
+
+        # Non-integer outcomes: combine all pairs and merge equal sums
+        sums = np.add.outer(self._values, other._values).ravel()
+        probabilities = np.multiply.outer(self._probabilities, other._probabilities).ravel()
+        return DiscreteDistribution(sums, probabilities)
+
+    __radd__ = __add__
+
+    def sum_iid(self, n):
+        """Distribution of the sum of n independent copies (e.g. 20d6)"""
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        if n == 1:
+            return self
+        if not self.is_integer:
+            result = self
+            for _ in range(n - 1):
+                result = result + self
+            return result
+
+        # Repeated squaring: O(log n) convolutions instead of n - 1
+        offset, base = self._lattice()
+        base_support = base > 0
+        summed, support, power = None, None, n
+        while power:
+            if power & 1:
+                if summed is None:
+                    summed, support = base, base_support
+                else:
+                    summed = np.clip(_convolve(summed, base), 0.0, None)
+                    support = _support_convolve(support, base_support)
+            power >>= 1
+            if power:
+                base = np.clip(_convolve(base, base), 0.0, None)
+                base_support = _support_convolve(base_support, base_support)
+        return self._from_lattice(n * offset, summed, support)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared Display Settings
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Headless mode runs the slides without graph windows and without opening
+the HTML slides in a browser, so batch runs on servers never block.
+"""
+
+import os
+import webbrowser
+from pathlib import Path
+import matplotlib
+
+# Environment variable used to enable headless mode
+HEADLESS_ENV = "PROB_HEADLESS"
+
+def is_headless():
+    """Check whether headless mode is enabled"""
+    return os.environ.get(HEADLESS_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+def enable_headless():
+    """Enable headless mode for this process and its child processes"""
+    os.environ[HEADLESS_ENV] = "1"
+    matplotlib.use('Agg', force=True)
+
+def configure_backend(module_file):
+    """Use the non-interactive backend in headless mode or under pytest"""
+    if is_headless() or 'pytest' in str(Path(module_file).parent):
+        matplotlib.use('Agg', force=True)
+
+def is_interactive():
+    """Check whether figures can be shown in windows"""
+    return not is_headless() and matplotlib.get_backend().lower() != 'agg'
+
+def show_figure():
+    """Show the current figures unless running headless"""
+    if is_interactive():
+        import matplotlib.pyplot as plt
+        plt.show()
+
+def open_in_browser(slide_path):
+    """Open an HTML slide in the browser unless running headless
+
+    Returns True if the browser was asked to open the slide.
+    """
+    if is_headless():
+        print(f"Headless mode - slide not opened in browser: {slide_path}")
+        return False
+    webbrowser.open(f"file://{Path(slide_path).absolute()}")
+    return True
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Variance-Reduced Monte Carlo Estimation
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Estimates E[f(X)], and probabilities such as P(2 < X <= 8), for any
+distribution with an inverse CDF (a frozen scipy.stats distribution).
+Samples are X = F^-1(U) with U uniform, which allows:
+
+- plain: independent uniforms (the usual np.mean(mask))
+- antithetic: pairs U and 1 - U, whose errors partly cancel
+- stratified: one or more uniforms in each of equal slices of [0, 1)
+- control_variate: subtracts the known-mean error of U itself
+- sobol, halton: randomized quasi-Monte Carlo, several independently
+  scrambled low-discrepancy point sets (see common.qmc)
+
+Every estimator returns an Estimate with a standard error. f may return
+one value per sample or a row of values, so several probabilities are
+estimated from the same samples at once.
+"""
+
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+from scipy import stats
+
+from common.sampling import random_source, uniforms
+from common.qmc import next_points, qmc_engine
+
+# Independently scrambled point sets behind a randomized-QMC error estimate
+DEFAULT_REPLICATES = 16
+
+@dataclass
+class Estimate:
+    """Monte Carlo estimate with its standard error (arrays for several quantities)"""
+    value: object
+    std_error: object
+    n_samples: int
+    method: str
+
+    def confidence_interval(self, level=0.95):
+        """Normal-approximation confidence interval (low, high)"""
+        z = stats.norm.ppf(0.5 + level / 2)
+        return self.value - z * self.std_error, self.value + z * self.std_error
+
+def _evaluate(f, dist, u):
+    return np.asarray(f(dist.ppf(u)), dtype=float)
+
+def plain_estimate(f, dist, n, rng=None):
+    """Sample mean of f(X) over n independent samples"""
+    values = _evaluate(f, dist, uniforms(rng, n))
+    return Estimate(values.mean(axis=0), values.std(axis=0, ddof=1) / np.sqrt(n), n, "plain")
+
+def antithetic_estimate(f, dist, n, rng=None):
+    """Mean over n // 2 antithetic pairs F^-1(U), F^-1(1 - U)"""
+    pairs = n // 2
+    if pairs < 2:
+        raise ValueError("Antithetic estimation needs at least 4 samples")
+    u = uniforms(rng, pairs)
+    pair_means = (_evaluate(f, dist, u) + _evaluate(f, dist, 1 - u)) / 2
+    return Estimate(pair_means.mean(axis=0), pair_means.std(axis=0, ddof=1) / np.sqrt(pairs),
+                    2 * pairs, "antithetic")
+
+def stratified_estimate(f, dist, n, strata=None, rng=None):
+    """Stratified mean: [0, 1) is cut into equal strata with n // strata uniforms each
+
+    The default uses two samples per stratum, the fewest that still give
+    a standard error.
+    """
+    strata = n // 2 if strata is None else strata
+    per_stratum = n // strata if strata else 0
+    if per_stratum < 2:
+        raise ValueError("Stratified estimation needs at least 2 samples per stratum")
+    u = (np.arange(strata)[:, None] + uniforms(rng, (strata, per_stratum))) / strata
+    values = _evaluate(f, dist, u.ravel())
+    shape = values.shape[1:]
+    values = values.reshape(strata, per_stratum, -1)
+    value = values.mean(axis=1).mean(axis=0)
+    std_error = np.sqrt(values.var(axis=1, ddof=1).sum(axis=0) / per_stratum) / strata
+    return Estimate(value.reshape(shape)[()], std_error.reshape(shape)[()],
+                    strata * per_stratum, "stratified")
+
+def control_variate_estimate(f, dist, n, rng=None):
+    """Sample mean corrected by the uniforms U, whose mean 1/2 is known
+
+    The coefficient is fitted on the same samples; f(X) is a function of
+    U, so the correction removes the part of the error that is linear in U.
+    """
+    u = uniforms(rng, n)
+    values = _evaluate(f, dist, u)
+    centered = u - 0.5
+    flat = values.reshape(n, -1)
+    slope = (centered @ (flat - flat.mean(axis=0))) / (centered @ centered)
+    adjusted = flat - np.outer(centered, slope)
+    value = adjusted.mean(axis=0)
+    std_error = adjusted.std(axis=0, ddof=2) / np.sqrt(n)
+    shape = values.shape[1:]
+    return Estimate(value.reshape(shape)[()], std_error.reshape(shape)[()], n, "control_variate")
+
+def rqmc_estimate(f, dist, n, mode="sobol", replicates=DEFAULT_REPLICATES, rng=None):
+    """Randomized QMC: mean over replicates of n // replicates scrambled points each
+
+    The replicate means are independent, so their spread gives the
+    standard error even though the points within a replicate are not.
+    """
+    per_replicate = n // replicates if replicates >= 2 else 0
+    if per_replicate < 1:
+        raise ValueError("Randomized QMC needs at least 2 replicates of 1 or more points")
+    # One source for all replicates, so a seed does not repeat the same scrambling
+    rng = random_source(rng)
+    replicate_means = np.array([
+        _evaluate(f, dist, next_points(qmc_engine(1, mode, rng), per_replicate)[:, 0]).mean(axis=0)
+        for _ in range(replicates)])
+    return Estimate(replicate_means.mean(axis=0),
+                    replicate_means.std(axis=0, ddof=1) / np.sqrt(replicates),
+                    replicates * per_replicate, mode)
+
+ESTIMATORS = {
+    "plain": plain_estimate,
+    "antithetic": antithetic_estimate,
+    "stratified": stratified_estimate,
+    "control_variate": control_variate_estimate,
+    "sobol": partial(rqmc_estimate, mode="sobol"),
+    "halton": partial(rqmc_estimate, mode="halton"),
+}
+
+def estimate_expectation(f, dist, n, method="stratified", rng=None):
+    """Estimate E[f(X)] for X ~ dist with one of ESTIMATORS"""
+    if method not in ESTIMATORS:
+        raise ValueError(f"Unknown method {method!r}; choose from {', '.join(ESTIMATORS)}")
+    return ESTIMATORS[method](f, dist, n, rng=rng)
+
+def estimate_probabilities(dist, intervals, n, method="stratified", rng=None):
+    """Estimate P(low < X <= high) for each (low, high) from the same samples
+
+    Use -np.inf or np.inf for one-sided intervals.
+    """
+    bounds = np.asarray(intervals, dtype=float).reshape(-1, 2)
+
+    def indicators(x):
+        return (x[:, None] > bounds[:, 0]) & (x[:, None] <= bounds[:, 1])
+
+    return estimate_expectation(indicators, dist, n, method, rng)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bitset Events over Finite Sample Spaces
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+A SampleSpace indexes its outcomes 0..n-1, and an Event stores which
+outcomes it contains as a packed bitset of 64-bit words. Complement,
+union and intersection are word-parallel bitwise operations (64 outcomes
+per instruction) and the probability of an event is a popcount, or a
+weighted sum for non-uniform spaces. This keeps probability-rule checks
+interactive on sample spaces with millions of outcomes.
+"""
+
+import numpy as np
+
+WORD_BITS = 64
+
+# Words unpacked at a time when summing weights; keeps the work in cache
+WEIGHT_CHUNK_WORDS = 1024
+
+def _popcount(words):
+    """Number of set bits in an array of uint64 words"""
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum(dtype=np.int64))
+    # NumPy < 2.0: count through a byte lookup table
+    table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    return int(table[words.view(np.uint8)].sum(dtype=np.int64))
+
+class SampleSpace:
+    """Finite sample space with indexed outcomes
+
+    Args:
+        outcomes: Outcomes as a 1-D array, or a 2-D array with one row per
+            outcome (see product())
+        weights: Probability or weight of each outcome; omitted means
+            equally likely outcomes
+    """
+
+    def __init__(self, outcomes, weights=None):
+        self.outcomes = np.asarray(outcomes)
+        if self.outcomes.ndim not in (1, 2) or len(self.outcomes) == 0:
+            raise ValueError("outcomes must be a non-empty 1-D array or a 2-D array of rows")
+        self.size = len(self.outcomes)
+
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)
+            if weights.shape != (self.size,):
+                raise ValueError("weights must have one entry per outcome")
+            if np.any(weights < 0) or weights.sum() <= 0:
+                raise ValueError("weights must be non-negative and not all zero")
+            weights = weights / weights.sum()
+        self.weights = weights
+
+        self.n_words = -(-self.size // WORD_BITS)
+        self._full_words = self._pack(np.ones(self.size, dtype=bool))
+
+    @classmethod
+    def from_distribution(cls, distribution):
+        """Sample space of a DiscreteDistribution, weighted by its probabilities"""
+        return cls(distribution.values, distribution.probabilities)
+
+    @classmethod
+    def product(cls, *spaces):
+        """Product space of independent experiments (e.g. several dice)
+
+        Outcomes are rows with one column per space; weights multiply.
+        """
+        grids = np.meshgrid(*[np.arange(space.size) for space in spaces], indexing="ij")
+        indices = [grid.ravel() for grid in grids]
+        outcomes = np.column_stack([space.outcomes[index] for space, index in zip(spaces, indices)])
+
+        weights = None
+        if any(space.weights is not None for space in spaces):
+            weights = np.ones(len(outcomes))
+            for space, index in zip(spaces, indices):
+                if space.weights is not None:
+                    weights *= space.weights[index]
+        return cls(outcomes, weights)
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        kind = "uniform" if self.weights is None else "weighted"
+        return f"SampleSpace({self.size} {kind} outcomes)"
+
+    def _pack(self, mask):
+        """Pack a boolean mask into uint64 words (bit i = outcome i)"""
+        padded = np.zeros(self.n_words * WORD_BITS, dtype=bool)
+        padded[:self.size] = mask
+        return np.packbits(padded, bitorder="little").view(np.uint64)
+
+    def _unpack(self, words):
+        """Unpack uint64 words into a boolean mask"""
+        return np.unpackbits(words.view(np.uint8), count=self.size, bitorder="little").astype(bool)
+
+    def _weight_sum(self, words):
+        """Total weight of the outcomes whose bits are set"""
+        total = 0.0
+        for start in range(0, self.n_words, WEIGHT_CHUNK_WORDS):
+            chunk = words[start:start + WEIGHT_CHUNK_WORDS]
+            first = start * WORD_BITS
+            bits = np.unpackbits(chunk.view(np.uint8), bitorder="little")[:self.size - first]
+            total += np.dot(self.weights[first:first + len(bits)], bits.astype(np.float64))
+        return float(total)
+
+    def event(self, outcomes):
+        """Create an event
+
+        outcomes may be a vectorized predicate (e.g. lambda x: x % 2 == 0,
+        or lambda rows: rows[:, 0] == 6 for product spaces), a collection
+        of outcomes of a 1-D space, or a boolean mask.
+        """
+        if callable(outcomes):
+            mask = np.asarray(outcomes(self.outcomes))
+            if mask.shape != (self.size,):
+                raise ValueError("Event predicates must be vectorized: "
+                                 "they receive the array of outcomes and return a mask")
+        else:
+            mask = np.asarray(outcomes)
+            if mask.dtype != bool:
+                if self.outcomes.ndim != 1:
+                    raise ValueError("Use a predicate or a mask for events of a product space")
+                mask = np.isin(self.outcomes, mask)
+            elif mask.shape != (self.size,):
+                raise ValueError(f"Event mask has {mask.size} entries, expected {self.size}")
+        return Event(self, self._pack(mask.astype(bool)))
+
+    def empty(self):
+        """The impossible event ∅"""
+        return Event(self, np.zeros(self.n_words, dtype=np.uint64))
+
+    def full(self):
+        """The certain event Ω"""
+        return Event(self, self._full_words.copy())
+
+class Event:
+    """Set of outcomes of a SampleSpace stored as a packed bitset
+
+    Use SampleSpace.event() to create events. Operators: | (union),
+    & (intersection), ~ (complement), - (difference), ^ (symmetric difference).
+    """
+
+    __slots__ = ("space", "words")
+
+    def __init__(self, space, words):
+        self.space = space
+        self.words = words
+
+    def _check(self, other):
+        if not isinstance(other, Event):
+            raise TypeError(f"Expected an Event, got {type(other).__name__}")
+        if other.space is not self.space:
+            raise ValueError("Events belong to different sample spaces")
+
+    def __or__(self, other):
+        self._check(other)
+        return Event(self.space, self.words | other.words)
+
+    def __and__(self, other):
+        self._check(other)
+        return Event(self.space, self.words & other.words)
+
+    def __xor__(self, other):
+        self._check(other)
+        return Event(self.space, self.words ^ other.words)
+
+    def __sub__(self, other):
+        self._check(other)
+        return Event(self.space, self.words & ~other.words)
+
+    def __invert__(self):
+        # Padding bits past the last outcome must stay clear
+        return Event(self.space, ~self.words & self.space._full_words)
+
+    def __eq__(self, other):
+        if not isinstance(other, Event):
+            return NotImplemented
+        return other.space is self.space and bool(np.array_equal(self.words, other.words))
+
+    __hash__ = None
+
+    def __len__(self):
+        """Number of outcomes in the event (popcount)"""
+        return _popcount(self.words)
+
+    def __repr__(self):
+        return f"Event({len(self)} of {self.space.size} outcomes)"
+
+    def mask(self):
+        """Boolean mask over the outcomes of the space"""
+        return self.space._unpack(self.words)
+
+    def outcomes(self):
+        """Outcomes that belong to the event"""
+        return self.space.outcomes[self.mask()]
+
+    def prob(self):
+        """Probability of the event"""
+        if self.space.weights is None:
+            return len(self) / self.space.size
+        return self.space._weight_sum(self.words)
+
+    def given(self, condition):
+        """Conditional probability P(self | condition)"""
+        self._check(condition)
+        prob_condition = condition.prob()
+        if prob_condition == 0:
+            raise ValueError("Cannot condition on an event with probability 0")
+        return (self & condition).prob() / prob_condition
+
+    def isdisjoint(self, other):
+        """True if the events are mutually exclusive"""
+        self._check(other)
+        return not np.any(self.words & other.words)
+
+    def issubset(self, other):
+        """True if every outcome of this event is in other"""
+        self._check(other)
+        return not np.any(self.words & ~other.words)
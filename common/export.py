@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slide Result Export
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Writes the numeric outputs of SlideResult objects to a single columnar
+table in tidy long format, one value per row:
+
+    slide | table | row | column | value
+
+Scalar metrics are stored under the table name "metrics" with row 0.
+Parquet output needs pyarrow; JSON output has no extra dependencies.
+"""
+
+import json
+from numbers import Number
+from pathlib import Path
+
+import pandas as pd
+
+# Table name used for scalar metrics
+METRICS_TABLE = "metrics"
+
+# Supported file extensions
+EXPORT_FORMATS = (".parquet", ".json")
+
+def _is_numeric(value):
+    return isinstance(value, Number) and not isinstance(value, complex)
+
+def results_to_frame(results):
+    """Flatten the numeric outputs of SlideResults into one long DataFrame
+
+    Text values (e.g. interpretations) are not exported.
+    """
+    slides, tables, rows, columns, values = [], [], [], [], []
+
+    def add(slide, table, row, column, value):
+        slides.append(slide)
+        tables.append(table)
+        rows.append(row)
+        columns.append(column)
+        values.append(float(value))
+
+    for result in results:
+        data = result.to_dict()
+        for name, value in data["metrics"].items():
+            if _is_numeric(value):
+                add(data["slide"], METRICS_TABLE, 0, name, value)
+        for table_name, table in data["tables"].items():
+            for column_name, column in table.items():
+                for row, value in enumerate(column):
+                    if _is_numeric(value):
+                        add(data["slide"], table_name, row, column_name, value)
+
+    return pd.DataFrame({
+        "slide": pd.Categorical(slides),
+        "table": pd.Categorical(tables),
+        "row": pd.array(rows, dtype="int32"),
+        "column": pd.Categorical(columns),
+        "value": pd.array(values, dtype="float64"),
+    })
+
+def export_results(results, path):
+    """Write SlideResults to a .parquet or .json file
+
+    Returns the number of exported values.
+    """
+    path = Path(path)
+    if path.suffix not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{path.suffix}'. "
+                         f"Choose one of: {', '.join(EXPORT_FORMATS)}")
+
+    frame = results_to_frame(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from None
+        frame.to_parquet(path, engine="pyarrow", index=False)
+    else:
+        # Column-oriented JSON; NaN becomes null so the file stays valid JSON
+        column_data = {name: [None if pd.isna(value) else value for value in frame[name].tolist()]
+                       for name in frame.columns}
+        path.write_text(json.dumps(column_data, ensure_ascii=False), encoding="utf-8")
+    return len(frame)
+
+def load_results(path):
+    """Load an exported .parquet or .json file as a DataFrame"""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    if path.suffix == ".json":
+        return pd.DataFrame(json.loads(path.read_text(encoding="utf-8")))
+    raise ValueError(f"Unknown export format '{path.suffix}'. "
+                     f"Choose one of: {', '.join(EXPORT_FORMATS)}")
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Joint Probability Tables and Bayes Updates
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+A JointTable holds P(A = i, B = j) for two categorical variables as a
+dense NumPy array or a scipy.sparse matrix. Marginals and the conditional
+tables P(A | B) and P(B | A) are computed once and cached, so repeated
+conditional lookups are array indexing. Rows are usually hypotheses and
+columns observations, which makes Bayes updates over many observations
+a single vectorized operation.
+"""
+
+from functools import cached_property
+
+import numpy as np
+from scipy import sparse
+
+def _as_table(table):
+    """Validate a dense or sparse 2-D table of non-negative weights"""
+    if sparse.issparse(table):
+        table = sparse.csr_matrix(table, dtype=float)
+        values = table.data
+    else:
+        table = np.asarray(table, dtype=float)
+        values = table
+    if table.ndim != 2:
+        raise ValueError("A joint table must be 2-D")
+    if np.any(values < 0) or not np.all(np.isfinite(values)):
+        raise ValueError("Joint table entries must be finite and non-negative")
+    return table
+
+def _divide_columns(table, divisors):
+    """Divide each column by a divisor, leaving zero divisors as zero columns"""
+    scale = np.divide(1.0, divisors, out=np.zeros_like(divisors), where=divisors > 0)
+    if sparse.issparse(table):
+        return sparse.csr_matrix(table @ sparse.diags(scale))
+    return table * scale
+
+class JointTable:
+    """Joint distribution of two categorical variables A (rows) and B (columns)
+
+    Args:
+        table: Joint probabilities or counts as a 2-D array or scipy.sparse
+            matrix; it is normalized to sum to 1
+        row_labels: Optional labels of the values of A
+        col_labels: Optional labels of the values of B
+
+    Values of A and B may be given by label (when labels were provided)
+    or by integer index.
+    """
+
+    def __init__(self, table, row_labels=None, col_labels=None):
+        table = _as_table(table)
+        total = table.sum()
+        if total <= 0:
+            raise ValueError("Joint table must not be all zeros")
+        self.table = table / total
+        self.shape = self.table.shape
+        self.is_sparse = sparse.issparse(self.table)
+        self._row_index = self._make_index(row_labels, self.shape[0], "row")
+        self._col_index = self._make_index(col_labels, self.shape[1], "column")
+        self.row_labels = list(row_labels) if row_labels is not None else None
+        self.col_labels = list(col_labels) if col_labels is not None else None
+
+    @classmethod
+    def from_conditional(cls, prior, likelihood, row_labels=None, col_labels=None):
+        """Build P(A, B) from a prior P(A) and a likelihood table P(B | A)"""
+        prior = np.asarray(prior, dtype=float)
+        likelihood = _as_table(likelihood)
+        if likelihood.shape[0] != len(prior):
+            raise ValueError("likelihood must have one row per prior value")
+        if sparse.issparse(likelihood):
+            joint = sparse.diags(prior) @ likelihood
+        else:
+            joint = prior[:, None] * likelihood
+        return cls(joint, row_labels, col_labels)
+
+    @staticmethod
+    def _make_index(labels, size, axis):
+        if labels is None:
+            return None
+        labels = list(labels)
+        if len(labels) != size:
+            raise ValueError(f"Expected {size} {axis} labels, got {len(labels)}")
+        index = {label: position for position, label in enumerate(labels)}
+        if len(index) != size:
+            raise ValueError(f"{axis.capitalize()} labels must be unique")
+        return index
+
+    def _lookup(self, index, key):
+        """Map a label, an index, or an array of them to positions"""
+        if index is None:
+            return key
+        if np.ndim(key) == 0:
+            return index[key]
+        return np.array([index[item] for item in key], dtype=np.intp)
+
+    def row(self, key):
+        """Position of a value of A"""
+        return self._lookup(self._row_index, key)
+
+    def col(self, key):
+        """Position of a value of B"""
+        return self._lookup(self._col_index, key)
+
+    def __repr__(self):
+        kind = "sparse" if self.is_sparse else "dense"
+        return f"JointTable({self.shape[0]}x{self.shape[1]}, {kind})"
+
+    # Cached marginals and conditional tables
+
+    @cached_property
+    def row_marginal(self):
+        """P(A) as a 1-D array"""
+        return np.asarray(self.table.sum(axis=1)).ravel()
+
+    @cached_property
+    def col_marginal(self):
+        """P(B) as a 1-D array"""
+        return np.asarray(self.table.sum(axis=0)).ravel()
+
+    @cached_property
+    def row_given_col(self):
+        """P(A | B): each column sums to 1 (zero columns stay zero)"""
+        return _divide_columns(self.table, self.col_marginal)
+
+    @cached_property
+    def col_given_row(self):
+        """P(B | A): each row sums to 1 (zero rows stay zero)"""
+        return _divide_columns(self.table.T, self.row_marginal).T
+
+    # Probability lookups
+
+    def prob(self, row=None, col=None):
+        """P(A = row, B = col), or a marginal if one of them is omitted"""
+        if row is None and col is None:
+            return 1.0
+        if col is None:
+            return self.row_marginal[self.row(row)]
+        if row is None:
+            return self.col_marginal[self.col(col)]
+        return self._entry(self.table, self.row(row), self.col(col))
+
+    def conditional(self, row, given_col):
+        """P(A = row | B = given_col)"""
+        given_col = self.col(given_col)
+        self._check_possible(self.col_marginal, given_col)
+        return self._entry(self.row_given_col, self.row(row), given_col)
+
+    def conditional_col(self, col, given_row):
+        """P(B = col | A = given_row)"""
+        given_row = self.row(given_row)
+        self._check_possible(self.row_marginal, given_row)
+        return self._entry(self.col_given_row, given_row, self.col(col))
+
+    @staticmethod
+    def _check_possible(marginal, position):
+        if np.any(marginal[position] == 0):
+            raise ValueError("Cannot condition on a value with probability 0")
+
+    def _entry(self, table, rows, cols):
+        if self.is_sparse:
+            values = np.asarray(table[rows, cols]).ravel()
+            return values[0] if np.ndim(rows) == 0 and np.ndim(cols) == 0 else values
+        return table[rows, cols]
+
+    # Bayes updates (rows = hypotheses, columns = observations)
+
+    def _prior(self, prior):
+        if prior is None:
+            return self.row_marginal
+        prior = np.asarray(prior, dtype=float)
+        if prior.shape != (self.shape[0],):
+            raise ValueError(f"prior must have {self.shape[0]} entries")
+        return prior / prior.sum()
+
+    def _likelihood_columns(self, cols):
+        """Dense P(B = col | A) for the given columns, one column each"""
+        columns = self.col_given_row[:, cols]
+        return columns.toarray() if sparse.issparse(columns) else columns
+
+    def posteriors(self, observations, prior=None):
+        """P(A | B = obs) for each observation separately
+
+        Returns an array with one posterior row per observation. With the
+        default prior (the table's own P(A)) this equals the cached P(A | B).
+        """
+        cols = np.atleast_1d(self.col(observations))
+        unnormalized = self._likelihood_columns(cols).T * self._prior(prior)
+        evidence = unnormalized.sum(axis=1, keepdims=True)
+        if np.any(evidence == 0):
+            raise ValueError("An observation is impossible under the prior")
+        return unnormalized / evidence
+
+    def update(self, observations, prior=None):
+        """P(A | all observations), treating observations as independent given A
+
+        The update works in log space on the count of each observed value,
+        so millions of observations cost one pass over the distinct values.
+        """
+        cols = np.atleast_1d(self.col(observations))
+        distinct, counts = np.unique(cols, return_counts=True)
+        with np.errstate(divide="ignore"):
+            log_likelihood = np.log(self._likelihood_columns(distinct))
+            log_posterior = np.log(self._prior(prior)) + log_likelihood @ counts
+        if not np.any(np.isfinite(log_posterior)):
+            raise ValueError("The observations are impossible under every hypothesis")
+        posterior = np.exp(log_posterior - np.max(log_posterior))
+        return posterior / posterior.sum()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallel Monte Carlo Executor
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+MonteCarloExecutor splits a simulation of N draws into shards, gives each
+shard its own independent random stream (SeedSequence.spawn), runs the
+shards on a process pool and merges their partial results: RunningStats,
+StreamingHistogram, OutcomeCounts or anything else with update() and
+merge(). Shards are fixed by the seed and N, not by the number of workers,
+and are merged in order, so the result is the same on 1 core or 64.
+
+Samplers are called as sampler(rng, size) and must be picklable, e.g. the
+module-level samplers below wrapped in functools.partial:
+
+    executor = MonteCarloExecutor(seed=42)
+    stats, counts = executor.run(partial(dice_rolls, sides=6), 10**9,
+                                 RunningStats(), OutcomeCounts(1, 6))
+
+consume_array() does the same for samples that already exist; the array
+reaches the workers through shared memory instead of pickling.
+"""
+
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+from common.streaming import DEFAULT_CHUNK_SIZE, chunk_sizes
+from common.shared_array import SharedArray, attach, detach
+
+# Draws per shard: large enough that process overhead is negligible,
+# small enough to balance the load over many cores
+DEFAULT_SHARD_SIZE = 1 << 24
+
+# Samplers for the slide simulations
+
+def uniform_draws(rng, size, low=0.0, high=1.0):
+    """Uniform samples on [low, high)"""
+    return rng.uniform(low, high, size)
+
+def dice_rolls(rng, size, sides=6):
+    """Fair dice rolls 1..sides"""
+    return rng.integers(1, sides + 1, size)
+
+def coin_flips(rng, size, n_trials, p_success):
+    """Successes in size binomial experiments of n_trials coin flips"""
+    return rng.binomial(n_trials, p_success, size)
+
+def poisson_draws(rng, size, lam):
+    """Poisson event counts with rate lam"""
+    return rng.poisson(lam, size)
+
+def sample_means(rng, size, sample_size, low=0.0, high=1.0):
+    """Central limit theorem replicates: means of sample_size uniform draws"""
+    means = np.empty(size)
+    # Bound the temporary matrix to about one chunk of draws
+    rows = max(1, DEFAULT_CHUNK_SIZE // sample_size)
+    for start in range(0, size, rows):
+        stop = min(start + rows, size)
+        means[start:stop] = rng.uniform(low, high, (stop - start, sample_size)).mean(axis=1)
+    return means
+
+def _run_shard(task):
+    """Stream one shard's draws into fresh copies of the consumers"""
+    sampler, size, seed, consumers, chunk_size = task
+    rng = np.random.default_rng(seed)
+    for chunk in chunk_sizes(size, chunk_size):
+        samples = sampler(rng, chunk)
+        for consumer in consumers:
+            consumer.update(samples)
+    return consumers
+
+def _feed(data, consumers, chunk_size):
+    for start in range(0, len(data), chunk_size):
+        chunk = data[start:start + chunk_size]
+        for consumer in consumers:
+            consumer.update(chunk)
+    return consumers
+
+def _run_slice(task):
+    """Feed one slice of a shared array into fresh copies of the consumers"""
+    handle, start, stop, consumers, chunk_size = task
+    try:
+        return _feed(attach(handle)[start:stop], consumers, chunk_size)
+    finally:
+        # The owner unlinks the segment after the call, so keep no mapping
+        detach(handle)
+
+class MonteCarloExecutor:
+    """Runs sharded simulations on a process pool and merges the partial results
+
+    Args:
+        workers: Number of processes (default: all cores); 1 runs in-process
+        seed: Seed of the root SeedSequence; None draws fresh entropy
+        shard_size: Draws per independently seeded shard
+        chunk_size: Draws generated at a time within a shard
+
+    Use as a context manager to keep the pool alive across several runs;
+    otherwise each call starts a pool and shuts it down before returning.
+    """
+
+    def __init__(self, workers=None, seed=None, shard_size=DEFAULT_SHARD_SIZE,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+        if shard_size < 1 or chunk_size < 1:
+            raise ValueError("shard_size and chunk_size must be positive")
+        self.workers = workers or os.cpu_count() or 1
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.shard_size = shard_size
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._entered = False
+
+    def __enter__(self):
+        self._entered = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self._entered = False
+        self.close()
+
+    def close(self):
+        """Shut down the process pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    @contextmanager
+    def _pool_scope(self):
+        """Keep the pool after a call only inside a with block"""
+        try:
+            yield
+        finally:
+            if not self._entered:
+                self.close()
+
+    def _in_process(self, n_tasks):
+        return self.workers == 1 or n_tasks <= 1
+
+    def _map(self, function, tasks):
+        if self._in_process(len(tasks)):
+            return map(function, tasks)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool.map(function, tasks)
+
+    @staticmethod
+    def _merge(consumers, partial_results):
+        merged = copy.deepcopy(consumers)
+        for partial in partial_results:
+            for total, part in zip(merged, partial):
+                total.merge(part)
+        return tuple(merged) if len(merged) > 1 else merged[0]
+
+    def run(self, sampler, n, *consumers):
+        """Draw n samples with sampler(rng, size) and feed them to the consumers
+
+        The consumers passed in are empty templates; each shard updates its
+        own copies, which are merged into the returned objects (one consumer
+        is returned as is, several as a tuple).
+
+        Every call spawns new shard streams, so repeated runs are
+        independent but reproducible from the executor's seed.
+        """
+        self._check_consumers(consumers)
+        sizes = list(chunk_sizes(n, self.shard_size))
+        seeds = self.seed_sequence.spawn(len(sizes))
+        tasks = [(sampler, size, seed, copy.deepcopy(consumers), self.chunk_size)
+                 for size, seed in zip(sizes, seeds)]
+        with self._pool_scope():
+            return self._merge(consumers, self._map(_run_shard, tasks))
+
+    def consume_array(self, data, *consumers):
+        """Feed an existing 1-D sample array to the consumers shard by shard
+
+        Workers read the array zero-copy from shared memory, which is
+        released when the call returns (also on errors).
+        """
+        self._check_consumers(consumers)
+        data = np.asarray(data).ravel()
+        bounds = [(start, min(start + self.shard_size, len(data)))
+                  for start in range(0, len(data), self.shard_size)]
+        if self._in_process(len(bounds)):
+            partials = (_feed(data[start:stop], copy.deepcopy(consumers), self.chunk_size)
+                        for start, stop in bounds)
+            return self._merge(consumers, partials)
+        with SharedArray.from_array(data) as shared, self._pool_scope():
+            tasks = [(shared.handle, start, stop, copy.deepcopy(consumers), self.chunk_size)
+                     for start, stop in bounds]
+            return self._merge(consumers, list(self._map(_run_slice, tasks)))
+
+    @staticmethod
+    def _check_consumers(consumers):
+        if not consumers:
+            raise ValueError("Pass at least one consumer, e.g. RunningStats()")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Poisson Distribution for Large and Batched Rates
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Poisson(λ) has its mass within a few sqrt(λ) of λ, so supports are
+windows centered on the mean instead of ranges starting at 0, and the
+PMF is computed in log space with Loader's saddle-point formula (shared
+with common.binomial), which stays accurate for λ up to 10^9 and beyond.
+Every function broadcasts over arrays of counts and arrays of rates, so
+several λ values are evaluated in one call. Seeded simulated samples are
+cached per (λ, size, seed), so re-plotting a rate does not re-simulate it.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from scipy import special, stats
+
+from common.binomial import WINDOW_TAIL, _LOG_SQRT_2PI, _phi, _stirling_error
+
+def _check_rate(lam):
+    lam = np.asarray(lam, dtype=float)
+    if np.any(~(lam > 0)) or not np.all(np.isfinite(lam)):
+        raise ValueError("Poisson rates must be positive and finite")
+    return lam
+
+def poisson_log_pmf(k, lam):
+    """log P(X = k) for X ~ Poisson(lam), broadcasting over k and lam"""
+    lam = _check_rate(lam)
+    k, lam = np.broadcast_arrays(np.asarray(k, dtype=float), lam)
+    positive = k > 0
+    # Other points get a placeholder that keeps the formula finite
+    kp = np.where(positive, k, 1.0)
+    log_pmf = -lam * _phi(kp / lam - 1) - _stirling_error(kp) - 0.5 * np.log(kp) - _LOG_SQRT_2PI
+    log_pmf = np.where(k == 0, -lam, log_pmf)
+    log_pmf = np.where((k < 0) | (k != np.floor(k)), -np.inf, log_pmf)
+    return log_pmf if log_pmf.ndim else float(log_pmf)
+
+def poisson_pmf(k, lam):
+    """P(X = k), broadcasting over k and lam"""
+    return np.exp(poisson_log_pmf(k, lam))
+
+def poisson_cdf(k, lam):
+    """P(X <= k), broadcasting over k and lam"""
+    return special.pdtr(k, _check_rate(lam))
+
+def poisson_sf(k, lam):
+    """P(X > k) without the cancellation of 1 - cdf"""
+    return special.pdtrc(k, _check_rate(lam))
+
+def poisson_window(lam, tail=WINDOW_TAIL):
+    """Smallest and largest count worth evaluating for one rate
+
+    Returns (low, high) with P(X < low) and P(X > high) both at most tail.
+    The support is unbounded, so tail must be positive.
+    """
+    _check_rate(lam)
+    if not tail > 0:
+        raise ValueError("tail must be positive: the Poisson support has no upper end")
+    return int(stats.poisson.ppf(tail, lam)), int(stats.poisson.isf(tail, lam))
+
+def centered_support(low, high, max_points=None):
+    """Integer counts low..high, or max_points evenly spaced ones if wider"""
+    if max_points is not None and high - low + 1 > max_points:
+        return np.unique(np.linspace(low, high, max_points).round().astype(np.int64))
+    return np.arange(low, high + 1)
+
+def poisson_pmf_window(lam, tail=WINDOW_TAIL, log=False, max_points=None):
+    """Counts and their PMF (or log PMF) over poisson_window(lam, tail)"""
+    x = centered_support(*poisson_window(lam, tail), max_points)
+    log_pmf = poisson_log_pmf(x, lam)
+    return x, (log_pmf if log else np.exp(log_pmf))
+
+@lru_cache(maxsize=32)
+def _cached_samples(lam, size, seed):
+    samples = np.random.default_rng(seed).poisson(lam, size)
+    samples.flags.writeable = False
+    return samples
+
+def poisson_samples(lam, size=10000, seed=None):
+    """Simulated Poisson(lam) counts, cached per (lam, size, seed) when seeded
+
+    seed=None draws fresh samples from NumPy's global random state on
+    every call, so np.random.seed() controls the result. Seeded samples
+    are read-only because they are shared.
+    """
+    _check_rate(lam)
+    if seed is None:
+        return np.random.poisson(float(lam), int(size))
+    return _cached_samples(float(lam), int(size), seed)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Poisson Process Simulation
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+PoissonProcess models events arriving at a constant rate, or at a
+piecewise-constant rate that may repeat with a period (e.g. hourly call
+rates over a day). Event timestamps are generated in chunks by drawing a
+unit-rate process in "expected event" time and mapping it back through
+the cumulative intensity, so any number of rate segments costs one
+vectorized step per chunk. Counts per window are aggregated on the fly
+(WindowCounts) or drawn directly: counts in disjoint windows are
+independent Poisson variables whose mean is the expected number of
+events in the window, so a year of per-second counts needs no events
+at all.
+"""
+
+import numpy as np
+
+from common.sampling import random_source
+from common.streaming import DEFAULT_CHUNK_SIZE, chunk_sizes
+
+class PoissonProcess:
+    """Homogeneous or piecewise-constant-rate Poisson process starting at t = 0
+
+    Args:
+        rates: Events per time unit; a number, or one rate per segment
+        breakpoints: Times at which the rate changes (len(rates) - 1
+            increasing values); the first segment starts at 0
+        period: If given, the rate profile repeats every period time units
+            and all breakpoints must lie inside (0, period)
+    """
+
+    def __init__(self, rates, breakpoints=None, period=None):
+        self.rates = np.atleast_1d(np.asarray(rates, dtype=float))
+        self.breakpoints = np.asarray([] if breakpoints is None else breakpoints, dtype=float)
+        if self.rates.ndim != 1 or len(self.breakpoints) != len(self.rates) - 1:
+            raise ValueError("Give one rate per segment: len(rates) == len(breakpoints) + 1")
+        if np.any(self.rates < 0) or not np.all(np.isfinite(self.rates)) or not np.any(self.rates > 0):
+            raise ValueError("Rates must be finite, non-negative and not all zero")
+        if np.any(np.diff(self.breakpoints) <= 0) or np.any(self.breakpoints <= 0):
+            raise ValueError("Breakpoints must be positive and increasing")
+        if period is not None and (period <= 0 or np.any(self.breakpoints >= period)):
+            raise ValueError("Breakpoints must lie inside (0, period)")
+        if period is None and self.rates[-1] == 0:
+            raise ValueError("The last segment of a non-periodic process needs a positive rate")
+        self.period = period
+
+        # Knots of the piecewise-linear cumulative intensity Λ(t)
+        self._knot_times = np.concatenate([[0.0], self.breakpoints])
+        if period is not None:
+            self._knot_times = np.append(self._knot_times, period)
+        segment_lengths = np.diff(self._knot_times)
+        self._knot_values = np.concatenate([[0.0], np.cumsum(self.rates[:len(segment_lengths)] * segment_lengths)])
+
+    @classmethod
+    def homogeneous(cls, rate):
+        """Process with a constant rate"""
+        return cls(rate)
+
+    def __repr__(self):
+        if len(self.rates) == 1:
+            return f"PoissonProcess(rate={self.rates[0]:g})"
+        kind = f", period={self.period:g}" if self.period is not None else ""
+        return f"PoissonProcess({len(self.rates)} rate segments{kind})"
+
+    def cumulative_intensity(self, t):
+        """Λ(t): expected number of events in [0, t)"""
+        t = np.asarray(t, dtype=float)
+        if self.period is not None:
+            cycles, within = np.divmod(t, self.period)
+            return cycles * self._knot_values[-1] + np.interp(within, self._knot_times, self._knot_values)
+        last_time, last_value = self._knot_times[-1], self._knot_values[-1]
+        return np.where(t <= last_time,
+                        np.interp(t, self._knot_times, self._knot_values),
+                        last_value + (t - last_time) * self.rates[-1])
+
+    def expected_count(self, start, stop):
+        """Expected number of events in [start, stop)"""
+        return self.cumulative_intensity(stop) - self.cumulative_intensity(start)
+
+    def _inverse_intensity(self, s):
+        """Times t with Λ(t) = s"""
+        if len(self.rates) == 1 and self.period is None:
+            return s / self.rates[0]
+        if self.period is not None:
+            cycles, within = np.divmod(s, self._knot_values[-1])
+            return cycles * self.period + np.interp(within, self._knot_values, self._knot_times)
+        last_time, last_value = self._knot_times[-1], self._knot_values[-1]
+        return np.where(s <= last_value,
+                        np.interp(s, self._knot_values, self._knot_times),
+                        last_time + (s - last_value) / self.rates[-1])
+
+    def event_times(self, duration, chunk_size=DEFAULT_CHUNK_SIZE, rng=None):
+        """Yield the sorted event timestamps in [0, duration) in chunks
+
+        Chunks hold at most chunk_size events; only one chunk is in memory
+        at a time.
+        """
+        source = random_source(rng)
+        end = float(self.cumulative_intensity(duration))
+        offset = 0.0
+        while True:
+            # Unit-rate arrivals in expected-event time
+            arrivals = np.cumsum(source.exponential(1.0, chunk_size))
+            arrivals += offset
+            offset = arrivals[-1]
+            inside = np.searchsorted(arrivals, end)
+            if inside:
+                yield self._inverse_intensity(arrivals[:inside])
+            if inside < chunk_size:
+                return
+
+    def window_counts(self, duration, window, chunk_windows=DEFAULT_CHUNK_SIZE, rng=None):
+        """Yield the number of events in consecutive windows of [0, duration)
+
+        Counts are drawn directly as independent Poisson variables, which
+        has the same distribution as counting simulated events. The last
+        window is shorter if window does not divide duration.
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        source = random_source(rng)
+        n_windows = int(np.ceil(duration / window))
+        first = 0
+        for size in chunk_sizes(n_windows, chunk_windows):
+            edges = np.minimum(np.arange(first, first + size + 1) * window, duration)
+            yield source.poisson(np.diff(self.cumulative_intensity(edges)))
+            first += size
+
+class WindowCounts:
+    """Event counts per fixed-length window, updated from timestamp chunks
+
+    Args:
+        window: Length of each window
+        duration: End of the observed period; events are in [0, duration)
+    """
+
+    def __init__(self, window, duration):
+        if window <= 0 or duration <= 0:
+            raise ValueError("window and duration must be positive")
+        self.window = window
+        self.duration = duration
+        self.counts = np.zeros(int(np.ceil(duration / window)), dtype=np.int64)
+
+    def update(self, times):
+        """Add a chunk of event timestamps"""
+        times = np.asarray(times, dtype=float)
+        if not np.all(times[1:] >= times[:-1]):
+            times = np.sort(times)
+        # Sorted times: locate the window edges instead of binning every event
+        times = times[np.searchsorted(times, 0.0):np.searchsorted(times, self.duration)]
+        if len(times) == 0:
+            return self
+        first = int(times[0] // self.window)
+        last = min(int(times[-1] // self.window), len(self.counts) - 1)
+        edges = np.minimum(np.arange(first, last + 2) * self.window, self.duration)
+        edges[-1] = self.duration
+        self.counts[first:last + 1] += np.diff(np.searchsorted(times, edges))
+        return self
+
+    def merge(self, other):
+        """Add the counts of another WindowCounts with the same windows"""
+        if (self.window, self.duration) != (other.window, other.duration):
+            raise ValueError("Window counts must use the same windows to merge")
+        self.counts += other.counts
+        return self
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Quasi-Monte Carlo Sampling Mode
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+The sampling mode selects where the slides' uniform numbers come from:
+NumPy's pseudo-random generator (the default), or a scrambled Sobol or
+Halton low-discrepancy sequence, which fills [0, 1)^d far more evenly.
+Averages over such points (CDF checks, probabilities, means) converge at
+close to O(1/n) instead of O(1/sqrt(n)). For arrays of shape (m, d), each
+row is one d-dimensional point, so every row still has exactly the
+distribution of d independent uniforms.
+
+Scrambling makes the points random, so several independently scrambled
+replicates give an honest error estimate (randomized QMC, see
+common.estimation.rqmc_estimate). Scrambling seeds come from rng, or
+from NumPy's global state, so np.random.seed() keeps runs reproducible.
+"""
+
+import inspect
+import os
+import warnings
+
+import numpy as np
+from scipy.stats import qmc
+
+from common.sampling import random_source
+
+# Environment variable used to select the sampling mode
+SAMPLING_ENV = "PROB_SAMPLING"
+DEFAULT_SAMPLING = "random"
+
+# random - NumPy pseudo-random numbers (original behavior)
+# sobol  - scrambled Sobol sequence (best for 2^k points)
+# halton - scrambled Halton sequence (any number of points)
+SAMPLING_MODES = ("random", "sobol", "halton")
+
+# Highest dimension scipy provides Sobol direction numbers for
+SOBOL_MAX_DIMENSION = 21201
+
+# SciPy 1.15 renamed the engines' seed argument to rng
+_SEED_KEYWORD = "rng" if "rng" in inspect.signature(qmc.Sobol).parameters else "seed"
+
+_active_sampling = None
+
+def get_sampling_mode():
+    """Get the name of the active sampling mode"""
+    name = _active_sampling or os.environ.get(SAMPLING_ENV, DEFAULT_SAMPLING)
+    if name not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode '{name}'. "
+                         f"Choose one of: {', '.join(SAMPLING_MODES)}")
+    return name
+
+def set_sampling_mode(name):
+    """Select the sampling mode for this process and its child processes"""
+    global _active_sampling
+    if name not in SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode '{name}'. "
+                         f"Choose one of: {', '.join(SAMPLING_MODES)}")
+    _active_sampling = name
+    os.environ[SAMPLING_ENV] = name
+    return name
+
+def _scramble_rng(rng):
+    """Generator for scrambling, drawn from rng or the global NumPy state"""
+    source = random_source(rng)
+    if isinstance(source, np.random.Generator):
+        return source
+    return np.random.default_rng(source.randint(np.iinfo(np.int64).max, dtype=np.int64))
+
+def qmc_engine(dimension, mode=None, rng=None):
+    """Scrambled low-discrepancy engine for points in [0, 1)^dimension"""
+    mode = mode or get_sampling_mode()
+    if mode == "sobol":
+        if dimension > SOBOL_MAX_DIMENSION:
+            raise ValueError(f"Sobol sequences support at most {SOBOL_MAX_DIMENSION} dimensions")
+        return qmc.Sobol(dimension, scramble=True, **{_SEED_KEYWORD: _scramble_rng(rng)})
+    if mode == "halton":
+        return qmc.Halton(dimension, scramble=True, **{_SEED_KEYWORD: _scramble_rng(rng)})
+    raise ValueError(f"'{mode}' is not a low-discrepancy sampling mode")
+
+def next_points(engine, n):
+    """The next n points of an engine"""
+    with warnings.catch_warnings():
+        # Sobol warns unless n is a power of 2; any prefix is still evenly spread
+        warnings.simplefilter("ignore", UserWarning)
+        return engine.random(n)
+
+def _point_shape(shape):
+    """(points, dimension) for an output shape; the last axis of 2-D+ shapes is the dimension"""
+    if len(shape) <= 1:
+        return int(np.prod(shape)), 1
+    return int(np.prod(shape[:-1])), shape[-1]
+
+def uniform_samples(low=0.0, high=1.0, size=None, rng=None, mode=None):
+    """Uniform samples on [low, high) from the active sampling mode
+
+    In random mode this is rng.uniform (np.random.uniform for rng=None),
+    so results are unchanged. Otherwise the samples are points of one
+    scrambled sequence.
+    """
+    mode = mode or get_sampling_mode()
+    if mode == "random":
+        return random_source(rng).uniform(low, high, size)
+    shape = () if size is None else ((size,) if np.ndim(size) == 0 else tuple(size))
+    n_points, dimension = _point_shape(shape)
+    points = next_points(qmc_engine(dimension, mode, rng), n_points)
+    samples = low + (high - low) * points.reshape(shape)
+    return samples if shape else float(samples)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared Figure Rendering Settings
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Render profiles control the resolution, bounding box computation and
+marker detail of every figure saved by the slides. The output format and
+output directory of saved figures are configured here as well.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+import matplotlib
+
+# Environment variable used to select the render profile
+RENDER_PROFILE_ENV = "PROB_RENDER_PROFILE"
+DEFAULT_RENDER_PROFILE = "print"
+
+# draft   - fast iteration and CI runs (low dpi, no tight bbox, simplified paths)
+# preview - on-screen review quality
+# print   - full quality output (the original 300 dpi settings)
+RENDER_PROFILES = {
+    "draft": {
+        "dpi": 72,
+        "bbox_inches": None,
+        "rcparams": {
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+            "lines.markersize": 3,
+            "lines.antialiased": False,
+            "patch.antialiased": False,
+            "scatter.marker": ".",
+        },
+    },
+    "preview": {
+        "dpi": 120,
+        "bbox_inches": "tight",
+        "rcparams": {
+            "path.simplify": True,
+            "path.simplify_threshold": 0.5,
+        },
+    },
+    "print": {
+        "dpi": 300,
+        "bbox_inches": "tight",
+        "rcparams": {},
+    },
+}
+
+# Environment variables used to select the figure output format and directory
+OUTPUT_FORMAT_ENV = "PROB_OUTPUT_FORMAT"
+OUTPUT_DIR_ENV = "PROB_OUTPUT_DIR"
+DEFAULT_OUTPUT_FORMAT = "png"
+
+# png  - raster output (original behavior)
+# svg  - vector output for the HTML slides (text kept as text)
+# pdf  - vector output, one file per figure or one multipage file for --all
+# webp - compressed raster output
+OUTPUT_FORMATS = {
+    "png": {"savefig_kwargs": {}, "rcparams": {}},
+    "svg": {"savefig_kwargs": {}, "rcparams": {"svg.fonttype": "none"}},
+    "pdf": {"savefig_kwargs": {}, "rcparams": {"pdf.compression": 9}},
+    "webp": {"savefig_kwargs": {"pil_kwargs": {"quality": 80, "method": 6}}, "rcparams": {}},
+}
+
+_active_profile = None
+_output_format = None
+_output_dir = None
+_pdf_pages = None
+_pdf_path = None
+_artifact_log = None
+
+# rcParams values replaced by the applied profile, restored on the next switch
+_replaced_rcparams = {}
+
+def get_render_profile():
+    """Get the name of the active render profile"""
+    name = _active_profile or os.environ.get(RENDER_PROFILE_ENV, DEFAULT_RENDER_PROFILE)
+    if name not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile '{name}'. "
+                         f"Choose one of: {', '.join(RENDER_PROFILES)}")
+    return name
+
+def set_render_profile(name):
+    """Select the render profile for this process and its child processes"""
+    global _active_profile
+    if name not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile '{name}'. "
+                         f"Choose one of: {', '.join(RENDER_PROFILES)}")
+    _active_profile = name
+    os.environ[RENDER_PROFILE_ENV] = name
+    apply_render_profile()
+    return name
+
+def apply_render_profile():
+    """Apply the matplotlib settings of the active profile
+
+    Settings replaced by the previously applied profile are restored
+    first, so switching from draft to print leaves no draft settings
+    behind (slide-specific settings such as fonts are kept).
+    """
+    global _replaced_rcparams
+    matplotlib.rcParams.update(_replaced_rcparams)
+    rcparams = RENDER_PROFILES[get_render_profile()]["rcparams"]
+    _replaced_rcparams = {key: matplotlib.rcParams[key] for key in rcparams}
+    matplotlib.rcParams.update(rcparams)
+
+def get_output_format():
+    """Get the file format used for saved figures"""
+    fmt = _output_format or os.environ.get(OUTPUT_FORMAT_ENV, DEFAULT_OUTPUT_FORMAT)
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}'. "
+                         f"Choose one of: {', '.join(OUTPUT_FORMATS)}")
+    return fmt
+
+def set_output_format(fmt):
+    """Select the figure output format for this process and its child processes"""
+    global _output_format
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}'. "
+                         f"Choose one of: {', '.join(OUTPUT_FORMATS)}")
+    _output_format = fmt
+    os.environ[OUTPUT_FORMAT_ENV] = fmt
+    return fmt
+
+def get_output_dir():
+    """Get the directory for saved figures (None means next to each slide)"""
+    out_dir = _output_dir or os.environ.get(OUTPUT_DIR_ENV)
+    return Path(out_dir) if out_dir else None
+
+def set_output_dir(out_dir):
+    """Select the directory for saved figures for this process and its child processes"""
+    global _output_dir
+    _output_dir = Path(out_dir).absolute()
+    os.environ[OUTPUT_DIR_ENV] = str(_output_dir)
+    return _output_dir
+
+def resolve_output_path(output_path):
+    """Map a slide's default figure path to the configured directory and format"""
+    output_path = Path(output_path)
+    out_dir = get_output_dir()
+    if out_dir is not None:
+        # Keep one sub-directory per slide so file names cannot collide
+        output_path = out_dir / output_path.parent.name / output_path.name
+    return output_path.with_suffix(f".{get_output_format()}")
+
+@contextmanager
+def multipage_pdf(pdf_path):
+    """Collect every figure saved inside the block into a single PDF file"""
+    global _pdf_pages, _pdf_path
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    pdf_path = Path(pdf_path)
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    with matplotlib.rc_context(OUTPUT_FORMATS["pdf"]["rcparams"]), PdfPages(pdf_path) as pages:
+        _pdf_pages, _pdf_path = pages, pdf_path
+        try:
+            yield pdf_path
+        finally:
+            _pdf_pages, _pdf_path = None, None
+
+@contextmanager
+def record_artifacts():
+    """Collect the paths of all figures saved inside the block"""
+    global _artifact_log
+    previous_log = _artifact_log
+    _artifact_log = []
+    try:
+        yield _artifact_log
+    finally:
+        _artifact_log = previous_log
+
+def _record_artifact(path):
+    """Remember a saved figure for record_artifacts()"""
+    if _artifact_log is not None and path not in _artifact_log:
+        _artifact_log.append(path)
+    return path
+
+def save_figure(output_path, fig=None):
+    """Save a figure using the active render profile and output format
+
+    Returns the path that was actually written.
+    """
+    if fig is None:
+        import matplotlib.pyplot as plt
+        fig = plt.gcf()
+
+    profile = RENDER_PROFILES[get_render_profile()]
+    savefig_kwargs = {"dpi": profile["dpi"]}
+    if profile["bbox_inches"]:
+        savefig_kwargs["bbox_inches"] = profile["bbox_inches"]
+
+    # Inside multipage_pdf() every figure becomes a page of the shared file
+    if _pdf_pages is not None:
+        _pdf_pages.savefig(fig, **savefig_kwargs)
+        return _record_artifact(_pdf_path)
+
+    fmt = get_output_format()
+    output_path = resolve_output_path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with matplotlib.rc_context(OUTPUT_FORMATS[fmt]["rcparams"]):
+        fig.savefig(output_path, format=fmt, **savefig_kwargs,
+                    **OUTPUT_FORMATS[fmt]["savefig_kwargs"])
+    return _record_artifact(output_path)
+
+# Apply profile settings as soon as a slide imports this module
+apply_render_profile()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Structured Slide Results
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Slides run with quiet=True return a SlideResult instead of printing.
+A result holds scalar metrics, column-oriented tables and the paths of
+saved figures, and converts to plain dicts or JSON for batch pipelines.
+"""
+
+import json
+from dataclasses import dataclass, field
+
+import numpy as np
+
+def to_builtin(value):
+    """Convert numpy scalars and arrays to plain Python values"""
+    if isinstance(value, dict):
+        return {str(key): to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_builtin(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+@dataclass
+class SlideResult:
+    """Data produced by one slide, without any console formatting"""
+
+    slide: str
+    title: str
+    metrics: dict = field(default_factory=dict)
+    tables: dict = field(default_factory=dict)
+    artifacts: list = field(default_factory=list)
+
+    def add_metrics(self, **metrics):
+        """Add named scalar values"""
+        self.metrics.update(to_builtin(metrics))
+        return self
+
+    def add_table(self, name, **columns):
+        """Add a table given as equally long columns"""
+        columns = to_builtin(columns)
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns of table '{name}' have different lengths: {sorted(lengths)}")
+        self.tables[name] = columns
+        return self
+
+    def table_rows(self, name):
+        """Return a table as a list of row dicts"""
+        columns = self.tables[name]
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def to_dict(self):
+        """Convert to a JSON-compatible dict"""
+        return {
+            "slide": self.slide,
+            "title": self.title,
+            "metrics": to_builtin(self.metrics),
+            "tables": to_builtin(self.tables),
+            "artifacts": [str(path) for path in self.artifacts],
+        }
+
+    def to_json(self, indent=2):
+        """Convert to a JSON string"""
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Discrete Sampling with the Alias Method
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+AliasSampler draws from any finite PMF (a loaded die, a binomial or
+Poisson PMF table, ...) in O(1) per draw. Vose's alias table is built once
+in O(n); each draw then needs one uniform number: its integer part picks
+a column of the table and its fractional part decides between the column
+and its alias. Draws are generated in cache-sized vectorized chunks.
+"""
+
+import numpy as np
+
+# Draws generated per vectorized step; small enough to stay in CPU cache
+SAMPLE_CHUNK_SIZE = 1 << 14
+
+def build_alias_table(probabilities):
+    """Build Vose's alias table for a PMF
+
+    Returns (accept, alias): column i keeps outcome i with probability
+    accept[i] and otherwise yields outcome alias[i].
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    if probabilities.ndim != 1 or len(probabilities) == 0:
+        raise ValueError("probabilities must be a non-empty 1-D sequence")
+    if np.any(probabilities < 0) or not np.all(np.isfinite(probabilities)):
+        raise ValueError("probabilities must be finite and non-negative")
+    total = probabilities.sum()
+    if total <= 0:
+        raise ValueError("probabilities must not all be zero")
+
+    n = len(probabilities)
+    scaled = probabilities * (n / total)
+    accept = np.ones(n)
+    alias = np.arange(n)
+    small = [i for i in range(n) if scaled[i] < 1.0]
+    large = [i for i in range(n) if scaled[i] >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        accept[less] = scaled[less]
+        alias[less] = more
+        # The large column donates the rest of the small column's slot
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Leftovers are 1 up to round-off
+    return accept, alias
+
+def random_source(rng=None):
+    """Normalize an rng argument to something that draws random numbers
+
+    None gives NumPy's global state (np.random), so np.random.seed() makes
+    results reproducible; an int or SeedSequence gives a new Generator;
+    Generators and RandomStates are returned unchanged. Anything else
+    raises TypeError.
+    """
+    if rng is None:
+        return np.random
+    if isinstance(rng, (np.random.Generator, np.random.RandomState)):
+        return rng
+    if isinstance(rng, (int, np.integer, np.random.SeedSequence)) and not isinstance(rng, bool):
+        return np.random.default_rng(rng)
+    raise TypeError(f"rng must be None, a seed, a SeedSequence, a Generator or a RandomState, "
+                    f"not {type(rng).__name__}")
+
+def uniforms(rng, size):
+    """Uniform [0, 1) numbers from any rng accepted by random_source()"""
+    source = random_source(rng)
+    if isinstance(source, np.random.Generator):
+        return source.random(size)
+    return source.random_sample(size)
+
+class AliasSampler:
+    """O(1)-per-draw sampler for a finite discrete distribution
+
+    Args:
+        values: Outcomes to draw
+        probabilities: Probability or weight of each outcome (normalized)
+        rng: np.random.Generator, np.random.RandomState, a seed for a new
+            Generator, or None for NumPy's global random state
+    """
+
+    def __init__(self, values, probabilities, rng=None):
+        self.values = np.asarray(values)
+        if self.values.shape != np.shape(probabilities):
+            raise ValueError("values and probabilities must have the same length")
+        self.accept, alias = build_alias_table(probabilities)
+        self.alias_values = self.values[alias]
+        self.rng = rng if rng is None else random_source(rng)
+
+    @classmethod
+    def from_distribution(cls, distribution, rng=None):
+        """Sampler for a DiscreteDistribution"""
+        return cls(distribution.values, distribution.probabilities, rng)
+
+    @classmethod
+    def from_table(cls, table, value_column, probability_column="probability", rng=None):
+        """Sampler for a column table such as slide04's binomial_pmf_table()"""
+        return cls(table[value_column], table[probability_column], rng)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f"AliasSampler({len(self)} outcomes)"
+
+    def sample(self, size=None, rng=None):
+        """Draw samples; size may be None (one value), an int or a shape
+
+        rng overrides the sampler's random source for this call; an int
+        seed gives the same draws on every call.
+        """
+        if size is None:
+            return self.sample(1, rng)[0]
+        rng = self.rng if rng is None else random_source(rng)
+        shape = (size,) if np.ndim(size) == 0 else tuple(size)
+        total = int(np.prod(shape))
+        out = np.empty(total, dtype=self.values.dtype)
+        n = len(self.values)
+        for start in range(0, total, SAMPLE_CHUNK_SIZE):
+            count = min(SAMPLE_CHUNK_SIZE, total - start)
+            u = uniforms(rng, count)
+            u *= n
+            column = u.astype(np.intp)
+            np.minimum(column, n - 1, out=column)  # Guard against u * n rounding up to n
+            u -= column
+            out[start:start + count] = np.where(u < self.accept.take(column),
+                                                self.values.take(column),
+                                                self.alias_values.take(column))
+        return out.reshape(shape)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sequential Fairness Tests
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+A chi-square test looks at the data once, after a sample size fixed in
+advance. Wald's sequential probability ratio test (SPRT) instead updates
+the log-likelihood ratio of H1 against H0 after every observation and
+stops as soon as it crosses
+
+    log((1 - beta) / alpha)   -> reject H0
+    log(beta / (1 - alpha))   -> accept H0
+
+which keeps the error rates at about alpha and beta while needing, on
+average, a fraction of the fixed-size test's samples. Rolls are consumed
+in blocks, but the crossing is located at the exact roll inside a block,
+and run() stops reading a stream as soon as the test decides.
+
+Fairness of a die (or coin) is a composite hypothesis, so fairness()
+runs one SPRT per face and direction: "face j has probability 1/sides +
+bias" and "... - bias". Their alpha is split between them (Bonferroni),
+the die is called biased as soon as any of them rejects, and fair once
+all of them accept. check_fairness() runs that test over recorded rolls
+and fairness_verdict() words its outcome the same way on every slide.
+"""
+
+import numpy as np
+
+# Wording of a fairness test's decision (None while undecided)
+FAIRNESS_VERDICTS = {"accept": "accepted fairness", "reject": "rejected fairness", None: "undecided"}
+
+class SequentialTest:
+    """Wald SPRTs over categorical outcomes low, low + 1, ..., evaluated together
+
+    Args:
+        log_ratios: Array (tests, outcomes) with log(P1(x) / P0(x)) of each
+            test for each outcome
+        alpha: Probability of rejecting H0 when it is true (per test)
+        beta: Probability of accepting H0 when the test's H1 is true
+        low: Smallest outcome (1 for dice, 0 for coin flips)
+
+    decision is None while undecided, then "reject" as soon as any test
+    rejects H0, or "accept" once every test has accepted it.
+    """
+
+    def __init__(self, log_ratios, alpha=0.05, beta=0.05, low=0):
+        self.log_ratios = np.atleast_2d(np.asarray(log_ratios, dtype=float))
+        if not (0 < alpha < 1 and 0 < beta < 1 and alpha + beta < 1):
+            raise ValueError("alpha and beta must be positive with alpha + beta < 1")
+        if not np.all(np.isfinite(self.log_ratios)):
+            raise ValueError("Log-likelihood ratios must be finite")
+        self.alpha, self.beta, self.low = alpha, beta, low
+        self.upper = np.log((1 - beta) / alpha)
+        self.lower = np.log(beta / (1 - alpha))
+        n_tests = len(self.log_ratios)
+        self.log_likelihood_ratios = np.zeros(n_tests)
+        # Per test: 0 still running, -1 accepted H0, +1 rejected H0
+        self.outcomes = np.zeros(n_tests, dtype=int)
+        self.n_samples = 0
+        self.decision = None
+
+    @classmethod
+    def simple(cls, p0, p1, alpha=0.05, beta=0.05, low=0):
+        """SPRT of H0: probabilities p0 against H1: probabilities p1"""
+        p0, p1 = np.asarray(p0, dtype=float), np.asarray(p1, dtype=float)
+        if p0.shape != p1.shape or np.any(p0 <= 0) or np.any(p1 <= 0):
+            raise ValueError("p0 and p1 must be positive probabilities over the same outcomes")
+        return cls(np.log(p1 / p1.sum()) - np.log(p0 / p0.sum()), alpha, beta, low)
+
+    @classmethod
+    def fairness(cls, sides=6, bias=0.05, alpha=0.05, beta=0.05, low=1):
+        """Test of a fair die against any face being bias more or less likely
+
+        Args:
+            sides: Number of faces (2 for a coin)
+            bias: Smallest deviation from 1/sides that must be detected
+            alpha: Overall probability of calling a fair die biased
+            beta: Probability of calling a die fair whose face is off by bias
+            low: Smallest face value
+        """
+        fair = 1 / sides
+        if not 0 < bias < fair or sides < 2:
+            raise ValueError("Need sides >= 2 and 0 < bias < 1 / sides")
+        if not (0 < alpha and 0 < beta and alpha + beta < 1):
+            raise ValueError("alpha and beta must be positive with alpha + beta < 1")
+        shifted = np.concatenate([np.full(sides, fair + bias), np.full(sides, fair - bias)])
+        faces = np.tile(np.arange(sides), 2)
+        # Alternative j: face j has the shifted probability, the rest share the remainder
+        log_ratios = np.tile(np.log((1 - shifted) / (1 - fair))[:, None], (1, sides))
+        log_ratios[np.arange(2 * sides), faces] = np.log(shifted / fair)
+        return cls(log_ratios, alpha / (2 * sides), beta, low)
+
+    @property
+    def decided(self):
+        return self.decision is not None
+
+    def __repr__(self):
+        state = self.decision or "undecided"
+        return f"SequentialTest({len(self.log_ratios)} tests, {state} after {self.n_samples} samples)"
+
+    def update(self, chunk):
+        """Consume a block of outcomes; observations after a decision are ignored"""
+        if self.decided:
+            return self
+        chunk = np.asarray(chunk).ravel() - self.low
+        if len(chunk) == 0:
+            return self
+        if chunk.min() < 0 or chunk.max() >= self.log_ratios.shape[1]:
+            raise ValueError(f"Outcomes must lie in [{self.low}, {self.low + self.log_ratios.shape[1] - 1}]")
+        running = self.outcomes == 0
+        # Log-likelihood ratio of every running test after each observation
+        paths = self.log_likelihood_ratios[running][:, None] + np.cumsum(self.log_ratios[running][:, chunk], axis=1)
+        crossed = (paths >= self.upper) | (paths <= self.lower)
+        first = np.where(crossed.any(axis=1), crossed.argmax(axis=1), len(chunk))
+        at_first = paths[np.arange(len(first)), np.minimum(first, len(chunk) - 1)]
+        verdicts = np.where(first == len(chunk), 0, np.where(at_first >= self.upper, 1, -1))
+
+        rejecting = verdicts == 1
+        if rejecting.any():
+            stop = first[rejecting].min() + 1
+        elif np.all(verdicts == -1):
+            stop = first.max() + 1
+        else:
+            stop = len(chunk)
+        # Tests that decided by the stop keep the ratio at their crossing
+        final = (verdicts != 0) & (first < stop)
+        index = np.where(final, first, stop - 1)
+        self.log_likelihood_ratios[running] = paths[np.arange(len(index)), index]
+        self.outcomes[np.flatnonzero(running)[final]] = verdicts[final]
+        self.n_samples += stop
+
+        if np.any(self.outcomes == 1):
+            self.decision = "reject"
+        elif np.all(self.outcomes == -1):
+            self.decision = "accept"
+        return self
+
+    def run(self, chunks):
+        """Consume blocks until the test decides or the stream ends"""
+        for chunk in chunks:
+            if self.update(chunk).decided:
+                break
+        return self
+
+def check_fairness(rolls, sides=6, bias=0.05, block_size=100, low=1):
+    """Fairness test of recorded rolls, read in blocks until it decides"""
+    blocks = (rolls[start:start + block_size] for start in range(0, len(rolls), block_size))
+    return SequentialTest.fairness(sides=sides, bias=bias, low=low).run(blocks)
+
+def fairness_verdict(test, total=None):
+    """Outcome of a fairness test, e.g. 'rejected fairness after 120 of 1000 rolls'"""
+    rolls = test.n_samples if total is None else f"{test.n_samples} of {total}"
+    return f"{FAIRNESS_VERDICTS[test.decision]} after {rolls} rolls"
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slide Server
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Long-lived local HTTP server that keeps numpy, scipy, matplotlib and the
+slide modules imported, and runs slides on request. Each response returns
+the console output of the slide and the figure files it produced.
+
+Endpoints (localhost only):
+  GET  /slides          - list of available slides
+  GET  /run?slide=3     - run a slide (optionally &sampling=sobol)
+  POST /run             - run a slide, JSON body {"slide": "3"}, optionally
+                          with "sampling": "sobol" for that run only
+  POST /shutdown        - stop the server
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+from common.capture import FDOutputCapture
+from common.display import enable_headless
+from common.qmc import SAMPLING_MODES, get_sampling_mode, set_sampling_mode
+from common.rendering import record_artifacts
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Console output kept per run; older lines of very verbose runs are dropped
+MAX_OUTPUT_BYTES = 1024 * 1024
+
+class SlideRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for slide run requests"""
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        if url.path == "/slides":
+            self._send_json(200, {"slides": self.server.slide_ids})
+        elif url.path == "/run":
+            query = urllib.parse.parse_qs(url.query)
+            self._run(query.get("slide", [None])[0], query.get("sampling", [None])[0])
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {url.path}"})
+
+    def do_POST(self):
+        url = urllib.parse.urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            self._send_json(400, {"error": f"Invalid JSON body: {e}"})
+            return
+
+        if url.path == "/run":
+            self._run(body.get("slide"), body.get("sampling"))
+        elif url.path == "/shutdown":
+            self._send_json(200, {"status": "shutting down"})
+            # shutdown() waits for serve_forever(), so it must run in another thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {url.path}"})
+
+    def _run(self, slide, sampling=None):
+        if slide is None:
+            self._send_json(400, {"error": "Missing slide number"})
+        elif str(slide) not in self.server.slide_ids:
+            self._send_json(404, {"error": f"Unknown slide: {slide}"})
+        elif sampling is not None and sampling not in SAMPLING_MODES:
+            self._send_json(400, {"error": f"Unknown sampling mode: {sampling}"})
+        else:
+            self._send_json(200, self.server.execute(str(slide), sampling))
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        """Keep the server console quiet; slide output is returned to the client"""
+        pass
+
+class SlideServer(HTTPServer):
+    """HTTP server that runs slides in a warm interpreter"""
+
+    def __init__(self, run_slide, slide_ids, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        super().__init__((host, port), SlideRequestHandler)
+        self.run_slide = run_slide
+        self.slide_ids = [str(slide) for slide in slide_ids]
+        # Slides share pyplot and numpy global state, so runs are serialized
+        self.run_lock = threading.Lock()
+
+    def warm_up(self, import_slide_module):
+        """Import the scientific stack and every slide module once"""
+        import numpy
+        import scipy.stats
+        import matplotlib.pyplot
+
+        loaded = []
+        for slide in self.slide_ids:
+            with FDOutputCapture(stderr=False, discard=("stdout",)):
+                if import_slide_module(slide) is not None:
+                    loaded.append(slide)
+        return loaded
+
+    def execute(self, slide, sampling=None):
+        """Run one slide and return its output and artifacts
+
+        sampling selects the sampling mode for this run only; the server's
+        own mode is restored afterwards.
+        """
+        import matplotlib.pyplot as plt
+
+        with self.run_lock:
+            server_sampling = get_sampling_mode()
+            start_time = time.perf_counter()
+            try:
+                set_sampling_mode(sampling or server_sampling)
+                with record_artifacts() as artifacts, FDOutputCapture(max_bytes=MAX_OUTPUT_BYTES) as capture:
+                    success = self.run_slide(slide)
+            finally:
+                set_sampling_mode(server_sampling)
+            elapsed = time.perf_counter() - start_time
+            plt.close('all')
+
+        return {
+            "slide": slide,
+            "sampling": sampling or server_sampling,
+            "success": bool(success),
+            "elapsed_seconds": round(elapsed, 4),
+            "artifacts": [str(path) for path in artifacts],
+            "output": capture.get_combined(),
+            "output_truncated": capture.truncated,
+        }
+
+def serve(run_slide, import_slide_module, slide_ids, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Start the slide server and block until it is shut down"""
+    enable_headless()
+    server = SlideServer(run_slide, slide_ids, host, port)
+    print("Warming up slide modules...")
+    loaded = server.warm_up(import_slide_module)
+    print(f"Loaded {len(loaded)} slide modules")
+    print(f"Slide server listening on http://{host}:{server.server_address[1]}")
+    print("Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping slide server...")
+    finally:
+        server.server_close()
+
+def request_slide(slide, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=300, sampling=None):
+    """Ask a running slide server to run a slide
+
+    sampling selects the sampling mode of the run (default: the server's).
+    Raises ConnectionError if no server is listening.
+    """
+    body = {"slide": str(slide)}
+    if sampling is not None:
+        body["sampling"] = sampling
+    data = json.dumps(body).encode("utf-8")
+    request = urllib.request.Request(
+        f"http://{host}:{port}/run", data=data,
+        headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except urllib.error.HTTPError as e:
+        return json.loads(e.read().decode("utf-8"))
+    except urllib.error.URLError as e:
+        raise ConnectionError(f"No slide server at http://{host}:{port} ({e.reason})")
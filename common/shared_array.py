@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared-Memory Sample Arrays
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+SharedArray copies a NumPy array (uniform_data, rolls, ...) once into a
+multiprocessing.shared_memory segment. Worker processes receive only a
+small picklable handle and attach() to the same buffer without copying.
+
+Lifecycle: the creating process owns the segment and unlinks it on
+close(), at the end of a with block, when the SharedArray is garbage
+collected, or at interpreter exit. If the owner crashes, the
+multiprocessing resource tracker unlinks the segment. Workers attach
+without registering the segment, so a worker that exits or crashes never
+removes memory that the owner still uses.
+"""
+
+import weakref
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """Picklable reference to a SharedArray for worker processes"""
+    name: str
+    shape: tuple
+    dtype: str
+
+    def attach(self, writable=False):
+        """Zero-copy view of the shared array (see attach())"""
+        return attach(self, writable)
+
+def _release(shm):
+    """Close and unlink an owned segment"""
+    try:
+        shm.close()
+    except BufferError:
+        # Views are still alive; the mapping goes away with the last of them
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+class SharedArray:
+    """NumPy array in a shared-memory segment owned by this process
+
+    Args:
+        shape: Shape of the array
+        dtype: Data type of the array
+
+    Use from_array() to share existing data. The array is available as
+    .array, and .handle is what to send to worker processes.
+    """
+
+    def __init__(self, shape, dtype=float):
+        shape = (int(shape),) if np.ndim(shape) == 0 else tuple(int(size) for size in shape)
+        dtype = np.dtype(dtype)
+        # Shared memory segments cannot be empty
+        nbytes = max(1, int(np.prod(shape)) * dtype.itemsize)
+        self._shm = SharedMemory(create=True, size=nbytes)
+        self._finalizer = weakref.finalize(self, _release, self._shm)
+        self.array = np.ndarray(shape, dtype, buffer=self._shm.buf)
+        self.handle = SharedArrayHandle(self._shm.name, shape, dtype.str)
+
+    @classmethod
+    def from_array(cls, data):
+        """Copy an array into a new shared segment"""
+        data = np.asarray(data)
+        shared = cls(data.shape, data.dtype)
+        shared.array[...] = data
+        return shared
+
+    @property
+    def name(self):
+        return self.handle.name
+
+    @property
+    def closed(self):
+        return not self._finalizer.alive
+
+    def __repr__(self):
+        state = "closed" if self.closed else "open"
+        return f"SharedArray({self.name}, shape={self.handle.shape}, dtype={self.handle.dtype}, {state})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the segment; workers must not attach to it afterwards"""
+        self.array = None
+        self._finalizer()
+
+# Segments attached by this process, so each worker maps a segment once
+_attached = {}
+
+def _attach_untracked(name):
+    """Open an existing segment without registering it for cleanup"""
+    try:
+        return SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        pass
+    # Older versions register every attachment, so the resource tracker of
+    # a spawned worker would unlink the owner's segment when the worker exits
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+def attach(handle, writable=False):
+    """Zero-copy view of a SharedArray from its handle
+
+    The view is read-only unless writable=True. Attachments are cached
+    per process until detach().
+    """
+    if handle.name not in _attached:
+        _attached[handle.name] = _attach_untracked(handle.name)
+    view = np.ndarray(handle.shape, np.dtype(handle.dtype), buffer=_attached[handle.name].buf)
+    view.flags.writeable = writable
+    return view
+
+def detach(handle):
+    """Drop this process's cached attachment to a segment"""
+    shm = _attached.pop(handle.name, None)
+    if shm is not None:
+        try:
+            shm.close()
+        except BufferError:
+            pass
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chunked Sample Streams
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Generators that yield samples in fixed-size chunks instead of allocating
+the whole output, and consumers (running moments, histograms, outcome
+counts) that update incrementally from each chunk and merge exactly
+with partial results computed elsewhere. Memory stays at a few
+chunks regardless of the sample size, so 10^10 draws run in a 64 MB
+working set and are limited only by time.
+
+rng may be a Generator, a RandomState or a seed (see
+common.sampling.random_source). With rng=None the global NumPy random
+state is used, and drawing in chunks gives exactly the same numbers as
+one large call after the same np.random.seed(). In a low-discrepancy sampling mode (common.qmc) the
+uniform-driven streams yield consecutive points of one scrambled
+sequence instead.
+"""
+
+import numpy as np
+
+from common.qmc import get_sampling_mode, next_points, qmc_engine
+from common.sampling import random_source
+
+# Samples per chunk: 2^21 float64 values = 16 MB
+DEFAULT_CHUNK_SIZE = 1 << 21
+
+def chunk_sizes(n, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Sizes of the chunks that make up n samples"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    full, rest = divmod(int(n), int(chunk_size))
+    for _ in range(full):
+        yield chunk_size
+    if rest:
+        yield rest
+
+def uniform_chunks(low=0.0, high=1.0, n=1000, chunk_size=DEFAULT_CHUNK_SIZE, rng=None):
+    """Yield n uniform samples on [low, high) in chunks"""
+    mode = get_sampling_mode()
+    if mode != "random":
+        engine = qmc_engine(1, mode, rng)
+        for size in chunk_sizes(n, chunk_size):
+            yield low + (high - low) * next_points(engine, size)[:, 0]
+        return
+    source = random_source(rng)
+    for size in chunk_sizes(n, chunk_size):
+        yield source.uniform(low, high, size)
+
+def normal_chunks(mean=0.0, std=1.0, n=1000, chunk_size=DEFAULT_CHUNK_SIZE, rng=None):
+    """Yield n normal samples in chunks"""
+    source = random_source(rng)
+    for size in chunk_sizes(n, chunk_size):
+        yield source.normal(mean, std, size)
+
+def dice_chunks(n=1000, sides=6, chunk_size=DEFAULT_CHUNK_SIZE, rng=None):
+    """Yield n fair dice rolls in chunks"""
+    source = random_source(rng)
+    draw = source.integers if isinstance(source, np.random.Generator) else source.randint
+    for size in chunk_sizes(n, chunk_size):
+        yield draw(1, sides + 1, size)
+
+def coin_flip_chunks(n_trials, p_success, n_experiments=1000, chunk_size=DEFAULT_CHUNK_SIZE, rng=None):
+    """Yield the number of successes of n_experiments binomial experiments in chunks
+
+    Each chunk holds about chunk_size coin flips, i.e. chunk_size // n_trials
+    experiments. When a single experiment has more than chunk_size flips,
+    success counts are drawn directly from B(n_trials, p_success) instead.
+    """
+    source = random_source(rng)
+    if n_trials > chunk_size:
+        for size in chunk_sizes(n_experiments, chunk_size):
+            yield source.binomial(n_trials, p_success, size)
+        return
+    mode = get_sampling_mode()
+    if mode != "random":
+        # Each experiment is one n_trials-dimensional point
+        engine = qmc_engine(max(1, n_trials), mode, rng)
+        def uniform(shape):
+            return next_points(engine, shape[0])[:, :n_trials]
+    elif isinstance(source, np.random.Generator):
+        uniform = source.random
+    else:
+        uniform = source.random_sample
+    experiments_per_chunk = max(1, chunk_size // max(1, n_trials))
+    for size in chunk_sizes(n_experiments, experiments_per_chunk):
+        flips = uniform((size, n_trials)) < p_success
+        yield np.count_nonzero(flips, axis=1)
+
+class RunningStats:
+    """Count, mean, variance, minimum and maximum updated chunk by chunk
+
+    Chunks are merged with Chan's parallel formula, which is as accurate
+    as computing the moments over all samples at once.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, chunk):
+        """Add a chunk of samples"""
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        size = len(chunk)
+        if size == 0:
+            return self
+        chunk_mean = chunk.mean()
+        deviations = chunk - chunk_mean
+        self._combine(size, chunk_mean, np.dot(deviations, deviations),
+                      float(chunk.min()), float(chunk.max()))
+        return self
+
+    def merge(self, other):
+        """Add the samples summarized by another RunningStats"""
+        if other.count:
+            self._combine(other.count, other.mean, other._m2, other.min, other.max)
+        return self
+
+    def _combine(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    def variance(self, ddof=0):
+        """Variance (ddof=1 for the sample variance)"""
+        if self.count <= ddof:
+            return np.nan
+        return self._m2 / (self.count - ddof)
+
+    def std(self, ddof=0):
+        """Standard deviation"""
+        return float(np.sqrt(self.variance(ddof)))
+
+class StreamingHistogram:
+    """Histogram with fixed equal-width bins updated chunk by chunk
+
+    Values outside range are counted in `outside` instead of a bin.
+    """
+
+    def __init__(self, bins, range):
+        self.edges = np.linspace(range[0], range[1], bins + 1)
+        self.range = (float(range[0]), float(range[1]))
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.outside = 0
+
+    def update(self, chunk):
+        """Add a chunk of samples"""
+        counts, _ = np.histogram(chunk, bins=len(self.counts), range=self.range)
+        self.counts += counts
+        self.outside += np.size(chunk) - int(counts.sum())
+        return self
+
+    def merge(self, other):
+        """Add the counts of another histogram with the same bins"""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Histograms must have the same bins to merge")
+        self.counts += other.counts
+        self.outside += other.outside
+        return self
+
+    def density(self):
+        """Counts normalized like np.histogram(..., density=True)"""
+        total = self.counts.sum()
+        return self.counts / (total * np.diff(self.edges)) if total else np.zeros(len(self.counts))
+
+class OutcomeCounts:
+    """Counts of integer outcomes low..high (e.g. dice faces) updated chunk by chunk"""
+
+    def __init__(self, low, high):
+        self.low = low
+        self.outcomes = np.arange(low, high + 1)
+        self.counts = np.zeros(len(self.outcomes), dtype=np.int64)
+
+    def update(self, chunk):
+        """Add a chunk of outcomes"""
+        chunk = np.asarray(chunk).ravel() - self.low
+        if len(chunk) and (chunk.min() < 0 or chunk.max() >= len(self.counts)):
+            raise ValueError(f"Outcomes must lie in [{self.low}, {self.outcomes[-1]}]")
+        self.counts += np.bincount(chunk, minlength=len(self.counts))
+        return self
+
+    def merge(self, other):
+        """Add the counts of another OutcomeCounts over the same outcomes"""
+        if not np.array_equal(self.outcomes, other.outcomes):
+            raise ValueError("Outcome counts must cover the same outcomes to merge")
+        self.counts += other.counts
+        return self
+
+    def frequencies(self):
+        """Relative frequency of each outcome"""
+        total = self.counts.sum()
+        return self.counts / total if total else np.zeros(len(self.counts))
+
+def consume(chunks, *consumers):
+    """Feed every chunk to every consumer; returns the number of samples"""
+    total = 0
+    for chunk in chunks:
+        for consumer in consumers:
+            consumer.update(chunk)
+        total += np.size(chunk)
+    return total
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Slide Watcher
+
+Based on: Jon Krohn's Machine Learning Foundations series
+Lecturer: Dr. Yoram Segal
+
+Polls the slide*/ packages for modified Python files and reports which
+slides changed, so only those slides are re-imported and re-rendered.
+"""
+
+import re
+import time
+from pathlib import Path
+
+# Seconds between two scans of the slide directories
+DEFAULT_POLL_INTERVAL = 0.25
+
+def slide_id_from_dir(dir_name):
+    """Convert a slide directory name to its slide number (slide01a -> 1a, slide03 -> 3)"""
+    match = re.fullmatch(r"slide0*(\d+[a-z]?)", dir_name)
+    return match.group(1) if match else None
+
+def _slide_sort_key(slide):
+    """Sort slide numbers numerically (2a before 10)"""
+    return int(re.match(r"\d+", slide).group()), slide
+
+class SlideWatcher:
+    """Detect changed slide packages by polling file modification times"""
+
+    def __init__(self, root, interval=DEFAULT_POLL_INTERVAL):
+        self.root = Path(root)
+        self.interval = interval
+        self._mtimes = self.snapshot()
+
+    def snapshot(self):
+        """Return the modification time of every Python file in the slide packages"""
+        mtimes = {}
+        for path in self.root.glob("slide*/*.py"):
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                # File removed between glob and stat
+                continue
+        return mtimes
+
+    def poll(self):
+        """Return the sorted slide numbers changed since the last poll"""
+        current = self.snapshot()
+        changed_paths = {
+            path for path in current.keys() | self._mtimes.keys()
+            if current.get(path) != self._mtimes.get(path)
+        }
+        self._mtimes = current
+
+        slides = {slide_id_from_dir(path.parent.name) for path in changed_paths}
+        slides.discard(None)
+        return sorted(slides, key=_slide_sort_key)
+
+    def watch(self, on_change):
+        """Call on_change(slide) for each changed slide until interrupted"""
+        try:
+            while True:
+                time.sleep(self.interval)
+                changed = self.poll()
+                if not changed:
+                    continue
+                # Editors often save in several steps; let the writes settle
+                time.sleep(self.interval)
+                changed = sorted(set(changed) | set(self.poll()), key=_slide_sort_key)
+                for slide in changed:
+                    on_change(slide)
+        except KeyboardInterrupt:
+            print("\nStopping slide watcher...")
@@ -14,6 +14,7 @@ Date: September 2025
 import sys
 import os
 import argparse
+import json
 from pathlib import Path
 from datetime import datetime
 import pytz
@@ -26,6 +27,38 @@ __build_date__ = "2025-09-14"
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from common.rendering import (RENDER_PROFILES, OUTPUT_FORMATS, set_render_profile,
+                              set_output_format, set_output_dir, get_output_format,
+                              get_output_dir, multipage_pdf)
+from common.display import is_headless, enable_headless
+from common.server import DEFAULT_PORT
+from common.qmc import SAMPLING_MODES, set_sampling_mode
+
+# Slides and their titles, in the order --list shows and --all runs them
+SLIDE_TITLES = {
+    '1': "Introduction to Probability",
+    '1a': "Basic Probability Concepts",
+    '1b': "Frequencies from Simulation",
+    '1c': "Histogram of 1000 Rolls",
+    '2': "Uniform Distribution",
+    '2a': "Uniform Distribution - Basic Concepts",
+    '2b': "Histogram of Uniform Distribution",
+    '2c': "Q-Q Plot - Uniform Distribution Test",
+    '2d': "Box Plot - How to Read Box Plots",
+    '2e': "Cumulative Distribution Function (CDF)",
+    '3': "Normal Distribution",
+    '4': "Binomial Distribution",
+    '5': "Poisson Distribution",
+    '6': "Measures of Central Tendency",
+    '7': "Measures of Dispersion",
+    '8': "Correlation and Correlation Matrix",
+    '9': "Shannon Entropy",
+    '10': "KL Divergence and Cross-Entropy",
+}
+
+# Slides that can be run with --slide
+SLIDE_IDS = list(SLIDE_TITLES)
+
 # Suppress matplotlib warnings
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="matplotlib")
@@ -47,17 +80,19 @@ def print_header():
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 70)
 
+def get_slide_module_name(slide_number):
+    """Get the package directory and module name of a slide"""
+    # Handle special cases for split slides
+    if slide_number in ["1a", "1b", "1c", "2a", "2b", "2c", "2d", "2e"]:
+        slide_dir = f"slide0{slide_number}"
+    else:
+        slide_dir = f"slide{int(slide_number):02d}"
+    return slide_dir, f"{slide_dir}.{slide_dir}_main"
+
 def import_slide_module(slide_number):
     """Import slide module by number"""
     try:
-        # Handle special cases for split slides
-        if slide_number in ["1a", "1b", "1c", "2a", "2b", "2c", "2d", "2e"]:
-            slide_dir = f"slide0{slide_number}"
-            module_name = f"{slide_dir}.{slide_dir}_main"
-        else:
-            slide_dir = f"slide{int(slide_number):02d}"
-            module_name = f"{slide_dir}.{slide_dir}_main"
-        
+        slide_dir, module_name = get_slide_module_name(slide_number)
         module = __import__(module_name, fromlist=[slide_dir])
         return module
     except ImportError as e:
@@ -65,11 +100,17 @@ def import_slide_module(slide_number):
         return None
 
 def run_slide(slide_number):
-    """Run specific slide"""
+    """Run specific slide
+
+    Returns True if the slide completed without errors.
+    """
     print(f"Running slide {slide_number}...")
     print("=" * 50)
-    print("NOTE: Graphs will open in separate windows.")
-    print("      Close graph windows to continue execution.")
+    if is_headless():
+        print("NOTE: Headless mode - graphs are saved but not displayed.")
+    else:
+        print("NOTE: Graphs will open in separate windows.")
+        print("      Close graph windows to continue execution.")
     print("=" * 50)
     
     module = import_slide_module(slide_number)
@@ -87,55 +128,176 @@ def run_slide(slide_number):
                 print(f"No main function found for slide {slide_number}")
                 
             print(f"\nSlide {slide_number} completed successfully!")
-            print("If graph windows are still open, please close them to continue.")
+            if not is_headless():
+                print("If graph windows are still open, please close them to continue.")
+            return True
         except Exception as e:
             print(f"Error running slide {slide_number}: {e}")
             import traceback
             traceback.print_exc()
     else:
         print(f"Module not found for slide {slide_number}")
+    return False
+
+def run_slide_remote(slide_number, port=DEFAULT_PORT, sampling=None):
+    """Run a slide on a running slide server, in the given sampling mode"""
+    from common.server import request_slide
+    
+    try:
+        result = request_slide(slide_number, port=port, sampling=sampling)
+    except ConnectionError as e:
+        print(f"Error: {e}")
+        print("Start the server first with: python main.py --serve")
+        return False
+    
+    if "error" in result:
+        print(f"Error: {result['error']}")
+        return False
+    
+    if result.get("output_truncated"):
+        print("[Output truncated - showing the most recent lines only]")
+    print(result["output"], end="")
+    print("-" * 50)
+    print(f"Server run time: {result['elapsed_seconds']:.3f} seconds")
+    for artifact in result["artifacts"]:
+        print(f"Artifact: {artifact}")
+    return result["success"]
+
+def get_slide_result(slide_number):
+    """Run a slide in quiet mode and return its SlideResult"""
+    module = import_slide_module(slide_number)
+    if module is None:
+        raise ImportError(f"Module not found for slide {slide_number}")
+    return module.main(quiet=True)
+
+def print_slide_results(slide_numbers):
+    """Print quiet-mode results as JSON: one object for one slide, a list otherwise"""
+    results = [get_slide_result(slide_number).to_dict() for slide_number in slide_numbers]
+    output = results[0] if len(results) == 1 else results
+    print(json.dumps(output, indent=2, ensure_ascii=False))
+
+def export_slide_results(export_path, slide_numbers):
+    """Run slides in quiet mode and export their numeric results
+
+    Returns True if the export file was written.
+    """
+    from common.export import export_results
+    
+    print(f"Exporting results of {len(slide_numbers)} slide(s) to {export_path}...")
+    start_time = datetime.now()
+    try:
+        results = [get_slide_result(slide_number) for slide_number in slide_numbers]
+        n_values = export_results(results, export_path)
+    except (ImportError, ValueError, OSError) as e:
+        print(f"Error: {e}")
+        return False
+    
+    elapsed = (datetime.now() - start_time).total_seconds()
+    print(f"Exported {n_values} values in {elapsed:.2f} seconds")
+    return True
+
+def parse_slide_list(value):
+    """Parse a comma-separated --slides value such as 1a,2b,4"""
+    slide_numbers = [item.strip() for item in value.split(',') if item.strip()]
+    unknown = [item for item in slide_numbers if item not in SLIDE_IDS]
+    if unknown or not slide_numbers:
+        raise argparse.ArgumentTypeError(
+            f"invalid slide(s): {', '.join(unknown) or value!r} (choose from {', '.join(SLIDE_IDS)})")
+    return slide_numbers
+
+def serve_slides(port=DEFAULT_PORT):
+    """Start the long-lived slide server"""
+    from common.server import serve
+    serve(run_slide, import_slide_module, SLIDE_IDS, port=port)
+
+def reload_slide_module(slide_number):
+    """Re-import a slide module so edits to its source take effect
+
+    Helper modules in the slide's directory are re-imported as well, so
+    edits to them are picked up, not just edits to the *_main module.
+    """
+    import importlib
+    
+    slide_dir, _ = get_slide_module_name(slide_number)
+    try:
+        for name in [name for name in sys.modules if name.startswith(f"{slide_dir}.")]:
+            del sys.modules[name]
+        importlib.invalidate_caches()
+        return import_slide_module(slide_number)
+    except Exception as e:
+        # Syntax errors while editing must not stop the watcher
+        print(f"Error reloading slide {slide_number}: {e}")
+        return None
+
+def watch_slides():
+    """Re-run each slide as soon as its source files change"""
+    import time
+    from common.rendering import record_artifacts
+    from common.watcher import SlideWatcher
+    import matplotlib.pyplot as plt
+    
+    enable_headless()
+    watcher = SlideWatcher(project_root)
+    print("Watching slide*/ for changes (Ctrl+C to stop)...")
+    print("Only changed slides are re-rendered; other figures are kept as they are.")
+    
+    def rerun(slide_number):
+        start_time = time.perf_counter()
+        print(f"\n{'='*20} Change detected in slide {slide_number} {'='*20}")
+        if reload_slide_module(slide_number) is None:
+            return
+        with record_artifacts() as artifacts:
+            run_slide(slide_number)
+        plt.close('all')
+        for artifact in artifacts:
+            print(f"Updated: {artifact}")
+        print(f"Re-rendered slide {slide_number} in {time.perf_counter() - start_time:.2f} seconds")
+    
+    watcher.watch(rerun)
 
 def run_all_slides():
     """Run all slides"""
     print("Running all slides...")
     print("=" * 60)
-    print("IMPORTANT: Each slide will open graph windows.")
-    print("           Close each graph window to proceed to the next slide.")
+    if is_headless():
+        print("IMPORTANT: Headless mode - no graph windows or browser will open.")
+    else:
+        print("IMPORTANT: Each slide will open graph windows.")
+        print("           Close each graph window to proceed to the next slide.")
     print("=" * 60)
     
-    for slide_num in range(1, 11):
+    # PDF output of a full run goes into a single multipage document
+    if get_output_format() == "pdf":
+        pdf_path = (get_output_dir() or project_root) / "all_slides.pdf"
+        with multipage_pdf(pdf_path):
+            _run_slide_sequence()
+        print(f"All figures saved to: {pdf_path}")
+    else:
+        _run_slide_sequence()
+
+def _run_slide_sequence():
+    """Run every slide one after another"""
+    for slide_num in SLIDE_IDS:
         print(f"\n{'='*20} Slide {slide_num} {'='*20}")
         run_slide(slide_num)
         print("\n" + "="*60)
 
 def list_slides():
     """Display list of available slides"""
-    slides_info = [
-        ("1a", "Basic Probability Concepts"),
-        ("1b", "Frequencies from Simulation"),
-        ("1c", "Histogram of 1000 Rolls"),
-        ("2a", "Uniform Distribution - Basic Concepts"),
-        ("2b", "Histogram of Uniform Distribution"),
-        ("2c", "Q-Q Plot - Uniform Distribution Test"),
-        ("2d", "Box Plot - How to Read Box Plots"),
-        ("2e", "Cumulative Distribution Function (CDF)"),
-        (3, "Normal Distribution"),
-        (4, "Binomial Distribution"),
-        (5, "Poisson Distribution"),
-        (6, "Measures of Central Tendency"),
-        (7, "Measures of Dispersion"),
-        (8, "Correlation and Correlation Matrix"),
-        (9, "Shannon Entropy"),
-        (10, "KL Divergence and Cross-Entropy")
-    ]
-    
     print("Available Slides:")
     print("-" * 40)
-    for num, title in slides_info:
-        print(f"{str(num):>3}. {title}")
+    for slide_number in SLIDE_IDS:
+        print(f"{slide_number:>3}. {SLIDE_TITLES[slide_number]}")
 
-def run_tests():
-    """Run all tests including advanced output validation tests"""
+def run_tests(jobs=None):
+    """Run all tests including advanced output validation tests
+
+    With jobs, the whole tests/ directory is collected once and run
+    in-process across that many workers.
+    """
+    if jobs is not None:
+        return run_tests_parallel(jobs)
+    
     print("Running tests...")
     print("NOTE: Tests may open graph windows briefly.")
     print("      These will close automatically.")
@@ -176,14 +338,12 @@ def run_tests():
                 print(f"⚠️  {test_file} - NOT FOUND")
         
         # Check for error logs
-        logs_dir = Path("tests/logs")
-        if logs_dir.exists():
-            error_logs = list(logs_dir.glob("LOG_ERROR_*.json"))
-            if error_logs:
-                print(f"\n⚠️  Found {len(error_logs)} error log(s):")
-                for log_file in error_logs:
-                    print(f"   - {log_file}")
-                print("   Check these files for detailed error information.")
+        summary = load_error_summary()
+        error_count = sum(entry["count"] for error_types in summary.values()
+                          for entry in error_types.values())
+        if error_count:
+            print(f"\n⚠️  Found {error_count} logged error(s) in tests/logs/errors.jsonl")
+            print("   Run 'python main.py --errors' for a summary.")
         
         if all_passed:
             print("\n🎉 All tests passed successfully!")
@@ -209,6 +369,40 @@ def run_tests():
         
         return result.returncode == 0
 
+def run_tests_parallel(jobs):
+    """Run the whole test suite across worker processes"""
+    from tests.parallel_runner import run_parallel
+    
+    print("Running tests in parallel...")
+    print("=" * 50)
+    return run_parallel(["tests"], jobs=jobs or None, rootdir=project_root)
+
+def load_error_summary():
+    """Summarize the test error log by test and error type"""
+    from tests.test_utils import summarize_errors
+    return summarize_errors(project_root / "tests" / "logs")
+
+def show_errors():
+    """Print the current test failures recorded in the error log"""
+    summary = load_error_summary()
+    print("Logged test errors:")
+    print("-" * 70)
+    if not summary:
+        print("No errors logged.")
+        return
+    
+    print(f"{'Test':<25} {'Error type':<30} {'Count':>5}  Last seen")
+    print("-" * 70)
+    for test_name in sorted(summary):
+        for error_type, entry in sorted(summary[test_name].items()):
+            print(f"{test_name:<25} {error_type:<30} {entry['count']:>5}  {entry['last_seen'][:19]}")
+    
+    # Performance regressions are easy to miss among output mismatches
+    slow_tests = [test_name for test_name, error_types in summary.items()
+                  if any(error_type.startswith("PERFORMANCE") for error_type in error_types)]
+    if slow_tests:
+        print(f"\n⚠️  Performance failures in: {', '.join(sorted(slow_tests))}")
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -220,12 +414,24 @@ Usage Examples:
   python main.py --slide 3              # Run slide 3
   python main.py --all                  # Run all slides
   python main.py --test                 # Run tests
+  python main.py --all --profile draft  # Fast low-resolution render of all slides
+  python main.py --all --format pdf     # All figures in one multipage PDF
+  python main.py --slide 3 --format svg --output-dir build/figures
+  python main.py --all --headless       # Batch run without windows or browser
+  python main.py --serve                # Start the warm slide server
+  python main.py --slide 3 --remote     # Run slide 3 on the slide server
+  python main.py --watch --profile draft  # Re-render slides as they are edited
+  python main.py --test --jobs 4        # Run tests on 4 parallel workers
+  python main.py --errors               # Summarize logged test errors
+  python main.py --slide 4 --json       # Slide 4 results as JSON, without plots
+  python main.py --export results.parquet --slides 2b,2c,4  # Numeric results as a table
+  python main.py --slide 2e --sampling sobol  # Low-discrepancy instead of random uniforms
         """
     )
     
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument('--slide', '-s', type=str, 
-                      choices=['1a', '1b', '1c', '2a', '2b', '2c', '2d', '2e', '3', '4', '5', '6', '7', '8', '9', '10'],
+                      choices=SLIDE_IDS,
                       help='Slide number to run (1a-1c, 2a-2e, 3-10)')
     group.add_argument('--all', '-a', action='store_true',
                       help='Run all slides')
@@ -233,19 +439,84 @@ Usage Examples:
                       help='Show list of slides')
     group.add_argument('--test', '-t', action='store_true',
                       help='Run tests')
+    group.add_argument('--serve', action='store_true',
+                      help='Start a slide server that keeps all modules loaded')
+    group.add_argument('--watch', '-w', action='store_true',
+                      help='Re-run slides whenever their source files change')
+    group.add_argument('--errors', '-e', action='store_true',
+                      help='Summarize errors logged by the tests')
+    group.add_argument('--export', type=str, metavar='PATH',
+                      help='Export numeric slide results to a .parquet or .json file')
+    parser.add_argument('--profile', '-p', choices=list(RENDER_PROFILES),
+                        help='Render profile for saved figures (draft, preview, print)')
+    parser.add_argument('--format', '-f', choices=list(OUTPUT_FORMATS),
+                        help='File format for saved figures (default: png)')
+    parser.add_argument('--output-dir', '-o', type=str,
+                        help='Directory for saved figures (default: next to each slide)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Never open graph windows or the browser (also PROB_HEADLESS=1)')
+    parser.add_argument('--remote', action='store_true',
+                        help='Run --slide on a running slide server')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'Slide server port (default: {DEFAULT_PORT})')
+    parser.add_argument('--jobs', '-j', type=int,
+                        help='Run --test on N parallel workers (0 = one per CPU)')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the results of --slide or --all as JSON instead of running the demo')
+    parser.add_argument('--slides', type=parse_slide_list, metavar='LIST',
+                        help='Comma-separated slides for --export (default: all)')
+    parser.add_argument('--sampling', choices=list(SAMPLING_MODES),
+                        help='Source of uniform samples (random, sobol, halton; default: random)')
     
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive number")
+    if args.jobs is not None and not args.test:
+        parser.error("--jobs can only be used with --test")
+    if args.remote and not args.slide:
+        parser.error("--remote can only be used with --slide")
+    if args.json and not (args.slide or args.all):
+        parser.error("--json can only be used with --slide or --all")
+    if args.slides and not args.export:
+        parser.error("--slides can only be used with --export")
+    if args.sampling:
+        set_sampling_mode(args.sampling)
+    
+    if args.json:
+        print_slide_results([args.slide] if args.slide else SLIDE_IDS)
+        return
+    
+    if args.headless:
+        enable_headless()
+    if args.profile:
+        set_render_profile(args.profile)
+    if args.format:
+        set_output_format(args.format)
+    if args.output_dir:
+        set_output_dir(args.output_dir)
     
     print_header()
     
     if args.list:
         list_slides()
+    elif args.slide and args.remote:
+        success = run_slide_remote(args.slide, args.port, args.sampling)
+        sys.exit(0 if success else 1)
     elif args.slide:
         run_slide(args.slide)
     elif args.all:
         run_all_slides()
     elif args.test:
-        success = run_tests()
+        success = run_tests(args.jobs)
+        sys.exit(0 if success else 1)
+    elif args.serve:
+        serve_slides(args.port)
+    elif args.watch:
+        watch_slides()
+    elif args.errors:
+        show_errors()
+    elif args.export:
+        success = export_slide_results(args.export, args.slides or SLIDE_IDS)
         sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
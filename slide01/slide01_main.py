@@ -12,11 +12,24 @@ Python code for basic probability calculations and dice roll visualization
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-import webbrowser
 import os
 import sys
+from functools import partial
 from pathlib import Path
 
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
+from common.discrete import DiscreteDistribution
+from common.streaming import DEFAULT_CHUNK_SIZE, dice_chunks
+from common.montecarlo import dice_rolls
+from common.adaptive import run_until_precise
+
 # Suppress matplotlib warnings including font warnings
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="matplotlib")
@@ -27,14 +40,17 @@ warnings.filterwarnings("ignore", message="findfont: Font family.*not found")
 plt.rcParams['font.family'] = ['sans-serif']
 plt.rcParams['axes.unicode_minus'] = False
 
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
+
 def show_slide():
     """Display HTML slide"""
     slide_path = Path(__file__).parent / "slide1.html"
     if slide_path.exists():
         try:
             # Try to open with default browser
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         except Exception as e:
             print(f"Could not open slide automatically: {e}")
             print(f"Please open manually: {slide_path.absolute()}")
@@ -44,33 +60,38 @@ def show_slide():
         for file in Path(__file__).parent.glob("*.html"):
             print(f"  - {file.name}")
 
-def calculate_dice_probabilities():
-    """Calculate probabilities for fair dice roll"""
-    print("=== Dice Probability Calculations ===")
-    
+def dice_probabilities():
+    """Probabilities of a fair dice roll and of some combined events"""
     # Define possible outcomes
     outcomes = ['1', '2', '3', '4', '5', '6']
     
     # Calculate probability for each outcome
     probability = 1 / len(outcomes)
-    print(f"Probability for each outcome: {probability:.3f}")
     
-    # Probability of getting even number
+    # Even, odd and greater than 4
     even_outcomes = ['2', '4', '6']
-    prob_even = len(even_outcomes) / len(outcomes)
-    print(f"Probability of even number: {prob_even:.3f}")
-    
-    # Probability of getting odd number
     odd_outcomes = ['1', '3', '5']
-    prob_odd = len(odd_outcomes) / len(outcomes)
-    print(f"Probability of odd number: {prob_odd:.3f}")
-    
-    # Probability of getting number greater than 4
     high_outcomes = ['5', '6']
-    prob_high = len(high_outcomes) / len(outcomes)
-    print(f"Probability of number > 4: {prob_high:.3f}")
     
-    return outcomes, [probability] * len(outcomes)
+    return {
+        'outcomes': outcomes,
+        'probabilities': [probability] * len(outcomes),
+        'prob_even': len(even_outcomes) / len(outcomes),
+        'prob_odd': len(odd_outcomes) / len(outcomes),
+        'prob_greater_than_4': len(high_outcomes) / len(outcomes)
+    }
+
+def calculate_dice_probabilities():
+    """Calculate probabilities for fair dice roll"""
+    dice = dice_probabilities()
+    
+    print("=== Dice Probability Calculations ===")
+    print(f"Probability for each outcome: {dice['probabilities'][0]:.3f}")
+    print(f"Probability of even number: {dice['prob_even']:.3f}")
+    print(f"Probability of odd number: {dice['prob_odd']:.3f}")
+    print(f"Probability of number > 4: {dice['prob_greater_than_4']:.3f}")
+    
+    return dice['outcomes'], dice['probabilities']
 
 def create_dice_visualization():
     """Create visualization of dice probabilities"""
@@ -102,24 +123,34 @@ def create_dice_visualization():
     
     # Save the plot
     output_path = Path(__file__).parent / "dice_probability_chart.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = save_figure(output_path)
     print(f"Chart saved to: {output_path}")
     
-    plt.show()
+    show_figure()
     
     return plt.gcf()
 
+def simulate_dice_rolls_chunks(n_rolls=1000, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Streaming counterpart of roll_dice: yields the same rolls in chunks"""
+    np.random.seed(42)  # Same seed, so the chunks concatenate to the batch rolls
+    yield from dice_chunks(n_rolls, chunk_size=chunk_size)
+
+def roll_dice(n_rolls=1000):
+    """Simulated dice rolls and the frequency of each outcome"""
+    np.random.seed(42)  # For consistent results
+    rolls = np.random.randint(1, 7, n_rolls)
+    
+    # Calculate frequencies
+    _, counts = np.unique(rolls, return_counts=True)
+    return rolls, counts / n_rolls
+
 def simulate_dice_rolls(n_rolls=1000):
     """Simulate dice rolls"""
     print(f"\n=== Simulation of {n_rolls} Dice Rolls ===")
     
     # Run simulation
-    np.random.seed(42)  # For consistent results
-    rolls = np.random.randint(1, 7, n_rolls)
-    
-    # Calculate frequencies
-    unique, counts = np.unique(rolls, return_counts=True)
-    frequencies = counts / n_rolls
+    rolls, frequencies = roll_dice(n_rolls)
+    unique = np.unique(rolls)
     
     print("Simulation Results:")
     for outcome, freq in zip(unique, frequencies):
@@ -150,30 +181,48 @@ def simulate_dice_rolls(n_rolls=1000):
     
     # Save the plot
     output_path = Path(__file__).parent / "dice_simulation.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = save_figure(output_path)
     print(f"Simulation plot saved to: {output_path}")
     
-    plt.show()
+    show_figure()
     
     return rolls, frequencies
 
-def probability_rules_examples():
-    """Examples of probability rules"""
-    print("\n=== Basic Probability Rules ===")
+def probability_rules():
+    """Probabilities from the basic probability rules"""
+    die = DiscreteDistribution.die(6)
+    even = die.event(lambda x: x % 2 == 0)
+    six = die.event([6])
     
     # Addition rule (mutually exclusive events)
-    prob_even = 3/6  # Even
-    prob_odd = 3/6   # Odd
+    prob_even = die.prob(even)
+    prob_odd = die.prob(~even)
     prob_all = prob_even + prob_odd
-    print(f"P(even) + P(odd) = {prob_even:.3f} + {prob_odd:.3f} = {prob_all:.3f}")
     
     # Complement probability
-    prob_not_six = 1 - (1/6)
-    print(f"P(not 6) = 1 - P(6) = 1 - {1/6:.3f} = {prob_not_six:.3f}")
+    prob_not_six = die.prob(~six)
     
     # Conditional probability (given the outcome is even)
-    prob_six_given_even = 1/3  # Out of 3 even numbers, one is 6
-    print(f"P(6|even) = {prob_six_given_even:.3f}")
+    prob_six_given_even = die.conditional_prob(six, even)  # Out of 3 even numbers, one is 6
+    
+    return {
+        'prob_even': prob_even,
+        'prob_odd': prob_odd,
+        'prob_even_or_odd': prob_all,
+        'prob_not_six': prob_not_six,
+        'prob_six_given_even': prob_six_given_even
+    }
+
+def probability_rules_examples():
+    """Examples of probability rules"""
+    rules = probability_rules()
+    
+    print("\n=== Basic Probability Rules ===")
+    print(f"P(even) + P(odd) = {rules['prob_even']:.3f} + {rules['prob_odd']:.3f} = {rules['prob_even_or_odd']:.3f}")
+    print(f"P(not 6) = 1 - P(6) = 1 - {1/6:.3f} = {rules['prob_not_six']:.3f}")
+    print(f"P(6|even) = {rules['prob_six_given_even']:.3f}")
+    
+    return rules
 
 def interactive_menu():
     """Interactive menu"""
@@ -209,8 +258,33 @@ def interactive_menu():
         else:
             print("Invalid choice. Please try again.")
 
-def main():
-    """Main function"""
+def simulate_dice_to_precision(half_width=0.01, seed=42):
+    """Face frequencies from just enough rolls for 95% intervals of ±half_width"""
+    return run_until_precise(partial(dice_rolls, sides=6), half_width=half_width,
+                             statistic=lambda rolls: rolls[:, None] == np.arange(1, 7), seed=seed)
+
+def compute_results(n_rolls=1000):
+    """Compute the slide data without printing or plotting"""
+    dice = dice_probabilities()
+    rolls, frequencies = roll_dice(n_rolls)
+    
+    result = SlideResult(slide="1", title="Introduction to Probability")
+    result.add_table("theoretical", outcome=[int(o) for o in dice['outcomes']],
+                     probability=dice['probabilities'])
+    result.add_table("simulation", outcome=np.unique(rolls), frequency=frequencies)
+    result.add_metrics(n_rolls=n_rolls, prob_greater_than_4=dice['prob_greater_than_4'],
+                       **probability_rules())
+    result.add_metrics(rolls_for_precision_0_01=simulate_dice_to_precision().n_samples)
+    return result
+
+def main(quiet=False):
+    """Main function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 1: Introduction to Probability")
     print("Based on: Jon Krohn's Machine Learning Foundations series")
     print("Lecturer: Dr. Yoram Segal")
@@ -225,6 +299,10 @@ def main():
     # Run simulation
     simulate_dice_rolls(1000)
     
+    # Let the required precision decide the number of rolls
+    adaptive = simulate_dice_to_precision()
+    print(f"Rolls needed for every frequency within ±0.01 (95% confidence): {adaptive.n_samples:,}")
+    
     # Probability rules examples
     probability_rules_examples()
     
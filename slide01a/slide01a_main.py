@@ -10,8 +10,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import warnings
+import sys
 from pathlib import Path
-import webbrowser
+
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
+from common.events import SampleSpace
 
 # Configure matplotlib to completely suppress font warnings
 import logging
@@ -30,43 +40,59 @@ warnings.filterwarnings("ignore")
 import matplotlib.pyplot as plt
 plt.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['DejaVu Sans']})
 
-# Set non-interactive backend if running in test environment
-if 'pytest' in str(Path(__file__).parent):
-    matplotlib.use('Agg')
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
 
 def show_slide():
     """Open the HTML slide in browser"""
     try:
         slide_path = Path(__file__).parent / "slide1a.html"
         if slide_path.exists():
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         else:
             print(f"HTML slide not found: {slide_path}")
     except Exception as e:
         print(f"Error opening slide: {e}")
 
+def theoretical_dice_probabilities():
+    """Return the outcomes of a fair dice and their probabilities"""
+    outcomes = [1, 2, 3, 4, 5, 6]
+    probabilities = [1/6] * 6  # Each outcome has probability 1/6
+    return outcomes, probabilities
+
+def dice_sample_spaces():
+    """Sample spaces of one fair dice and of two independent dice"""
+    die = SampleSpace(range(1, 7))
+    return die, SampleSpace.product(die, die)
+
+def combined_probabilities():
+    """Probabilities of combined events of a fair dice roll"""
+    die, _ = dice_sample_spaces()
+    return {
+        'prob_even': die.event(lambda x: x % 2 == 0).prob(),  # Rolling 2, 4, or 6
+        'prob_greater_than_4': die.event(lambda x: x > 4).prob(),  # Rolling 5 or 6
+        'prob_not_1': (~die.event([1])).prob()  # Not rolling 1
+    }
+
 def create_dice_probability_chart():
     """Create basic dice probability chart"""
     print("\n=== Dice Probability Calculations ===")
     
     # Calculate theoretical probabilities
-    outcomes = [1, 2, 3, 4, 5, 6]
-    probabilities = [1/6] * 6  # Each outcome has probability 1/6
+    outcomes, probabilities = theoretical_dice_probabilities()
     
     print("Theoretical Probabilities:")
     for outcome, prob in zip(outcomes, probabilities):
         print(f"  P(rolling {outcome}) = {prob:.3f}")
     
     # Calculate some combined probabilities
-    prob_even = 3/6  # Rolling 2, 4, or 6
-    prob_greater_than_4 = 2/6  # Rolling 5 or 6
-    prob_not_1 = 5/6  # Not rolling 1
+    combined = combined_probabilities()
     
     print(f"\nCombined Probabilities:")
-    print(f"  P(even number) = {prob_even:.3f}")
-    print(f"  P(greater than 4) = {prob_greater_than_4:.3f}")
-    print(f"  P(not rolling 1) = {prob_not_1:.3f}")
+    print(f"  P(even number) = {combined['prob_even']:.3f}")
+    print(f"  P(greater than 4) = {combined['prob_greater_than_4']:.3f}")
+    print(f"  P(not rolling 1) = {combined['prob_not_1']:.3f}")
     
     # Create the visualization
     plt.figure(figsize=(10, 6))
@@ -102,12 +128,11 @@ def create_dice_probability_chart():
     
     # Save the plot
     output_path = Path(__file__).parent / "dice_probability_basic.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = save_figure(output_path)
     print(f"Chart saved to: {output_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()  # Important: close the figure to prevent empty windows
     
@@ -126,7 +151,8 @@ def explain_probability_concepts():
     print("   print(f'Sample space size: {len(sample_space)}')")
     
     # Demonstrate with code
-    sample_space = list(range(1, 7))
+    die, _ = dice_sample_spaces()
+    sample_space = die.outcomes.tolist()
     print(f"   → Sample space size: {len(sample_space)}")
     
     print("\n2. EVENT (E):")
@@ -138,7 +164,8 @@ def explain_probability_concepts():
     print("   print(f'Even numbers event: {even_event}')")
     
     # Demonstrate with code
-    even_event = [x for x in sample_space if x % 2 == 0]
+    even = die.event(lambda x: x % 2 == 0)
+    even_event = even.outcomes().tolist()
     print(f"   → Even numbers event: {even_event}")
     
     print("\n3. PROBABILITY (P):")
@@ -152,10 +179,7 @@ def explain_probability_concepts():
     print("   prob_even = calculate_probability(even_event, sample_space)")
     
     # Demonstrate with code
-    def calculate_probability(event, sample_space):
-        return len(event) / len(sample_space)
-    
-    prob_even = calculate_probability(even_event, sample_space)
+    prob_even = even.prob()
     print(f"   → P(even) = {len(even_event)}/{len(sample_space)} = {prob_even:.3f}")
     
     print("\n4. PROBABILITY AXIOMS (Kolmogorov):")
@@ -169,7 +193,7 @@ def explain_probability_concepts():
     print("   print(f'Sum of all probabilities: {sum(all_probs)}')")
     
     # Demonstrate with code
-    all_probs = [calculate_probability([i], sample_space) for i in sample_space]
+    all_probs = [die.event([outcome]).prob() for outcome in sample_space]
     print(f"   → All probabilities ≥ 0: {all(p >= 0 for p in all_probs)}")
     print(f"   → Sum of all probabilities: {sum(all_probs):.3f}")
     
@@ -182,15 +206,44 @@ def explain_probability_concepts():
     print("   print(f'P(odd) = 1 - P(even) = 1 - {prob_even:.3f} = {1-prob_even:.3f}')")
     
     # Demonstrate with code
-    complement_even = [x for x in sample_space if x not in even_event]
-    prob_odd = calculate_probability(complement_even, sample_space)
+    complement_even = (~even).outcomes().tolist()
     print(f"   → Odd numbers: {complement_even}")
     print(f"   → P(odd) = 1 - P(even) = 1 - {prob_even:.3f} = {1-prob_even:.3f}")
     
     return sample_space, even_event, all_probs
 
+# Metrics reported by the five probability rules
+PROBABILITY_RULES = ('addition_rule', 'complement_rule', 'total_probability',
+                     'conditional_probability', 'independence')
+
+def probability_rules():
+    """The five probability rules for one die and for two dice, with the terms they combine"""
+    die, two_dice = dice_sample_spaces()
+    one, two, six = die.event([1]), die.event([2]), die.event([6])
+    even = die.event(lambda x: x % 2 == 0)
+    six_first = two_dice.event(lambda rolls: rolls[:, 0] == 6)
+    six_second = two_dice.event(lambda rolls: rolls[:, 1] == 6)
+    return {
+        'prob_1': one.prob(),
+        'prob_2': two.prob(),
+        'addition_rule': (one | two).prob(),
+        'prob_6': six.prob(),
+        'complement_rule': 1 - six.prob(),
+        'not_6_count': len(~six),
+        'prob_not_6': (~six).prob(),
+        'total_probability': die.full().prob(),
+        'prob_even': even.prob(),
+        'prob_6_and_even': (six & even).prob(),
+        'conditional_probability': six.given(even),
+        'prob_6_first': six_first.prob(),
+        'prob_6_second': six_second.prob(),
+        'independence': (six_first & six_second).prob()
+    }
+
 def demonstrate_probability_rules():
     """Demonstrate probability rules with dice examples, formulas and code"""
+    rules = probability_rules()
+    
     print("\n=== Probability Rules with Dice Examples ===")
     
     # Rule 1: Addition for mutually exclusive events
@@ -205,13 +258,7 @@ def demonstrate_probability_rules():
     print("   prob_2 = len(event_2) / 6")
     print("   prob_1_or_2 = prob_1 + prob_2  # Addition rule")
     
-    # Demonstrate with code
-    event_1 = [1]
-    event_2 = [2]
-    prob_1 = len(event_1) / 6
-    prob_2 = len(event_2) / 6
-    prob_1_or_2 = prob_1 + prob_2
-    print(f"   → P(rolling 1 or 2) = P(1) + P(2) = {prob_1:.3f} + {prob_2:.3f} = {prob_1_or_2:.3f}")
+    print(f"   → P(rolling 1 or 2) = P(1) + P(2) = {rules['prob_1']:.3f} + {rules['prob_2']:.3f} = {rules['addition_rule']:.3f}")
     
     # Rule 2: Complement
     print("\n2. COMPLEMENT RULE:")
@@ -226,14 +273,8 @@ def demonstrate_probability_rules():
     print("   event_not_6 = [1, 2, 3, 4, 5]")
     print("   prob_not_6_alt = len(event_not_6) / 6")
     
-    # Demonstrate with code
-    event_6 = [6]
-    prob_6 = len(event_6) / 6
-    prob_not_6 = 1 - prob_6
-    event_not_6 = [1, 2, 3, 4, 5]
-    prob_not_6_alt = len(event_not_6) / 6
-    print(f"   → P(not rolling 6) = 1 - P(6) = 1 - {prob_6:.3f} = {prob_not_6:.3f}")
-    print(f"   → Verification: P(not 6) = {len(event_not_6)}/6 = {prob_not_6_alt:.3f}")
+    print(f"   → P(not rolling 6) = 1 - P(6) = 1 - {rules['prob_6']:.3f} = {rules['complement_rule']:.3f}")
+    print(f"   → Verification: P(not 6) = {rules['not_6_count']}/6 = {rules['prob_not_6']:.3f}")
     
     # Rule 3: Total probability
     print("\n3. TOTAL PROBABILITY RULE:")
@@ -244,11 +285,7 @@ def demonstrate_probability_rules():
     print("   individual_probs = [1/6 for _ in all_outcomes]")
     print("   total_prob = sum(individual_probs)")
     
-    # Demonstrate with code
-    all_outcomes = list(range(1, 7))
-    individual_probs = [1/6 for _ in all_outcomes]
-    total_prob = sum(individual_probs)
-    print(f"   → P(1) + P(2) + P(3) + P(4) + P(5) + P(6) = {total_prob:.3f}")
+    print(f"   → P(1) + P(2) + P(3) + P(4) + P(5) + P(6) = {rules['total_probability']:.3f}")
     
     # Rule 4: Conditional probability
     print("\n4. CONDITIONAL PROBABILITY:")
@@ -262,14 +299,9 @@ def demonstrate_probability_rules():
     print("   prob_6_and_even = len(event_6_and_even) / 6")
     print("   prob_6_given_even = prob_6_and_even / prob_even")
     
-    # Demonstrate with code
-    event_even = [2, 4, 6]
-    event_6_and_even = [6]  # 6 is the only number that is both 6 AND even
-    prob_even = len(event_even) / 6
-    prob_6_and_even = len(event_6_and_even) / 6
-    prob_6_given_even = prob_6_and_even / prob_even
+    # 6 is the only number that is both 6 AND even
     print(f"   → P(6|even) = P(6 ∩ even) / P(even)")
-    print(f"   → = {prob_6_and_even:.3f} / {prob_even:.3f} = {prob_6_given_even:.3f}")
+    print(f"   → = {rules['prob_6_and_even']:.3f} / {rules['prob_even']:.3f} = {rules['conditional_probability']:.3f}")
     print(f"   → Interpretation: Out of 3 even numbers, 1 is a 6, so 1/3 = 0.333")
     
     # Rule 5: Independence
@@ -283,22 +315,28 @@ def demonstrate_probability_rules():
     print("   prob_6_second = 1/6")
     print("   prob_both_6 = prob_6_first * prob_6_second  # Independence")
     
-    # Demonstrate with code
-    prob_6_first = 1/6
-    prob_6_second = 1/6
-    prob_both_6 = prob_6_first * prob_6_second
-    print(f"   → P(6 on die 1 AND 6 on die 2) = {prob_6_first:.3f} × {prob_6_second:.3f} = {prob_both_6:.3f}")
+    print(f"   → P(6 on die 1 AND 6 on die 2) = {rules['prob_6_first']:.3f} × {rules['prob_6_second']:.3f} = {rules['independence']:.3f}")
     
-    return {
-        'addition_rule': prob_1_or_2,
-        'complement_rule': prob_not_6,
-        'total_probability': total_prob,
-        'conditional_probability': prob_6_given_even,
-        'independence': prob_both_6
-    }
+    return rules
 
-def main():
-    """Main demonstration function"""
+def compute_results():
+    """Compute the slide data without printing or plotting"""
+    outcomes, probabilities = theoretical_dice_probabilities()
+    
+    result = SlideResult(slide="1a", title="Basic Probability Concepts")
+    result.add_table("theoretical", outcome=outcomes, probability=probabilities)
+    rules = probability_rules()
+    result.add_metrics(**combined_probabilities(), **{name: rules[name] for name in PROBABILITY_RULES})
+    return result
+
+def main(quiet=False):
+    """Main demonstration function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 1a: Basic Probability Concepts")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
@@ -10,8 +10,21 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import warnings
+import sys
+from functools import partial
 from pathlib import Path
-import webbrowser
+
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
+from common.montecarlo import dice_rolls
+from common.adaptive import run_until_precise
+from common.sequential import check_fairness, fairness_verdict
 
 # Configure matplotlib to completely suppress font warnings
 import logging
@@ -30,33 +43,47 @@ warnings.filterwarnings("ignore")
 import matplotlib.pyplot as plt
 plt.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['DejaVu Sans']})
 
-# Set non-interactive backend if running in test environment
-if 'pytest' in str(Path(__file__).parent):
-    matplotlib.use('Agg')
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
 
 def show_slide():
     """Open the HTML slide in browser"""
     try:
         slide_path = Path(__file__).parent / "slide1b.html"
         if slide_path.exists():
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         else:
             print(f"HTML slide not found: {slide_path}")
     except Exception as e:
         print(f"Error opening slide: {e}")
 
-def simulate_dice_frequencies(n_rolls=1000):
-    """Simulate dice rolls and show frequencies"""
-    print(f"\n=== Simulation of {n_rolls} Dice Rolls ===")
-    
+def dice_frequencies(n_rolls=1000):
+    """Simulated rolls, outcome frequencies and the fairness statistics of the slide"""
     # Run simulation with fixed seed for reproducible results
     np.random.seed(42)
     rolls = np.random.randint(1, 7, n_rolls)
     
     # Calculate frequencies
     unique, counts = np.unique(rolls, return_counts=True)
-    frequencies = counts / n_rolls
+    
+    # Chi-square goodness of fit
+    expected_count = n_rolls / 6
+    return {
+        'rolls': rolls,
+        'outcomes': unique,
+        'counts': counts,
+        'frequencies': counts / n_rolls,
+        'chi_square': np.sum((counts - expected_count) ** 2 / expected_count),
+        'sequential': check_fairness(rolls)
+    }
+
+def simulate_dice_frequencies(n_rolls=1000):
+    """Simulate dice rolls and show frequencies"""
+    print(f"\n=== Simulation of {n_rolls} Dice Rolls ===")
+    
+    simulation = dice_frequencies(n_rolls)
+    unique, counts, frequencies = simulation['outcomes'], simulation['counts'], simulation['frequencies']
     
     print("Simulation Results:")
     print("Outcome | Count | Frequency | Theoretical | Difference")
@@ -66,12 +93,13 @@ def simulate_dice_frequencies(n_rolls=1000):
         diff = freq - theoretical
         print(f"   {outcome}    | {count:4d}  |  {freq:.3f}   |   {theoretical:.3f}    | {diff:+.3f}")
     
-    # Calculate chi-square goodness of fit
-    expected_counts = [n_rolls/6] * 6
-    chi_square = sum((obs - exp)**2 / exp for obs, exp in zip(counts, expected_counts))
-    print(f"\nChi-square statistic: {chi_square:.3f}")
+    print(f"\nChi-square statistic: {simulation['chi_square']:.3f}")
     print(f"Expected for fair dice: ~5.99 (95% confidence)")
     
+    # Sequential test: stops as soon as it can accept or reject fairness
+    test = simulation['sequential']
+    print(f"Sequential test (±0.05 bias, α = β = 0.05): {fairness_verdict(test, n_rolls)}")
+    
     return unique, frequencies, counts
 
 def create_frequency_comparison_chart(outcomes, frequencies, counts, n_rolls=1000):
@@ -128,21 +156,23 @@ def create_frequency_comparison_chart(outcomes, frequencies, counts, n_rolls=100
     
     # Save the plot
     output_path = Path(__file__).parent / "dice_frequencies_simulation.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = save_figure(output_path)
     print(f"Frequency chart saved to: {output_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()  # Important: close the figure to prevent empty windows
     
     return output_path
 
-def analyze_convergence(max_rolls=10000):
-    """Analyze how frequencies converge to theoretical probability"""
-    print(f"\n=== Law of Large Numbers Demonstration ===")
-    
+def frequency_to_precision(half_width=0.005, seed=42):
+    """Frequency of '1' from just enough rolls for a 95% interval of ±half_width"""
+    return run_until_precise(partial(dice_rolls, sides=6), half_width=half_width,
+                             statistic=lambda rolls: rolls == 1, seed=seed)
+
+def convergence_frequencies(max_rolls=10000):
+    """Frequency of '1' after a growing number of rolls"""
     np.random.seed(42)
     
     # Generate all rolls at once
@@ -150,19 +180,27 @@ def analyze_convergence(max_rolls=10000):
     
     # Calculate running frequencies for outcome 1
     sample_sizes = [10, 50, 100, 500, 1000, 5000, 10000]
-    frequencies_of_1 = []
+    running_ones = np.cumsum(all_rolls == 1)
+    return sample_sizes, [running_ones[n - 1] / n for n in sample_sizes]
+
+def analyze_convergence(max_rolls=10000):
+    """Analyze how frequencies converge to theoretical probability"""
+    sample_sizes, frequencies_of_1 = convergence_frequencies(max_rolls)
     
+    print(f"\n=== Law of Large Numbers Demonstration ===")
     print("Convergence to theoretical probability (1/6 = 0.167):")
     print("Sample Size | Frequency of '1' | Difference from 1/6")
     print("-" * 50)
     
-    for n in sample_sizes:
-        rolls_subset = all_rolls[:n]
-        freq_1 = np.sum(rolls_subset == 1) / n
-        frequencies_of_1.append(freq_1)
+    for n, freq_1 in zip(sample_sizes, frequencies_of_1):
         diff = freq_1 - (1/6)
         print(f"   {n:5d}    |     {freq_1:.3f}      |    {diff:+.3f}")
     
+    # Stop as soon as the frequency is known to the requested precision
+    adaptive = frequency_to_precision()
+    print(f"Rolls needed for ±0.005 (95% confidence): {adaptive.n_samples:,} "
+          f"-> frequency of '1' = {adaptive.value:.3f}")
+    
     return sample_sizes, frequencies_of_1
 
 def explain_law_of_large_numbers():
@@ -186,8 +224,31 @@ def explain_law_of_large_numbers():
     print("  μ = theoretical mean")
     print("  ε = any small positive number")
 
-def main():
-    """Main demonstration function"""
+def compute_results(n_rolls=1000):
+    """Compute the slide data without printing or plotting"""
+    simulation = dice_frequencies(n_rolls)
+    outcomes, counts, frequencies = simulation['outcomes'], simulation['counts'], simulation['frequencies']
+    sequential = simulation['sequential']
+    sample_sizes, frequencies_of_1 = convergence_frequencies()
+    
+    result = SlideResult(slide="1b", title="Frequencies from Simulation")
+    result.add_table("simulation", outcome=outcomes, count=counts, frequency=frequencies,
+                     difference=frequencies - 1/6)
+    result.add_table("convergence", sample_size=sample_sizes, frequency_of_1=frequencies_of_1)
+    adaptive = frequency_to_precision()
+    result.add_metrics(n_rolls=n_rolls, chi_square=simulation['chi_square'],
+                       adaptive_rolls=adaptive.n_samples, adaptive_frequency_of_1=adaptive.value,
+                       sequential_decision=sequential.decision, sequential_rolls=sequential.n_samples)
+    return result
+
+def main(quiet=False):
+    """Main demonstration function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 1b: Frequencies from Simulation")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
@@ -10,10 +10,21 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import warnings
+import sys
+from itertools import count
 from pathlib import Path
-import webbrowser
 from scipy import stats
 
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
+from common.sequential import SequentialTest, check_fairness, fairness_verdict
+
 # Configure matplotlib to completely suppress font warnings
 import logging
 logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
@@ -31,17 +42,19 @@ warnings.filterwarnings("ignore")
 import matplotlib.pyplot as plt
 plt.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['DejaVu Sans']})
 
-# Set non-interactive backend if running in test environment
-if 'pytest' in str(Path(__file__).parent):
-    matplotlib.use('Agg')
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
+
+# Significance level of the chi-square fairness test (5 degrees of freedom for 6 faces)
+CHI2_ALPHA = 0.05
 
 def show_slide():
     """Open the HTML slide in browser"""
     try:
         slide_path = Path(__file__).parent / "slide1c.html"
         if slide_path.exists():
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         else:
             print(f"HTML slide not found: {slide_path}")
     except Exception as e:
@@ -87,39 +100,62 @@ def explain_histogram_concepts():
     
     return bins
 
-def simulate_and_analyze_rolls(n_rolls=1000):
-    """Simulate dice rolls and perform statistical analysis"""
-    print(f"\n=== Statistical Analysis of {n_rolls} Dice Rolls ===")
-    
+def monitor_loaded_die(p_six=0.25, block_size=20, seed=42):
+    """SPRT fairness monitor on a live stream of rolls of a die loaded towards 6"""
+    rng = np.random.default_rng(seed)
+    probabilities = np.append(np.full(5, (1 - p_six) / 5), p_six)
+    stream = (rng.choice(np.arange(1, 7), block_size, p=probabilities) for _ in count())
+    return SequentialTest.fairness(sides=6, bias=0.05).run(stream)
+
+def analyze_rolls(n_rolls=1000):
+    """Simulated rolls with their chi-square and sequential fairness tests"""
     # Set seed for reproducible results
     np.random.seed(42)
+    rolls = np.random.randint(1, 7, n_rolls)
+    outcomes, counts = np.unique(rolls, return_counts=True)
+    observed_freq = counts / n_rolls
+    
+    # Chi-square goodness of fit against n_rolls / 6 per face
+    expected_counts = np.full(6, n_rolls / 6)
+    chi2_stat = np.sum((counts - expected_counts) ** 2 / expected_counts)
+    chi2_critical = stats.chi2.ppf(1 - CHI2_ALPHA, df=5)
+    
+    return {
+        'rolls': rolls,
+        'outcomes': outcomes,
+        'counts': counts,
+        'observed_freq': observed_freq,
+        'deviation': observed_freq - 1/6,
+        'chi2_stat': chi2_stat,
+        'chi2_critical': chi2_critical,
+        'sequential': check_fairness(rolls),
+        'loaded': monitor_loaded_die()
+    }
+
+def simulate_and_analyze_rolls(n_rolls=1000):
+    """Simulate dice rolls and perform statistical analysis"""
+    analysis = analyze_rolls(n_rolls)
+    rolls, counts, chi2_stat = analysis['rolls'], analysis['counts'], analysis['chi2_stat']
+    chi2_critical = analysis['chi2_critical']
     
+    print(f"\n=== Statistical Analysis of {n_rolls} Dice Rolls ===")
     print("PYTHON CODE FOR SIMULATION:")
     print("import numpy as np")
     print("np.random.seed(42)  # For reproducible results")
     print(f"rolls = np.random.randint(1, 7, {n_rolls})")
     print("unique, counts = np.unique(rolls, return_counts=True)")
     
-    # Generate rolls
-    rolls = np.random.randint(1, 7, n_rolls)
-    unique, counts = np.unique(rolls, return_counts=True)
-    
     print(f"\nSIMULATION RESULTS:")
     print("Outcome | Count | Observed Freq | Expected Freq | Deviation")
     print("-" * 60)
     
-    expected_count = n_rolls / 6
     expected_freq = 1/6
-    
-    total_deviation = 0
-    for outcome, count in zip(unique, counts):
-        observed_freq = count / n_rolls
-        deviation = observed_freq - expected_freq
-        total_deviation += abs(deviation)
+    for outcome, count, observed_freq, deviation in zip(analysis['outcomes'], counts,
+                                                        analysis['observed_freq'], analysis['deviation']):
         print(f"   {outcome}    | {count:4d}  |    {observed_freq:.3f}     |    {expected_freq:.3f}     | {deviation:+.3f}")
     
     print(f"\nSTATISTICAL MEASURES:")
-    print(f"Mean absolute deviation: {total_deviation/6:.3f}")
+    print(f"Mean absolute deviation: {np.mean(np.abs(analysis['deviation'])):.3f}")
     
     # Chi-square test
     print(f"\nCHI-SQUARE GOODNESS OF FIT TEST:")
@@ -128,15 +164,19 @@ def simulate_and_analyze_rolls(n_rolls=1000):
     print("from scipy import stats")
     print("expected_counts = [n_rolls/6] * 6")
     print("chi2_stat = sum((obs - exp)**2 / exp for obs, exp in zip(counts, expected_counts))")
-    
-    expected_counts = [n_rolls/6] * 6
-    chi2_stat = sum((obs - exp)**2 / exp for obs, exp in zip(counts, expected_counts))
-    chi2_critical = 11.07  # Critical value for α=0.05, df=5
+    print("chi2_critical = stats.chi2.ppf(0.95, df=5)")
     
     print(f"→ Chi-square statistic: {chi2_stat:.3f}")
     print(f"→ Critical value (α=0.05): {chi2_critical:.3f}")
     print(f"→ Result: {'Fair dice' if chi2_stat < chi2_critical else 'Possibly biased dice'}")
     
+    # Sequential test: reads the rolls in blocks and stops as soon as it can decide
+    print(f"\nSEQUENTIAL PROBABILITY RATIO TEST (detects ±0.05 bias, α = β = 0.05):")
+    test = analysis['sequential']
+    print(f"→ Result: {fairness_verdict(test, n_rolls)}")
+    loaded = analysis['loaded']
+    print(f"→ Live monitor, die with P(6) = 0.25: {fairness_verdict(loaded)}")
+    
     return rolls, counts, chi2_stat
 
 def create_detailed_histogram(rolls, n_rolls=1000):
@@ -212,17 +252,22 @@ Mean = Σ(x × P(x))'''
     
     # Save the plot
     output_path = Path(__file__).parent / "histogram_1000_rolls.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = save_figure(output_path)
     print(f"Histogram saved to: {output_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()  # Important: close the figure to prevent empty windows
     
     return output_path
 
+def sampling_distribution(n_samples=50, sample_size=100):
+    """Means of n_samples samples of sample_size rolls each"""
+    np.random.seed(42)
+    # Row i holds the rolls of sample i
+    return np.random.randint(1, 7, (n_samples, sample_size)).mean(axis=1)
+
 def demonstrate_sampling_distribution():
     """Demonstrate sampling distribution concept"""
     print(f"\n=== Sampling Distribution Concept ===")
@@ -242,12 +287,7 @@ def demonstrate_sampling_distribution():
     # Demonstrate with smaller numbers for speed
     n_samples = 50
     sample_size = 100
-    sample_means = []
-    
-    np.random.seed(42)
-    for i in range(n_samples):
-        sample = np.random.randint(1, 7, sample_size)
-        sample_means.append(np.mean(sample))
+    sample_means = sampling_distribution(n_samples, sample_size)
     
     mean_of_means = np.mean(sample_means)
     std_of_means = np.std(sample_means)
@@ -265,8 +305,34 @@ def demonstrate_sampling_distribution():
     
     return sample_means
 
-def main():
-    """Main demonstration function"""
+def compute_results(n_rolls=1000):
+    """Compute the slide data without printing or plotting"""
+    analysis = analyze_rolls(n_rolls)
+    rolls, chi2_stat, chi2_critical = analysis['rolls'], analysis['chi2_stat'], analysis['chi2_critical']
+    sequential, loaded = analysis['sequential'], analysis['loaded']
+    sample_means = sampling_distribution()
+    
+    result = SlideResult(slide="1c", title="Histogram of 1000 Rolls")
+    result.add_table("simulation", outcome=analysis['outcomes'], count=analysis['counts'],
+                     observed_freq=analysis['observed_freq'], deviation=analysis['deviation'])
+    result.add_table("sample_means", mean=sample_means)
+    result.add_metrics(n_rolls=n_rolls, chi2_stat=chi2_stat, chi2_critical=chi2_critical,
+                       fair_dice=bool(chi2_stat < chi2_critical),
+                       mean_absolute_deviation=np.mean(np.abs(analysis['deviation'])),
+                       mean_roll=np.mean(rolls), std_roll=np.std(rolls),
+                       mean_of_means=np.mean(sample_means), std_of_means=np.std(sample_means),
+                       sequential_decision=sequential.decision, sequential_rolls=sequential.n_samples,
+                       loaded_die_decision=loaded.decision, loaded_die_rolls=loaded.n_samples)
+    return result
+
+def main(quiet=False):
+    """Main demonstration function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 1c: Histogram of 1000 Rolls")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
@@ -12,10 +12,20 @@ Python code for uniform distribution analysis and visualization
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy import stats
-import webbrowser
 import sys
 from pathlib import Path
 
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
+from common.streaming import DEFAULT_CHUNK_SIZE, uniform_chunks
+from common.qmc import uniform_samples
+
 # Suppress matplotlib warnings including font warnings
 import warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="matplotlib")
@@ -26,14 +36,17 @@ warnings.filterwarnings("ignore", message="findfont: Font family.*not found")
 plt.rcParams['font.family'] = ['sans-serif']
 plt.rcParams['axes.unicode_minus'] = False
 
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
+
 def show_slide():
     """Display HTML slide"""
     slide_path = Path(__file__).parent / "slide2.html"
     if slide_path.exists():
         try:
             # Try to open with default browser
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         except Exception as e:
             print(f"Could not open slide automatically: {e}")
             print(f"Please open manually: {slide_path.absolute()}")
@@ -43,26 +56,38 @@ def show_slide():
         for file in Path(__file__).parent.glob("*.html"):
             print(f"  - {file.name}")
 
+def sample_uniform(a=0, b=10, n_samples=1000):
+    """Draw the slide's uniform distribution data"""
+    np.random.seed(42)
+    return uniform_samples(a, b, n_samples)
+
+def uniform_moments(uniform_data, a=0, b=10):
+    """Theoretical and empirical mean and variance of uniform data"""
+    return {
+        'mean_theoretical': (a + b) / 2,
+        'mean_empirical': np.mean(uniform_data),
+        'var_theoretical': (b - a) ** 2 / 12,
+        'var_empirical': np.var(uniform_data)
+    }
+
 def generate_uniform_data(a=0, b=10, n_samples=1000):
     """Generate uniform distribution data"""
-    print(f"=== Generating {n_samples} samples from Uniform Distribution [{a}, {b}] ===")
+    uniform_data = sample_uniform(a, b, n_samples)
+    moments = uniform_moments(uniform_data, a, b)
     
-    np.random.seed(42)
-    uniform_data = np.random.uniform(a, b, n_samples)
-    
-    mean_theoretical = (a + b) / 2
-    var_theoretical = (b - a) ** 2 / 12
-    
-    mean_empirical = np.mean(uniform_data)
-    var_empirical = np.var(uniform_data)
-    
-    print(f"Theoretical mean: {mean_theoretical:.3f}")
-    print(f"Empirical mean: {mean_empirical:.3f}")
-    print(f"Theoretical variance: {var_theoretical:.3f}")
-    print(f"Empirical variance: {var_empirical:.3f}")
+    print(f"=== Generating {n_samples} samples from Uniform Distribution [{a}, {b}] ===")
+    print(f"Theoretical mean: {moments['mean_theoretical']:.3f}")
+    print(f"Empirical mean: {moments['mean_empirical']:.3f}")
+    print(f"Theoretical variance: {moments['var_theoretical']:.3f}")
+    print(f"Empirical variance: {moments['var_empirical']:.3f}")
     
     return uniform_data
 
+def generate_uniform_data_chunks(a=0, b=10, n_samples=1000, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Streaming counterpart of sample_uniform: yields the same samples in chunks"""
+    np.random.seed(42)
+    yield from uniform_chunks(a, b, n_samples, chunk_size)
+
 def create_uniform_visualization():
     """Create uniform distribution visualization"""
     data = generate_uniform_data(0, 10, 1000)
@@ -113,15 +138,13 @@ def create_uniform_visualization():
     
     # Save the plot
     output_path = Path(__file__).parent / "uniform_distribution.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = save_figure(output_path)
     print(f"Plot saved to: {output_path}")
     
-    plt.show()
+    show_figure()
 
-def uniform_properties_analysis():
-    """Analyze properties of uniform distribution"""
-    print("\n=== Uniform Distribution Properties ===")
-    
+def uniform_properties():
+    """Mean, variance and standard deviation of several uniform distributions, as columns"""
     # Different uniform distributions
     distributions = [
         (0, 1, "Standard Uniform"),
@@ -129,17 +152,22 @@ def uniform_properties_analysis():
         (-10, 10, "Symmetric Uniform"),
         (0, 100, "Wide Range Uniform")
     ]
+    a, b, desc = (np.array(column) for column in zip(*distributions))
+    variance = (b - a) ** 2 / 12
+    return {'a': a, 'b': b, 'mean': (a + b) / 2, 'variance': variance,
+            'std_dev': np.sqrt(variance), 'description': desc}
+
+def uniform_properties_analysis():
+    """Analyze properties of uniform distribution"""
+    properties = uniform_properties()
     
+    print("\n=== Uniform Distribution Properties ===")
     print("Distribution Properties:")
     print("-" * 60)
     print(f"{'Range':<15} {'Mean':<8} {'Variance':<10} {'Std Dev':<8} {'Description'}")
     print("-" * 60)
     
-    for a, b, desc in distributions:
-        mean = (a + b) / 2
-        variance = (b - a) ** 2 / 12
-        std_dev = np.sqrt(variance)
-        
+    for a, b, mean, variance, std_dev, desc in zip(*properties.values()):
         print(f"[{a:>2}, {b:>2}]      {mean:>6.1f}   {variance:>8.2f}   {std_dev:>6.2f}   {desc}")
 
 def interactive_menu():
@@ -173,8 +201,23 @@ def interactive_menu():
         else:
             print("Invalid choice. Please try again.")
 
-def main():
-    """Main function"""
+def compute_results(a=0, b=10, n_samples=1000):
+    """Compute the slide data without printing or plotting"""
+    uniform_data = sample_uniform(a, b, n_samples)
+    
+    result = SlideResult(slide="2", title="Uniform Distribution")
+    result.add_metrics(a=a, b=b, n_samples=n_samples, **uniform_moments(uniform_data, a, b))
+    result.add_table("properties", **uniform_properties())
+    return result
+
+def main(quiet=False):
+    """Main function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 2: Uniform Distribution")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 40)
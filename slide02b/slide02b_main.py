@@ -9,12 +9,48 @@ import matplotlib.pyplot as plt
 import numpy as np
 import warnings
 import logging
+import sys
+from pathlib import Path
+
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.display import configure_backend, show_figure
+from common.results import SlideResult
+from common.qmc import uniform_samples
 
 # Suppress matplotlib warnings
 warnings.filterwarnings('ignore')
 logging.getLogger('matplotlib').setLevel(logging.ERROR)
 plt.rcParams['font.family'] = ['DejaVu Sans']
 
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
+
+def uniform_histogram_data(n_samples=1000, n_bins=20):
+    """
+    Generate uniform samples between 0 and 10 and count them per bin
+    Returns the samples, bin counts, bin edges and the uniformity statistics
+    """
+    # Set random seed for reproducibility
+    np.random.seed(42)
+    uniform_data = uniform_samples(0, 10, n_samples)
+    counts, bins = np.histogram(uniform_data, bins=n_bins)
+    counts = counts.astype(float)
+    
+    # Uniformity test
+    expected_count = len(uniform_data) / len(counts)
+    chi_square = np.sum((counts - expected_count)**2 / expected_count)
+    return {
+        'uniform_data': uniform_data,
+        'counts': counts,
+        'bins': bins,
+        'expected_count': expected_count,
+        'chi_square': chi_square
+    }
+
 def create_uniform_histogram():
     """
     Create histogram of uniform distribution
@@ -22,17 +58,14 @@ def create_uniform_histogram():
     """
     print("=== Histogram of Uniform Distribution ===")
     
-    # Set random seed for reproducibility
-    np.random.seed(42)
-    
     # Generate uniform data
     print("Generating 1000 uniform random samples between 0 and 10...")
-    uniform_data = np.random.uniform(0, 10, 1000)
+    histogram = uniform_histogram_data()
+    uniform_data, counts, bins = histogram['uniform_data'], histogram['counts'], histogram['bins']
     
     # Create histogram
     plt.figure(figsize=(10, 6))
-    counts, bins, patches = plt.hist(uniform_data, bins=20, alpha=0.7, 
-                                   edgecolor='black', color='skyblue')
+    plt.hist(uniform_data, bins=bins, alpha=0.7, edgecolor='black', color='skyblue')
     
     # Add data labels on top of bars
     for i, count in enumerate(counts):
@@ -45,7 +78,7 @@ def create_uniform_histogram():
     plt.grid(True, alpha=0.3)
     
     # Add theoretical expectation line
-    expected_count = len(uniform_data) / len(counts)
+    expected_count = histogram['expected_count']
     plt.axhline(y=expected_count, color='red', linestyle='--', 
                 label=f'Expected: {expected_count:.1f}')
     plt.legend()
@@ -58,13 +91,12 @@ def create_uniform_histogram():
     print(f"Actual counts range: {int(min(counts))} - {int(max(counts))}")
     print(f"Standard deviation of counts: {np.std(counts):.2f}")
     
-    # Uniformity test
-    chi_square = np.sum((counts - expected_count)**2 / expected_count)
-    print(f"Chi-square statistic: {chi_square:.3f}")
+    print(f"Chi-square statistic: {histogram['chi_square']:.3f}")
     print(f"Degrees of freedom: {len(counts) - 1}")
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
+    plt.close()
     
     return uniform_data, counts, bins
 
@@ -102,10 +134,29 @@ def demonstrate_uniform_properties():
     print("   - plt.hist(data, bins=20): Create histogram with 20 bins")
     print("   - bins parameter controls granularity of the histogram")
 
-def main():
+def compute_results():
+    """
+    Compute the slide data without printing or plotting
+    """
+    histogram = uniform_histogram_data()
+    counts, bins = histogram['counts'], histogram['bins']
+    
+    result = SlideResult(slide="2b", title="Histogram of Uniform Distribution")
+    result.add_table("bins", bin_start=bins[:-1], bin_end=bins[1:], count=counts.astype(int))
+    result.add_metrics(n_samples=len(histogram['uniform_data']), n_bins=len(counts),
+                       expected_count=histogram['expected_count'], counts_std=np.std(counts),
+                       chi_square=histogram['chi_square'],
+                       degrees_of_freedom=len(counts) - 1)
+    return result
+
+def main(quiet=False):
     """
     Main function to demonstrate uniform distribution histogram
+    With quiet=True the slide returns a SlideResult instead of printing
     """
+    if quiet:
+        return compute_results()
+    
     print("Slide 2b: Histogram of Uniform Distribution")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
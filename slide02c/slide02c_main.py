@@ -10,35 +10,53 @@ import numpy as np
 from scipy import stats
 import warnings
 import logging
+import sys
+from pathlib import Path
+
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.display import configure_backend, show_figure
+from common.results import SlideResult
+from common.qmc import uniform_samples
 
 # Suppress matplotlib warnings
 warnings.filterwarnings('ignore')
 logging.getLogger('matplotlib').setLevel(logging.ERROR)
 plt.rcParams['font.family'] = ['DejaVu Sans']
 
-def create_qq_plot():
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
+
+def qq_quantiles(n_samples=1000):
     """
-    Create Q-Q plot to test if data follows uniform distribution
+    Sample quantiles of uniform data between 0 and 10, the matching
+    theoretical quantiles and the correlation between them
     """
-    print("=== Q-Q Plot: Uniform Distribution Test ===")
-    
     # Set random seed for reproducibility
     np.random.seed(42)
     
-    # Generate uniform data
-    print("Generating 1000 uniform random samples between 0 and 10...")
-    uniform_data = np.random.uniform(0, 10, 1000)
-    
     # Sort the sample data
-    sample_quantiles = np.sort(uniform_data)
+    sample_quantiles = np.sort(uniform_samples(0, 10, n_samples))
     
     # Generate theoretical quantiles for uniform distribution
-    n = len(sample_quantiles)
-    theoretical_quantiles = np.linspace(0, 10, n)
+    theoretical_quantiles = np.linspace(0, 10, len(sample_quantiles))
+    
+    # Calculate correlation coefficient
+    correlation = np.corrcoef(theoretical_quantiles, sample_quantiles)[0,1]
+    return correlation, theoretical_quantiles, sample_quantiles
+
+def create_qq_plot():
+    """
+    Create Q-Q plot to test if data follows uniform distribution
+    """
+    print("=== Q-Q Plot: Uniform Distribution Test ===")
     
-    # Alternative: using percentiles
-    percentiles = np.linspace(0.5/n, 1-0.5/n, n) * 100
-    theoretical_quantiles_alt = np.percentile(np.random.uniform(0, 10, 10000), percentiles)
+    # Generate uniform data
+    print("Generating 1000 uniform random samples between 0 and 10...")
+    correlation, theoretical_quantiles, sample_quantiles = qq_quantiles()
     
     # Create Q-Q plot
     plt.figure(figsize=(10, 8))
@@ -51,9 +69,6 @@ def create_qq_plot():
     plt.plot([0, 10], [0, 10], 'r-', linewidth=2, 
              label='Perfect Fit (y=x)')
     
-    # Calculate correlation coefficient
-    correlation = np.corrcoef(theoretical_quantiles, sample_quantiles)[0,1]
-    
     plt.xlabel('Theoretical Quantiles (Uniform Distribution)')
     plt.ylabel('Sample Quantiles')
     plt.title(f'Q-Q Plot: Uniform Distribution Test\nCorrelation: {correlation:.4f}')
@@ -64,17 +79,15 @@ def create_qq_plot():
     plt.plot([0, 10], [0, 10], 'k--', alpha=0.3, linewidth=1)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
+    plt.close()
     
     return correlation, theoretical_quantiles, sample_quantiles
 
-def analyze_qq_plot_results(correlation, theoretical_quantiles, sample_quantiles):
+def qq_fit_statistics(correlation, theoretical_quantiles, sample_quantiles):
     """
-    Analyze the results of the Q-Q plot
+    Goodness of fit of the Q-Q plot: interpretation, deviations and KS test
     """
-    print(f"\n=== Q-Q Plot Analysis ===")
-    print(f"Correlation coefficient: {correlation:.4f}")
-    
     # Interpretation of correlation
     if correlation > 0.99:
         interpretation = "Excellent fit - data very likely follows uniform distribution"
@@ -85,26 +98,44 @@ def analyze_qq_plot_results(correlation, theoretical_quantiles, sample_quantiles
     else:
         interpretation = "Poor fit - data does not follow uniform distribution"
     
-    print(f"Interpretation: {interpretation}")
-    
     # Calculate deviations from perfect fit
     deviations = sample_quantiles - theoretical_quantiles
     mean_deviation = np.mean(np.abs(deviations))
     max_deviation = np.max(np.abs(deviations))
     
-    print(f"Mean absolute deviation: {mean_deviation:.3f}")
-    print(f"Maximum absolute deviation: {max_deviation:.3f}")
-    
     # Kolmogorov-Smirnov test
     ks_statistic, p_value = stats.kstest(sample_quantiles, 'uniform', args=(0, 10))
+    
+    return {
+        'correlation': correlation,
+        'interpretation': interpretation,
+        'mean_abs_deviation': mean_deviation,
+        'max_abs_deviation': max_deviation,
+        'ks_statistic': ks_statistic,
+        'ks_p_value': p_value
+    }
+
+def analyze_qq_plot_results(correlation, theoretical_quantiles, sample_quantiles):
+    """
+    Analyze the results of the Q-Q plot
+    """
+    analysis = qq_fit_statistics(correlation, theoretical_quantiles, sample_quantiles)
+    
+    print(f"\n=== Q-Q Plot Analysis ===")
+    print(f"Correlation coefficient: {correlation:.4f}")
+    print(f"Interpretation: {analysis['interpretation']}")
+    print(f"Mean absolute deviation: {analysis['mean_abs_deviation']:.3f}")
+    print(f"Maximum absolute deviation: {analysis['max_abs_deviation']:.3f}")
     print(f"Kolmogorov-Smirnov test:")
-    print(f"  KS statistic: {ks_statistic:.4f}")
-    print(f"  p-value: {p_value:.4f}")
+    print(f"  KS statistic: {analysis['ks_statistic']:.4f}")
+    print(f"  p-value: {analysis['ks_p_value']:.4f}")
     
-    if p_value > 0.05:
+    if analysis['ks_p_value'] > 0.05:
         print("  Result: Fail to reject null hypothesis - data appears uniform")
     else:
         print("  Result: Reject null hypothesis - data does not appear uniform")
+    
+    return analysis
 
 def explain_qq_plot_concepts():
     """
@@ -141,7 +172,7 @@ def demonstrate_different_distributions():
     print("\n=== Comparison with Other Distributions ===")
     
     np.random.seed(42)
-    uniform_data = np.random.uniform(0, 10, 1000)
+    uniform_data = uniform_samples(0, 10, 1000)
     normal_data = np.random.normal(5, 2, 1000)
     exponential_data = np.random.exponential(2, 1000)
     
@@ -180,12 +211,28 @@ def demonstrate_different_distributions():
     axes[2].grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
+    plt.close()
 
-def main():
+def compute_results():
+    """
+    Compute the slide data without printing or plotting
+    """
+    correlation, theoretical_q, sample_q = qq_quantiles()
+    
+    result = SlideResult(slide="2c", title="Q-Q Plot - Uniform Distribution Test")
+    result.add_table("quantiles", theoretical=theoretical_q, sample=sample_q)
+    result.add_metrics(**qq_fit_statistics(correlation, theoretical_q, sample_q))
+    return result
+
+def main(quiet=False):
     """
     Main function to demonstrate Q-Q plot for uniform distribution testing
+    With quiet=True the slide returns a SlideResult instead of printing
     """
+    if quiet:
+        return compute_results()
+    
     print("Slide 2c: Q-Q Plot - Uniform Distribution Test")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 55)
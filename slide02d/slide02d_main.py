@@ -9,24 +9,33 @@ import matplotlib.pyplot as plt
 import numpy as np
 import warnings
 import logging
+import sys
+from pathlib import Path
+
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.display import configure_backend, show_figure
+from common.results import SlideResult
+from common.qmc import uniform_samples
 
 # Suppress matplotlib warnings
 warnings.filterwarnings('ignore')
 logging.getLogger('matplotlib').setLevel(logging.ERROR)
 plt.rcParams['font.family'] = ['DejaVu Sans']
 
-def create_box_plot():
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
+
+def box_plot_statistics(n_samples=1000):
     """
-    Create box plot for uniform distribution and explain components
+    Generate uniform samples between 0 and 10 and compute the box plot statistics
     """
-    print("=== Box Plot: How to Read Box Plots ===")
-    
     # Set random seed for reproducibility
     np.random.seed(42)
-    
-    # Generate uniform data
-    print("Generating 1000 uniform random samples between 0 and 10...")
-    uniform_data = np.random.uniform(0, 10, 1000)
+    uniform_data = uniform_samples(0, 10, n_samples)
     
     # Calculate quartiles and statistics
     q1 = np.percentile(uniform_data, 25)
@@ -45,6 +54,30 @@ def create_box_plot():
     # Find outliers
     outliers = uniform_data[(uniform_data < lower_whisker) | (uniform_data > upper_whisker)]
     
+    return {
+        'uniform_data': uniform_data,
+        'q1': q1,
+        'q2': q2,
+        'q3': q3,
+        'iqr': iqr,
+        'lower_whisker': actual_lower,
+        'upper_whisker': actual_upper,
+        'outliers': outliers
+    }
+
+def create_box_plot():
+    """
+    Create box plot for uniform distribution and explain components
+    """
+    print("=== Box Plot: How to Read Box Plots ===")
+    
+    # Generate uniform data
+    print("Generating 1000 uniform random samples between 0 and 10...")
+    box = box_plot_statistics()
+    uniform_data, outliers = box['uniform_data'], box['outliers']
+    q1, q2, q3, iqr = box['q1'], box['q2'], box['q3'], box['iqr']
+    actual_lower, actual_upper = box['lower_whisker'], box['upper_whisker']
+    
     print(f"\nBox Plot Statistics:")
     print(f"Q1 (25th percentile): {q1:.3f}")
     print(f"Q2 (50th percentile - Median): {q2:.3f}")
@@ -85,7 +118,8 @@ def create_box_plot():
     plt.grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
+    plt.close()
     
     return q1, q2, q3, iqr, outliers
 
@@ -131,7 +165,7 @@ def demonstrate_box_plot_reading():
     
     # Create multiple distributions for comparison
     np.random.seed(42)
-    uniform_data = np.random.uniform(0, 10, 1000)
+    uniform_data = uniform_samples(0, 10, 1000)
     normal_data = np.random.normal(5, 1.5, 1000)
     skewed_data = np.random.exponential(2, 1000)
     
@@ -159,7 +193,8 @@ def demonstrate_box_plot_reading():
     axes[2].grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
+    plt.close()
     
     print("\nComparison Analysis:")
     print("- Uniform: Symmetric box, median centered, equal whiskers")
@@ -191,10 +226,28 @@ def python_code_explanation():
     print("   arrowprops=dict() - Configure arrow appearance")
     print("   plt.grid(True, alpha=0.3) - Add semi-transparent grid")
 
-def main():
+def compute_results():
+    """
+    Compute the slide data without printing or plotting
+    """
+    box = box_plot_statistics()
+    q1, q2, q3, iqr, outliers = box['q1'], box['q2'], box['q3'], box['iqr'], box['outliers']
+    
+    result = SlideResult(slide="2d", title="Box Plot - How to Read Box Plots")
+    result.add_metrics(q1=q1, median=q2, q3=q3, iqr=iqr,
+                       lower_fence=q1 - 1.5 * iqr, upper_fence=q3 + 1.5 * iqr,
+                       n_outliers=len(outliers))
+    result.add_table("outliers", value=outliers)
+    return result
+
+def main(quiet=False):
     """
     Main function to demonstrate box plot reading and interpretation
+    With quiet=True the slide returns a SlideResult instead of printing
     """
+    if quiet:
+        return compute_results()
+    
     print("Slide 2d: Box Plot - How to Read Box Plots")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
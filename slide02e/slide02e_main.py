@@ -10,25 +10,37 @@ import numpy as np
 from scipy import stats
 import warnings
 import logging
+import sys
+from pathlib import Path
+
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.display import configure_backend, show_figure
+from common.results import SlideResult
+from common.estimation import ESTIMATORS, estimate_probabilities
+from common.qmc import uniform_samples
 
 # Suppress matplotlib warnings
 warnings.filterwarnings('ignore')
 logging.getLogger('matplotlib').setLevel(logging.ERROR)
 plt.rcParams['font.family'] = ['DejaVu Sans']
 
-def create_cdf_plot():
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
+
+# Points at which the theoretical and empirical CDF are compared
+CDF_TEST_POINTS = [0, 1, 2.5, 5, 7.5, 9, 10]
+
+def cdf_data(n_samples=1000):
     """
-    Create CDF plot for uniform distribution
-    Shows both theoretical and empirical CDF
+    Uniform samples between 0 and 10 with their empirical CDF and the theoretical CDF
     """
-    print("=== Cumulative Distribution Function (CDF) ===")
-    
     # Set random seed for reproducibility
     np.random.seed(42)
-    
-    # Generate uniform data
-    print("Generating 1000 uniform random samples between 0 and 10...")
-    uniform_data = np.random.uniform(0, 10, 1000)
+    uniform_data = uniform_samples(0, 10, n_samples)
     
     # Create theoretical CDF
     x_theoretical = np.linspace(0, 10, 100)
@@ -38,6 +50,40 @@ def create_cdf_plot():
     x_empirical = np.sort(uniform_data)
     y_empirical = np.arange(1, len(x_empirical) + 1) / len(x_empirical)
     
+    return {
+        'uniform_data': uniform_data,
+        'x_theoretical': x_theoretical,
+        'cdf_theoretical': cdf_theoretical,
+        'x_empirical': x_empirical,
+        'y_empirical': y_empirical
+    }
+
+def cdf_values(uniform_data, test_points=CDF_TEST_POINTS):
+    """
+    Theoretical and empirical CDF of uniform [0,10] at the test points, as columns
+    """
+    theoretical = np.clip(np.array(test_points) / 10, 0, 1)
+    empirical = np.array([np.mean(uniform_data <= x) for x in test_points])
+    return {
+        'x': test_points,
+        'theoretical_cdf': theoretical,
+        'empirical_cdf': empirical,
+        'abs_difference': np.abs(empirical - theoretical)
+    }
+
+def create_cdf_plot(cdf=None):
+    """
+    Create CDF plot for uniform distribution
+    Shows both theoretical and empirical CDF
+    """
+    print("=== Cumulative Distribution Function (CDF) ===")
+    
+    # Generate uniform data
+    print("Generating 1000 uniform random samples between 0 and 10...")
+    cdf = cdf or cdf_data()
+    x_theoretical, cdf_theoretical = cdf['x_theoretical'], cdf['cdf_theoretical']
+    x_empirical, y_empirical = cdf['x_empirical'], cdf['y_empirical']
+    
     # Create the plot
     plt.figure(figsize=(12, 8))
     
@@ -71,33 +117,29 @@ def create_cdf_plot():
     plt.ylim(-0.05, 1.05)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
+    plt.close()
     
     return x_theoretical, cdf_theoretical, x_empirical, y_empirical
 
-def analyze_cdf_properties():
+def analyze_cdf_properties(uniform_data=None):
     """
     Analyze and explain CDF properties
     """
+    if uniform_data is None:
+        uniform_data = cdf_data()['uniform_data']
+    values = cdf_values(uniform_data)
+    rows = list(zip(values['x'], values['theoretical_cdf'], values['empirical_cdf'], values['abs_difference']))
+    
     print("\n=== CDF Properties Analysis ===")
     
     # Theoretical values
     print("Theoretical CDF values for uniform [0,10]:")
-    test_points = [0, 1, 2.5, 5, 7.5, 9, 10]
-    for x in test_points:
-        if 0 <= x <= 10:
-            cdf_value = x / 10
-            print(f"F({x:3.1f}) = P(X ≤ {x:3.1f}) = {cdf_value:.3f}")
-    
-    # Generate sample data for empirical analysis
-    np.random.seed(42)
-    uniform_data = np.random.uniform(0, 10, 1000)
+    for x, theoretical_cdf, _, _ in rows:
+        print(f"F({x:3.1f}) = P(X ≤ {x:3.1f}) = {theoretical_cdf:.3f}")
     
-    print(f"\nEmpirical CDF values from sample (n=1000):")
-    for x in test_points:
-        empirical_cdf = np.mean(uniform_data <= x)
-        theoretical_cdf = x / 10 if 0 <= x <= 10 else (0 if x < 0 else 1)
-        difference = abs(empirical_cdf - theoretical_cdf)
+    print(f"\nEmpirical CDF values from sample (n={len(uniform_data)}):")
+    for x, theoretical_cdf, empirical_cdf, difference in rows:
         print(f"F({x:3.1f}) ≈ {empirical_cdf:.3f} (theoretical: {theoretical_cdf:.3f}, diff: {difference:.3f})")
 
 def explain_cdf_concepts():
@@ -130,6 +172,33 @@ def explain_cdf_concepts():
     print("   - F(7.5) = 0.75 means 75% of values are ≤ 7.5")
     print("   - Linear shape indicates uniform distribution")
 
+# Probabilities estimated with variance reduction, as (low, high] intervals.
+# The bounds lie inside strata: at a stratum edge every stratum is all in or
+# all out, and the stratified standard error would be exactly 0. Only the
+# stratum a bound cuts contributes to it
+EXAMPLE_INTERVALS = {
+    "P(X ≤ 2.37)": (-np.inf, 2.37),
+    "P(X > 6.83)": (6.83, np.inf),
+    "P(2.37 < X ≤ 6.83)": (2.37, 6.83),
+}
+
+def variance_reduced_estimates(n_samples=1000, seed=42):
+    """
+    Estimate the example probabilities with every estimator
+    Returns columns: method, probability, estimate, std_error
+    """
+    rng = np.random.default_rng(seed)
+    columns = {'method': [], 'probability': [], 'estimate': [], 'std_error': []}
+    for method in ESTIMATORS:
+        estimate = estimate_probabilities(stats.uniform(0, 10), list(EXAMPLE_INTERVALS.values()),
+                                          n_samples, method, rng)
+        for label, value, std_error in zip(EXAMPLE_INTERVALS, estimate.value, estimate.std_error):
+            columns['method'].append(method)
+            columns['probability'].append(label)
+            columns['estimate'].append(value)
+            columns['std_error'].append(std_error)
+    return columns
+
 def demonstrate_cdf_calculations():
     """
     Demonstrate practical CDF calculations
@@ -152,13 +221,27 @@ def demonstrate_cdf_calculations():
     
     # Verify with sample data
     np.random.seed(42)
-    uniform_data = np.random.uniform(0, 10, 10000)
+    uniform_data = uniform_samples(0, 10, 10000)
     
     print(f"\nVerification with sample data (n=10,000):")
     print(f"P(X ≤ 3) ≈ {np.mean(uniform_data <= 3):.3f} (theoretical: 0.300)")
     print(f"P(X ≤ 7) ≈ {np.mean(uniform_data <= 7):.3f} (theoretical: 0.700)")
     print(f"P(X > 6) ≈ {np.mean(uniform_data > 6):.3f} (theoretical: 0.400)")
     print(f"P(2 < X ≤ 8) ≈ {np.mean((uniform_data > 2) & (uniform_data <= 8)):.3f} (theoretical: 0.600)")
+    
+    # Similar probabilities from 10x fewer samples with variance reduction
+    estimates = variance_reduced_estimates()
+    print(f"\nEstimates from n=1,000 samples (value ± standard error):")
+    print(f"{'':16}" + "".join(f"{label:>20}" for label in EXAMPLE_INTERVALS))
+    exact = [stats.uniform(0, 10).cdf(high) - stats.uniform(0, 10).cdf(low)
+             for low, high in EXAMPLE_INTERVALS.values()]
+    print(f"{'theoretical':16}" + "".join(f"{value:>20.3f}" for value in exact))
+    per_method = len(EXAMPLE_INTERVALS)
+    for start in range(0, len(estimates['method']), per_method):
+        cells = [f"{value:.3f} ± {error:.4f}" for value, error in
+                 zip(estimates['estimate'][start:start + per_method],
+                     estimates['std_error'][start:start + per_method])]
+        print(f"{estimates['method'][start]:16}" + "".join(f"{cell:>20}" for cell in cells))
 
 def compare_distributions_cdf():
     """
@@ -193,7 +276,8 @@ def compare_distributions_cdf():
     plt.ylim(0, 1)
     
     plt.tight_layout()
-    plt.show()
+    show_figure()
+    plt.close()
     
     print("Observations:")
     print("- Uniform: Linear (straight line)")
@@ -223,19 +307,39 @@ def python_code_explanation():
     print("   np.mean(data <= x) calculates empirical CDF at point x")
     print("   Compare with theoretical value x/10")
 
-def main():
+def compute_results():
+    """
+    Compute the slide data without printing or plotting
+    """
+    cdf = cdf_data()
+    x_emp, y_emp = cdf['x_empirical'], cdf['y_empirical']
+    
+    result = SlideResult(slide="2e", title="Cumulative Distribution Function (CDF)")
+    result.add_table("cdf_values", **cdf_values(cdf['uniform_data']))
+    result.add_table("probability_estimates", **variance_reduced_estimates())
+    result.add_table("theoretical_cdf", x=cdf['x_theoretical'], cdf=cdf['cdf_theoretical'])
+    result.add_metrics(n_samples=len(x_emp),
+                       max_abs_difference=np.max(np.abs(y_emp - x_emp / 10)))
+    return result
+
+def main(quiet=False):
     """
     Main function to demonstrate CDF concepts and calculations
+    With quiet=True the slide returns a SlideResult instead of printing
     """
+    if quiet:
+        return compute_results()
+    
     print("Slide 2e: Cumulative Distribution Function (CDF)")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 55)
     
     # Create CDF plot
-    x_theo, cdf_theo, x_emp, y_emp = create_cdf_plot()
+    cdf = cdf_data()
+    create_cdf_plot(cdf)
     
     # Analyze properties
-    analyze_cdf_properties()
+    analyze_cdf_properties(cdf['uniform_data'])
     
     # Explain concepts
     explain_cdf_concepts()
@@ -10,10 +10,22 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import warnings
+import sys
 from pathlib import Path
-import webbrowser
 import os
 
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
+from common.streaming import DEFAULT_CHUNK_SIZE, normal_chunks
+from common.importance import NormalFamily, tail_probability
+from common.qmc import uniform_samples
+
 # Configure matplotlib to completely suppress font warnings
 import logging
 logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
@@ -31,17 +43,16 @@ warnings.filterwarnings("ignore")
 import matplotlib.pyplot as plt
 plt.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['DejaVu Sans']})
 
-# Set non-interactive backend if running in test environment
-if 'pytest' in str(Path(__file__).parent):
-    matplotlib.use('Agg')
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
 
 def show_slide():
     """Open the HTML slide in browser"""
     try:
         slide_path = Path(__file__).parent / "slide3.html"
         if slide_path.exists():
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         else:
             print(f"HTML slide not found: {slide_path}")
     except Exception as e:
@@ -52,6 +63,10 @@ def generate_normal_samples(mean=0, std=1, size=1000):
     samples = np.random.normal(mean, std, size)
     return samples
 
+def generate_normal_samples_chunks(mean=0, std=1, size=1000, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Streaming counterpart of generate_normal_samples: yields samples in chunks"""
+    yield from normal_chunks(mean, std, size, chunk_size)
+
 def plot_normal_distribution(mean=0, std=1, samples=None):
     """Plot normal distribution with samples"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
@@ -97,12 +112,11 @@ def plot_normal_distribution(mean=0, std=1, samples=None):
     
     # Save plot
     save_path = Path(__file__).parent / "normal_distribution.png"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_path = save_figure(save_path)
     print(f"Plot saved to: {save_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()
     return save_path
@@ -124,24 +138,26 @@ def calculate_normal_properties(samples):
         'percentiles': dict(zip(percentiles, perc_values))
     }
 
-def demonstrate_central_limit_theorem():
+def empirical_rule(samples):
+    """Fraction of standard normal samples within 1, 2 and 3 standard deviations"""
+    return {f'within_{k}_std': np.sum(np.abs(samples) <= k) / len(samples) for k in (1, 2, 3)}
+
+def central_limit_sample_means(sample_sizes=(1, 5, 10, 30), n_samples=1000):
+    """Means of n uniform [0, 1] draws, n_samples times for each sample size n"""
+    # Sample from uniform distribution (not normal): each row is one sample of n draws
+    return {n: uniform_samples(0, 1, (n_samples, n)).mean(axis=1) for n in sample_sizes}
+
+def demonstrate_central_limit_theorem(all_sample_means=None):
     """Demonstrate Central Limit Theorem"""
-    print("\n=== Central Limit Theorem Demonstration ===")
+    if all_sample_means is None:
+        all_sample_means = central_limit_sample_means()
     
-    # Sample from uniform distribution (not normal)
-    sample_sizes = [1, 5, 10, 30]
-    n_samples = 1000
+    print("\n=== Central Limit Theorem Demonstration ===")
     
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
     axes = axes.flatten()
     
-    for i, n in enumerate(sample_sizes):
-        # Generate sample means
-        sample_means = []
-        for _ in range(n_samples):
-            # Sample from uniform distribution [0, 1]
-            uniform_samples = np.random.uniform(0, 1, n)
-            sample_means.append(np.mean(uniform_samples))
+    for i, (n, sample_means) in enumerate(all_sample_means.items()):
         
         # Plot histogram of sample means
         axes[i].hist(sample_means, bins=30, density=True, alpha=0.7, color='lightcoral')
@@ -166,18 +182,46 @@ def demonstrate_central_limit_theorem():
     
     # Save plot
     save_path = Path(__file__).parent / "central_limit_theorem.png"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_path = save_figure(save_path)
     print(f"CLT demonstration saved to: {save_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()
     return save_path
 
-def main():
-    """Main demonstration function"""
+def estimate_far_tail(std_devs=5, n_samples=4000, seed=42):
+    """Importance-sampling estimate of P(X > std_devs) for N(0, 1)"""
+    return tail_probability(NormalFamily(0, 1), std_devs, n_samples=n_samples,
+                            rng=np.random.default_rng(seed))
+
+def compute_results():
+    """Compute the slide data without printing or plotting"""
+    samples = generate_normal_samples(mean=0, std=1, size=1000)
+    props = calculate_normal_properties(samples)
+    sample_means = central_limit_sample_means()
+    
+    result = SlideResult(slide="3", title="Normal Distribution")
+    result.add_metrics(mean=props['mean'], std=props['std'], variance=props['variance'],
+                       **empirical_rule(samples), above_5_std=estimate_far_tail().value)
+    result.add_table("percentiles", percentile=list(props['percentiles']),
+                     value=list(props['percentiles'].values()))
+    result.add_table("central_limit_theorem",
+                     sample_size=list(sample_means),
+                     mean_of_means=[np.mean(means) for means in sample_means.values()],
+                     std_of_means=[np.std(means) for means in sample_means.values()],
+                     theoretical_std=[np.sqrt(1/12) / np.sqrt(n) for n in sample_means])
+    return result
+
+def main(quiet=False):
+    """Main demonstration function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 3: Normal Distribution")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
@@ -207,13 +251,16 @@ def main():
     
     # 68-95-99.7 rule
     print("\n=== 68-95-99.7 Rule (Empirical Rule) ===")
-    within_1_std = np.sum(np.abs(samples) <= 1) / len(samples)
-    within_2_std = np.sum(np.abs(samples) <= 2) / len(samples)
-    within_3_std = np.sum(np.abs(samples) <= 3) / len(samples)
+    within = empirical_rule(samples)
+    
+    print(f"Within 1 std dev: {within['within_1_std']:.3f} (theoretical: 0.683)")
+    print(f"Within 2 std dev: {within['within_2_std']:.3f} (theoretical: 0.954)")
+    print(f"Within 3 std dev: {within['within_3_std']:.3f} (theoretical: 0.997)")
     
-    print(f"Within 1 std dev: {within_1_std:.3f} (theoretical: 0.683)")
-    print(f"Within 2 std dev: {within_2_std:.3f} (theoretical: 0.954)")
-    print(f"Within 3 std dev: {within_3_std:.3f} (theoretical: 0.997)")
+    # Counting would need billions of samples this far out
+    far_tail = estimate_far_tail()
+    low, high = far_tail.confidence_interval()
+    print(f"Above 5 std dev: {far_tail.value:.3g} (95% CI {low:.3g} to {high:.3g}; theoretical: 2.87e-07)")
     
     print("\nSlide 3 demonstration completed")
 
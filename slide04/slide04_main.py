@@ -10,10 +10,26 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import warnings
+import sys
+from functools import partial
 from pathlib import Path
-import webbrowser
 from scipy import stats
 
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
+from common.streaming import DEFAULT_CHUNK_SIZE, coin_flip_chunks
+from common.binomial import (FULL_SUPPORT_MAX, binomial_pmf_window, binomial_sf,
+                             binomial_cdf)
+from common.importance import BinomialFamily, tail_probability
+from common.montecarlo import coin_flips
+from common.adaptive import run_until_precise
+
 # Configure matplotlib to completely suppress font warnings
 import logging
 logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
@@ -31,17 +47,16 @@ warnings.filterwarnings("ignore")
 import matplotlib.pyplot as plt
 plt.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['DejaVu Sans']})
 
-# Set non-interactive backend if running in test environment
-if 'pytest' in str(Path(__file__).parent):
-    matplotlib.use('Agg')
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
 
 def show_slide():
     """Open the HTML slide in browser"""
     try:
         slide_path = Path(__file__).parent / "slide4.html"
         if slide_path.exists():
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         else:
             print(f"HTML slide not found: {slide_path}")
     except Exception as e:
@@ -49,27 +64,45 @@ def show_slide():
 
 def simulate_coin_flips(n_trials, p_success, n_experiments=1000):
     """Simulate binomial experiments"""
-    results = []
-    for _ in range(n_experiments):
-        # Simulate n_trials coin flips
-        flips = np.random.random(n_trials) < p_success
-        successes = np.sum(flips)
-        results.append(successes)
-    return np.array(results)
+    # Same random stream as flipping n_trials coins once per experiment
+    return np.concatenate(list(simulate_coin_flips_chunks(n_trials, p_success, n_experiments)))
+
+def simulate_coin_flips_to_precision(n_trials, p_success, relative_error=0.001, seed=42):
+    """Mean successes from just enough experiments for a 95% interval of ±relative_error × mean"""
+    return run_until_precise(partial(coin_flips, n_trials=n_trials, p_success=p_success),
+                             relative_error=relative_error, seed=seed)
+
+def simulate_coin_flips_chunks(n_trials, p_success, n_experiments=1000, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Streaming counterpart of simulate_coin_flips: yields success counts in chunks"""
+    yield from coin_flip_chunks(n_trials, p_success, n_experiments, chunk_size)
+
+# (trials, success probability) of the slide's examples
+EXAMPLES = {
+    'fair_coin': (10, 0.5),
+    'weighted_coin': (20, 0.8),
+    'quality_control': (100, 0.05),
+    'medical_testing': (50, 0.8)
+}
+
+# Most PMF points drawn per plot; larger windows are sampled evenly
+PLOT_MAX_POINTS = 200
 
 def plot_binomial_distribution(n, p, title_suffix=""):
     """Plot binomial distribution"""
-    # Theoretical probabilities
-    x = np.arange(0, n + 1)
-    pmf = stats.binom.pmf(x, n, p)
+    # Theoretical probabilities (only the significant window for large n)
+    x, pmf = binomial_pmf_window(n, p, max_points=PLOT_MAX_POINTS)
+    spacing = max(1, (x[-1] - x[0]) / max(1, len(x) - 1))
     
-    # Simulation
-    simulated = simulate_coin_flips(n, p, 10000)
+    # Simulation (success counts are drawn directly when flipping every coin is too slow)
+    if n <= FULL_SUPPORT_MAX:
+        simulated = simulate_coin_flips(n, p, 10000)
+    else:
+        simulated = np.random.binomial(n, p, 10000)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
     # Plot 1: Theoretical PMF
-    ax1.bar(x, pmf, alpha=0.7, color='skyblue', label='Theoretical PMF')
+    ax1.bar(x, pmf, width=0.8 * spacing, alpha=0.7, color='skyblue', label='Theoretical PMF')
     ax1.set_xlabel('Number of Successes')
     ax1.set_ylabel('Probability')
     ax1.set_title(f'Binomial Distribution B({n}, {p}){title_suffix}')
@@ -85,10 +118,10 @@ def plot_binomial_distribution(n, p, title_suffix=""):
     ax1.legend()
     
     # Plot 2: Simulation vs Theoretical
-    bins = np.arange(-0.5, n + 1.5, 1)
+    bins = np.arange(x[0] - 0.5, x[-1] + 1.5, max(1, (x[-1] - x[0]) // PLOT_MAX_POINTS))
     ax2.hist(simulated, bins=bins, density=True, alpha=0.7, color='lightcoral', 
              label='Simulation (10,000 experiments)')
-    ax2.bar(x, pmf, alpha=0.7, color='skyblue', width=0.4, label='Theoretical PMF')
+    ax2.bar(x, pmf, alpha=0.7, color='skyblue', width=0.4 * spacing, label='Theoretical PMF')
     ax2.set_xlabel('Number of Successes')
     ax2.set_ylabel('Probability Density')
     ax2.set_title(f'Simulation vs Theory{title_suffix}')
@@ -100,12 +133,11 @@ def plot_binomial_distribution(n, p, title_suffix=""):
     # Save plot
     save_name = f"binomial_n{n}_p{p:.1f}{title_suffix.lower().replace(' ', '_').replace('(', '').replace(')', '')}.png"
     save_path = Path(__file__).parent / save_name
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_path = save_figure(save_path)
     print(f"Plot saved to: {save_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()
     return save_path
@@ -118,7 +150,7 @@ def calculate_binomial_properties(n, p):
     
     # Calculate some probabilities
     prob_exact_mean = stats.binom.pmf(int(mean), n, p)
-    prob_at_least_half = 1 - stats.binom.cdf(n//2 - 1, n, p)
+    prob_at_least_half = binomial_sf(n//2 - 1, n, p)
     prob_all_success = stats.binom.pmf(n, n, p)
     prob_no_success = stats.binom.pmf(0, n, p)
     
@@ -132,6 +164,11 @@ def calculate_binomial_properties(n, p):
         'prob_no_success': prob_no_success
     }
 
+def binomial_pmf_table(n, p):
+    """Theoretical PMF of B(n, p) as columns (its significant window for large n)"""
+    x, pmf = binomial_pmf_window(n, p)
+    return {'successes': x, 'probability': pmf}
+
 def compare_different_p_values():
     """Compare binomial distributions with different p values"""
     n = 20
@@ -141,8 +178,7 @@ def compare_different_p_values():
     axes = axes.flatten()
     
     for i, p in enumerate(p_values):
-        x = np.arange(0, n + 1)
-        pmf = stats.binom.pmf(x, n, p)
+        x, pmf = binomial_pmf_window(n, p, max_points=PLOT_MAX_POINTS)
         
         axes[i].bar(x, pmf, alpha=0.7, color=plt.cm.viridis(i/len(p_values)))
         axes[i].set_title(f'B({n}, {p})')
@@ -164,25 +200,55 @@ def compare_different_p_values():
     
     # Save plot
     save_path = Path(__file__).parent / "binomial_comparison.png"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_path = save_figure(save_path)
     print(f"Comparison plot saved to: {save_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()
     return save_path
 
-def main():
-    """Main demonstration function"""
+def estimate_rare_successes(n, p, at_least, n_samples=4000, seed=42):
+    """Importance-sampling estimate of P(X >= at_least) for X ~ B(n, p)"""
+    return tail_probability(BinomialFamily(n, p), at_least, n_samples=n_samples,
+                            rng=np.random.default_rng(seed))
+
+def compute_results():
+    """Compute the slide data without printing or plotting"""
+    result = SlideResult(slide="4", title="Binomial Distribution")
+    for name, (n, p) in EXAMPLES.items():
+        props = calculate_binomial_properties(n, p)
+        result.add_metrics(**{f"{name}_{key}": value for key, value in props.items()})
+    result.add_metrics(quality_control_prob_at_most_3=binomial_cdf(3, 100, 0.05),
+                       medical_testing_prob_at_least_40=binomial_sf(39, 50, 0.8),
+                       quality_control_sampled_prob_at_least_20=estimate_rare_successes(100, 0.05, 20).value)
+    
+    result.add_table("pmf_fair_coin", **binomial_pmf_table(10, 0.5))
+    result.add_table("pmf_weighted_coin", **binomial_pmf_table(20, 0.8))
+    simulated = simulate_coin_flips(10, 0.5, 10000)
+    adaptive = simulate_coin_flips_to_precision(10, 0.5)
+    result.add_metrics(fair_coin_simulated_mean=np.mean(simulated),
+                       fair_coin_simulated_std=np.std(simulated),
+                       fair_coin_adaptive_mean=adaptive.value,
+                       fair_coin_adaptive_experiments=adaptive.n_samples)
+    return result
+
+def main(quiet=False):
+    """Main demonstration function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 4: Binomial Distribution")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
     
     # Fair coin example
     print("\n=== Fair Coin Example: 10 flips ===")
-    n1, p1 = 10, 0.5
+    n1, p1 = EXAMPLES['fair_coin']
     props1 = calculate_binomial_properties(n1, p1)
     
     print(f"Number of trials (n): {n1}")
@@ -195,10 +261,13 @@ def main():
     print(f"Probability of no successes: {props1['prob_no_success']:.6f}")
     
     plot_binomial_distribution(n1, p1, " (Fair Coin)")
+    adaptive = simulate_coin_flips_to_precision(n1, p1)
+    print(f"Experiments needed for the mean within ±0.1% (95% confidence): {adaptive.n_samples:,} "
+          f"-> simulated mean {adaptive.value:.3f}")
     
     # Weighted coin example
     print("\n=== Weighted Coin Example: 20 flips, p=0.8 ===")
-    n2, p2 = 20, 0.8
+    n2, p2 = EXAMPLES['weighted_coin']
     props2 = calculate_binomial_properties(n2, p2)
     
     print(f"Number of trials (n): {n2}")
@@ -217,16 +286,20 @@ def main():
     # Real-world applications
     print("\n=== Real-World Applications ===")
     print("1. Quality Control: Testing 100 products, 5% defect rate")
-    n3, p3 = 100, 0.05
+    n3, p3 = EXAMPLES['quality_control']
     props3 = calculate_binomial_properties(n3, p3)
     print(f"   Expected defects: {props3['mean']:.1f}")
-    print(f"   Probability of ≤3 defects: {stats.binom.cdf(3, n3, p3):.3f}")
+    print(f"   Probability of ≤3 defects: {binomial_cdf(3, n3, p3):.3f}")
+    rare = estimate_rare_successes(n3, p3, 20)
+    low, high = rare.confidence_interval()
+    print(f"   Probability of ≥20 defects (sampled): {rare.value:.3g} "
+          f"(95% CI {low:.3g} to {high:.3g}; exact: {binomial_sf(19, n3, p3):.3g})")
     
     print("\n2. Medical Testing: 50 patients, 80% cure rate")
-    n4, p4 = 50, 0.8
+    n4, p4 = EXAMPLES['medical_testing']
     props4 = calculate_binomial_properties(n4, p4)
     print(f"   Expected cures: {props4['mean']:.1f}")
-    print(f"   Probability of ≥40 cures: {1 - stats.binom.cdf(39, n4, p4):.3f}")
+    print(f"   Probability of ≥40 cures: {binomial_sf(39, n4, p4):.3f}")
     
     print("\nSlide 4 demonstration completed")
 
@@ -10,9 +10,21 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import warnings
+import sys
 from pathlib import Path
-import webbrowser
-from scipy import stats
+
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
+from common.poisson import (centered_support, poisson_pmf, poisson_cdf, poisson_sf,
+                            poisson_samples)
+from common.poisson_process import PoissonProcess
+from common.importance import PoissonFamily, tail_probability
 
 # Configure matplotlib to completely suppress font warnings
 import logging
@@ -31,36 +43,44 @@ warnings.filterwarnings("ignore")
 import matplotlib.pyplot as plt
 plt.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['DejaVu Sans']})
 
-# Set non-interactive backend if running in test environment
-if 'pytest' in str(Path(__file__).parent):
-    matplotlib.use('Agg')
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
 
 def show_slide():
     """Open the HTML slide in browser"""
     try:
         slide_path = Path(__file__).parent / "slide5.html"
         if slide_path.exists():
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         else:
             print(f"HTML slide not found: {slide_path}")
     except Exception as e:
         print(f"Error opening slide: {e}")
 
+# Most PMF points drawn per plot; wider supports are sampled evenly
+PLOT_MAX_POINTS = 200
+
+def plotted_support(lam, max_points=None):
+    """Counts within about 4 standard deviations of the mean"""
+    low = max(0, int(lam - 4 * np.sqrt(lam)) - 5)
+    high = int(lam + 4 * np.sqrt(lam)) + 4
+    return centered_support(low, high, max_points)
+
 def plot_poisson_distribution(lam, title_suffix=""):
     """Plot Poisson distribution"""
-    # Generate x values
-    x_max = int(lam + 4 * np.sqrt(lam)) + 5
-    x = np.arange(0, x_max)
-    pmf = stats.poisson.pmf(x, lam)
+    # Generate x values around the mean
+    x = plotted_support(lam, PLOT_MAX_POINTS)
+    pmf = poisson_pmf(x, lam)
+    spacing = max(1, (x[-1] - x[0]) / max(1, len(x) - 1))
     
-    # Simulation
-    simulated = np.random.poisson(lam, 10000)
+    # Simulation from the global random state
+    simulated = poisson_samples(lam, 10000)
     
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
     # Plot 1: Theoretical PMF
-    ax1.bar(x, pmf, alpha=0.7, color='lightgreen', label='Theoretical PMF')
+    ax1.bar(x, pmf, width=0.8 * spacing, alpha=0.7, color='lightgreen', label='Theoretical PMF')
     ax1.set_xlabel('Number of Events')
     ax1.set_ylabel('Probability')
     ax1.set_title(f'Poisson Distribution (λ = {lam}){title_suffix}')
@@ -71,10 +91,10 @@ def plot_poisson_distribution(lam, title_suffix=""):
     ax1.legend()
     
     # Plot 2: Simulation vs Theoretical
-    bins = np.arange(-0.5, x_max + 0.5, 1)
+    bins = np.arange(x[0] - 0.5, x[-1] + 1.5, max(1, (x[-1] - x[0]) // PLOT_MAX_POINTS))
     ax2.hist(simulated, bins=bins, density=True, alpha=0.7, color='lightcoral', 
              label='Simulation (10,000 samples)')
-    ax2.bar(x, pmf, alpha=0.7, color='lightgreen', width=0.4, label='Theoretical PMF')
+    ax2.bar(x, pmf, alpha=0.7, color='lightgreen', width=0.4 * spacing, label='Theoretical PMF')
     ax2.set_xlabel('Number of Events')
     ax2.set_ylabel('Probability Density')
     ax2.set_title(f'Simulation vs Theory{title_suffix}')
@@ -86,18 +106,58 @@ def plot_poisson_distribution(lam, title_suffix=""):
     # Save plot
     save_name = f"poisson_lambda{lam}{title_suffix.lower().replace(' ', '_').replace('(', '').replace(')', '')}.png"
     save_path = Path(__file__).parent / save_name
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_path = save_figure(save_path)
     print(f"Plot saved to: {save_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()
     return save_path
 
-def main():
-    """Main demonstration function"""
+def poisson_pmf_table(lam):
+    """Theoretical PMF of Poisson(lam) over the plotted range, as columns"""
+    x = plotted_support(lam)
+    return {'events': x, 'probability': poisson_pmf(x, lam)}
+
+def simulate_call_center_year(rate=15, max_calls=10, seed=42):
+    """Fraction of the hours of a simulated year with at most max_calls calls"""
+    hours_per_year = 24 * 365
+    counts = np.concatenate(list(PoissonProcess(rate).window_counts(
+        hours_per_year, 1.0, rng=np.random.default_rng(seed))))
+    return np.mean(counts <= max_calls)
+
+def estimate_rare_events(lam, at_least, n_samples=4000, seed=42):
+    """Importance-sampling estimate of P(X >= at_least) for X ~ Poisson(lam)"""
+    return tail_probability(PoissonFamily(lam), at_least, n_samples=n_samples,
+                            rng=np.random.default_rng(seed))
+
+def compute_results():
+    """Compute the slide data without printing or plotting"""
+    result = SlideResult(slide="5", title="Poisson Distribution")
+    for lam in (2, 8):
+        result.add_metrics(**{f"lambda{lam}_mean": lam, f"lambda{lam}_variance": lam,
+                              f"lambda{lam}_std": np.sqrt(lam)})
+    result.add_metrics(lambda2_prob_0=poisson_pmf(0, 2),
+                       lambda2_prob_1=poisson_pmf(1, 2),
+                       lambda2_prob_more_than_3=poisson_sf(3, 2),
+                       call_center_prob_at_most_10=poisson_cdf(10, 15),
+                       defects_prob_none=poisson_pmf(0, 0.5),
+                       crashes_prob_at_least_3=poisson_sf(2, 2),
+                       call_center_simulated_prob_at_most_10=simulate_call_center_year(),
+                       crashes_sampled_prob_at_least_12=estimate_rare_events(2, 12).value)
+    for lam in (1, 2, 3, 5, 8, 10):
+        result.add_table(f"pmf_lambda{lam}", **poisson_pmf_table(lam))
+    return result
+
+def main(quiet=False):
+    """Main demonstration function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 5: Poisson Distribution")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
@@ -111,9 +171,9 @@ def main():
     print(f"Standard deviation: {np.sqrt(lam1):.3f}")
     
     # Calculate probabilities
-    prob_0 = stats.poisson.pmf(0, lam1)
-    prob_1 = stats.poisson.pmf(1, lam1)
-    prob_more_than_3 = 1 - stats.poisson.cdf(3, lam1)
+    prob_0 = poisson_pmf(0, lam1)
+    prob_1 = poisson_pmf(1, lam1)
+    prob_more_than_3 = poisson_sf(3, lam1)
     
     print(f"P(exactly 0 emails): {prob_0:.3f}")
     print(f"P(exactly 1 email): {prob_1:.3f}")
@@ -138,10 +198,13 @@ def main():
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
     axes = axes.flatten()
     
-    for i, lam in enumerate(lambdas):
-        x_max = int(lam + 4 * np.sqrt(lam)) + 5
-        x = np.arange(0, x_max)
-        pmf = stats.poisson.pmf(x, lam)
+    supports = [plotted_support(lam, PLOT_MAX_POINTS) for lam in lambdas]
+    x_all = np.arange(min(x[0] for x in supports), max(x[-1] for x in supports) + 1)
+    # One batched PMF evaluation for all rates
+    pmfs = poisson_pmf(x_all[:, None], lambdas)
+    
+    for i, (lam, x) in enumerate(zip(lambdas, supports)):
+        pmf = pmfs[x - x_all[0], i]
         
         axes[i].bar(x, pmf, alpha=0.7, color=plt.cm.viridis(i/len(lambdas)))
         axes[i].set_title(f'Poisson(λ = {lam})')
@@ -156,23 +219,27 @@ def main():
     plt.tight_layout()
     
     save_path = Path(__file__).parent / "poisson_comparison.png"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_path = save_figure(save_path)
     print(f"Comparison plot saved to: {save_path}")
     
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    show_figure()
     plt.close()
     
     # Real-world applications
     print("\n=== Real-World Applications ===")
     print("1. Call center: 15 calls per hour")
-    print(f"   P(≤10 calls in hour): {stats.poisson.cdf(10, 15):.3f}")
+    print(f"   P(≤10 calls in hour): {poisson_cdf(10, 15):.3f}")
+    print(f"   Simulated over a year of hours: {simulate_call_center_year():.3f}")
     
     print("2. Manufacturing defects: 0.5 defects per product")
-    print(f"   P(no defects): {stats.poisson.pmf(0, 0.5):.3f}")
+    print(f"   P(no defects): {poisson_pmf(0, 0.5):.3f}")
     
     print("3. Website crashes: 2 per month")
-    print(f"   P(≥3 crashes): {1 - stats.poisson.cdf(2, 2):.3f}")
+    print(f"   P(≥3 crashes): {poisson_sf(2, 2):.3f}")
+    rare = estimate_rare_events(2, 12)
+    low, high = rare.confidence_interval()
+    print(f"   P(≥12 crashes), sampled: {rare.value:.3g} "
+          f"(95% CI {low:.3g} to {high:.3g}; exact: {poisson_sf(11, 2):.3g})")
     
     print("\nSlide 5 demonstration completed")
 
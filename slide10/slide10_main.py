@@ -10,8 +10,17 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import warnings
+import sys
 from pathlib import Path
-import webbrowser
+
+# Add project path for shared utilities
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.rendering import save_figure
+from common.display import configure_backend, show_figure, open_in_browser
+from common.results import SlideResult
 
 # Configure matplotlib to completely suppress font warnings
 import logging
@@ -30,24 +39,45 @@ warnings.filterwarnings("ignore")
 import matplotlib.pyplot as plt
 plt.rcParams.update({'font.family': 'sans-serif', 'font.sans-serif': ['DejaVu Sans']})
 
-# Set non-interactive backend if running in test environment
-if 'pytest' in str(Path(__file__).parent):
-    matplotlib.use('Agg')
+# Set non-interactive backend in headless mode or test environment
+configure_backend(__file__)
 
 def show_slide():
     """Open the HTML slide in browser"""
     try:
         slide_path = Path(__file__).parent / "slide10.html"
         if slide_path.exists():
-            webbrowser.open(f"file://{slide_path.absolute()}")
-            print(f"Slide opened in browser: {slide_path}")
+            if open_in_browser(slide_path):
+                print(f"Slide opened in browser: {slide_path}")
         else:
             print(f"HTML slide not found: {slide_path}")
     except Exception as e:
         print(f"Error opening slide: {e}")
 
-def main():
-    """Main demonstration function"""
+def generate_sample_data(n_samples=1000):
+    """Standard normal sample data shown on the slide"""
+    return np.random.normal(0, 1, n_samples)
+
+def compute_results(data=None):
+    """Compute the slide data without printing or plotting"""
+    if data is None:
+        data = generate_sample_data()
+    counts, bin_edges = np.histogram(data, bins=30)
+    
+    result = SlideResult(slide="10", title="KL Divergence and Cross-Entropy")
+    result.add_metrics(n_samples=len(data), mean=np.mean(data), median=np.median(data),
+                       std=np.std(data, ddof=1), minimum=np.min(data), maximum=np.max(data))
+    result.add_table("histogram", bin_start=bin_edges[:-1], bin_end=bin_edges[1:], count=counts)
+    return result
+
+def main(quiet=False):
+    """Main demonstration function
+
+    With quiet=True the slide returns a SlideResult instead of printing.
+    """
+    if quiet:
+        return compute_results()
+    
     print("Slide 10: KL Divergence and Cross-Entropy")
     print("Lecturer: Dr. Yoram Segal")
     print("=" * 50)
@@ -55,7 +85,7 @@ def main():
     print("\n=== KL Divergence and Cross-Entropy Demonstration ===")
     
     # Generate sample data
-    data = np.random.normal(0, 1, 1000)
+    data = generate_sample_data()
     
     # Create a simple plot
     plt.figure(figsize=(10, 6))
@@ -67,12 +97,11 @@ def main():
     
     # Save plot
     save_path = Path(__file__).parent / "slide10_plot.png"
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    save_path = save_figure(save_path)
     print(f"Plot saved to: {save_path}")
     
-    # Show plot if not in test mode
-    if matplotlib.get_backend() != 'Agg':
-        plt.show()
+    # Show plot unless headless or in test mode
+    show_figure()
     
     plt.close()
     
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pytest hooks shared by all tests
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from tests.test_utils import TEST_WORKER_ENV, compact_error_log
+
+def pytest_sessionstart(session):
+    """Drop cleared records from the error log once per test run"""
+    if not os.environ.get(TEST_WORKER_ENV):
+        compact_error_log(project_root / "tests" / "logs")
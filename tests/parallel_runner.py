@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallel Test Runner
+
+Collects the test suite once and distributes the tests across worker
+processes. On platforms with fork, workers start from the collecting
+process, so numpy, scipy, matplotlib and the test modules are already
+imported. Results are printed as each test finishes.
+
+A worker that dies mid-batch (crash, os._exit, OOM kill) is replaced by
+the pool, but its batch never completes; the runner notices the dead
+process, or a run with no progress for BATCH_STALL_TIMEOUT seconds, and
+reports the batch's unfinished tests as failed instead of waiting forever.
+"""
+
+import io
+import os
+import sys
+import time
+import multiprocessing
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from queue import Empty
+
+import pytest
+
+# Add project path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from tests.test_utils import TEST_WORKER_ENV, flush_error_log
+
+# Number of slowest tests listed in the summary
+SLOWEST_TESTS_SHOWN = 10
+
+# Seconds without any reported test before the remaining batches are given up
+BATCH_STALL_TIMEOUT = 600
+
+class _CollectPlugin:
+    """Pytest plugin that records collected test ids"""
+
+    def __init__(self):
+        self.nodeids = []
+
+    def pytest_collection_modifyitems(self, items):
+        self.nodeids.extend(item.nodeid for item in items)
+
+class _ReportPlugin:
+    """Pytest plugin that sends one result per finished test to a queue"""
+
+    def __init__(self, queue):
+        self.queue = queue
+        self.reports = {}
+
+    def pytest_runtest_logreport(self, report):
+        self.reports.setdefault(report.nodeid, []).append(report)
+        if report.when == "teardown":
+            self.queue.put(_summarize_reports(report.nodeid, self.reports.pop(report.nodeid)))
+
+def _summarize_reports(nodeid, reports):
+    """Combine the setup, call and teardown reports of one test"""
+    outcome = "passed"
+    details = []
+    for report in reports:
+        if report.failed:
+            outcome = "failed"
+            details.append(f"[{report.when}] {report.longreprtext}")
+        elif report.skipped and outcome == "passed":
+            outcome = "skipped"
+
+    return {
+        "nodeid": nodeid,
+        "outcome": outcome,
+        "duration": sum(report.duration for report in reports),
+        "details": "\n".join(details),
+    }
+
+def collect_tests(paths):
+    """Collect test ids for the given paths without running them"""
+    plugin = _CollectPlugin()
+    with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        exit_code = pytest.main(["--collect-only", "-q", "-p", "no:cacheprovider", *paths],
+                                plugins=[plugin])
+    if exit_code not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+        raise RuntimeError(f"Test collection failed with exit code {exit_code}")
+    return plugin.nodeids
+
+def make_batches(nodeids, jobs):
+    """Split test ids into batches that never mix test files
+
+    Each batch costs one pytest session, so batches are as large as possible
+    while still leaving several batches per worker for load balancing.
+    """
+    batch_size = max(1, len(nodeids) // (jobs * 4))
+    batches = []
+    for nodeid in nodeids:
+        test_file = nodeid.split("::")[0]
+        if (batches and len(batches[-1]) < batch_size
+                and batches[-1][0].split("::")[0] == test_file):
+            batches[-1].append(nodeid)
+        else:
+            batches.append([nodeid])
+    return batches
+
+_result_queue = None
+
+def _init_worker(rootdir, queue):
+    """Worker initializer: run from the project root like the collector"""
+    global _result_queue
+    _result_queue = queue
+    os.environ[TEST_WORKER_ENV] = "1"
+    # Some tests start their own worker processes, which daemons may not
+    multiprocessing.current_process().daemon = False
+    os.chdir(rootdir)
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+def run_test_batch(index, nodeids):
+    """Run a batch of tests in one pytest session inside a worker
+
+    Announces which process runs the batch, so a dead worker can be
+    noticed. Returns the pytest output, used to explain tests that never
+    reported.
+    """
+    _result_queue.put({"batch": index, "pid": os.getpid()})
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        pytest.main([*nodeids, "-q", "--tb=short", "-p", "no:cacheprovider"],
+                    plugins=[_ReportPlugin(_result_queue)])
+    # Pool workers are terminated without running atexit handlers
+    flush_error_log()
+    return output.getvalue()
+
+def _get_context():
+    """Prefer fork so workers inherit the already imported modules"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+
+def _print_result(result):
+    """Print one finished test as soon as it is reported"""
+    icon = {"passed": "✅", "failed": "❌", "skipped": "⏭️ "}[result["outcome"]]
+    print(f"{icon} {result['nodeid']} ({result['duration']:.2f}s)", flush=True)
+
+def _lost_batches(running, workers, last_report):
+    """Unfinished batches that will never finish, with the reason
+
+    A batch is lost when the worker that announced it has exited, or when
+    no test has reported for BATCH_STALL_TIMEOUT seconds.
+    """
+    alive = {process.pid for process in multiprocessing.active_children()}
+    lost = {index: f"Worker process {workers[index]} died while running this batch"
+            for index in running if index in workers and workers[index] not in alive}
+    if time.monotonic() - last_report > BATCH_STALL_TIMEOUT:
+        lost.update({index: f"No test reported for {BATCH_STALL_TIMEOUT} seconds"
+                     for index in running if index not in lost})
+    return lost
+
+def run_parallel(paths, jobs=None, rootdir=None):
+    """Run the tests under paths across jobs worker processes
+
+    Returns True if every test passed or was skipped.
+    """
+    rootdir = Path(rootdir or os.getcwd()).absolute()
+    jobs = jobs or os.cpu_count() or 1
+    original_cwd = os.getcwd()
+    os.chdir(rootdir)
+    try:
+        start_time = time.perf_counter()
+        nodeids = collect_tests(paths)
+        batches = make_batches(nodeids, jobs)
+        print(f"Collected {len(nodeids)} tests in {time.perf_counter() - start_time:.2f} seconds")
+        print(f"Running {len(batches)} batches on {jobs} worker(s)...")
+        print("-" * 50)
+
+        context = _get_context()
+        queue = context.Queue()
+        results = {}
+        with context.Pool(jobs, initializer=_init_worker, initargs=(str(rootdir), queue)) as pool:
+            pending = [pool.apply_async(run_test_batch, (index, batch))
+                       for index, batch in enumerate(batches)]
+            workers = {}
+            lost = {}
+            last_report = time.monotonic()
+            # Stream results while the batches run
+            while len(results) < len(nodeids):
+                try:
+                    message = queue.get(timeout=0.5)
+                except Empty:
+                    running = [index for index, result in enumerate(pending)
+                               if not result.ready() and index not in lost]
+                    if not running:
+                        break
+                    lost.update(_lost_batches(running, workers, last_report))
+                    continue
+                last_report = time.monotonic()
+                if "batch" in message:
+                    workers[message["batch"]] = message["pid"]
+                elif message["nodeid"] not in results:
+                    results[message["nodeid"]] = message
+                    _print_result(message)
+
+            # Tests that never reported (e.g. import errors) count as failures
+            for index, batch in enumerate(batches):
+                missing = [nodeid for nodeid in batch if nodeid not in results]
+                if not missing:
+                    continue
+                output = lost[index] if index in lost else pending[index].get()
+                for nodeid in missing:
+                    results[nodeid] = {"nodeid": nodeid, "outcome": "failed",
+                                       "duration": 0.0, "details": output[-2000:]}
+                    _print_result(results[nodeid])
+
+        total_time = time.perf_counter() - start_time
+    finally:
+        os.chdir(original_cwd)
+
+    results = list(results.values())
+    _print_summary(results, total_time)
+    return all(result["outcome"] != "failed" for result in results)
+
+def _print_summary(results, total_time):
+    """Print failures, slowest tests and totals"""
+    failed = [result for result in results if result["outcome"] == "failed"]
+    for result in failed:
+        print("\n" + "=" * 70)
+        print(f"FAILED: {result['nodeid']}")
+        print("=" * 70)
+        print(result["details"])
+
+    print("\n" + "-" * 50)
+    print(f"Slowest {min(SLOWEST_TESTS_SHOWN, len(results))} tests:")
+    for result in sorted(results, key=lambda r: r["duration"], reverse=True)[:SLOWEST_TESTS_SHOWN]:
+        print(f"  {result['duration']:7.2f}s  {result['nodeid']}")
+
+    counts = {outcome: sum(result["outcome"] == outcome for result in results)
+              for outcome in ("passed", "failed", "skipped")}
+    test_time = sum(result["duration"] for result in results)
+    print("-" * 50)
+    print(f"{counts['passed']} passed, {counts['failed']} failed, {counts['skipped']} skipped")
+    print(f"Wall time: {total_time:.2f} seconds (sum of test durations: {test_time:.2f} seconds)")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the test suite in parallel")
+    parser.add_argument("paths", nargs="*", default=["tests"], help="Test files or directories")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Number of workers (default: CPU count)")
+    args = parser.parse_args()
+
+    sys.exit(0 if run_parallel(args.paths, args.jobs) else 1)
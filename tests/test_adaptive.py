@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for precision-targeted adaptive simulation
+"""
+
+import unittest
+import sys
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.adaptive import run_until_precise
+from common.montecarlo import dice_rolls, coin_flips, uniform_draws
+
+class TestRunUntilPrecise(unittest.TestCase):
+    """Tests for stopping at a requested confidence-interval width"""
+
+    def test_half_width_target(self):
+        """Test that the run stops once the half-width is reached, not much later"""
+        result = run_until_precise(partial(dice_rolls, sides=6), half_width=0.005,
+                                   statistic=lambda rolls: rolls == 1, seed=42)
+        self.assertTrue(result.converged)
+        self.assertLessEqual(result.half_width, 0.005)
+        # Theory: 1.96^2 * (1/6)(5/6) / 0.005^2 = 21,342 rolls
+        self.assertTrue(15000 < result.n_samples < 2 * 21342)
+        low, high = result.confidence_interval()
+        self.assertAlmostEqual(high - low, 2 * result.half_width)
+        self.assertTrue(low < 1 / 6 < high)
+
+    def test_relative_error_target(self):
+        """Test a target relative to the mean"""
+        result = run_until_precise(partial(coin_flips, n_trials=10, p_success=0.5),
+                                   relative_error=0.002, seed=1)
+        self.assertTrue(result.converged)
+        self.assertLessEqual(result.half_width, 0.002 * result.value)
+        self.assertAlmostEqual(result.value, 5, delta=0.02)
+
+    def test_several_quantities(self):
+        """Test that every quantity of a row statistic must meet the target"""
+        result = run_until_precise(partial(dice_rolls, sides=6), half_width=0.01,
+                                   statistic=lambda rolls: rolls[:, None] == np.arange(1, 7), seed=2)
+        self.assertEqual(result.value.shape, (6,))
+        self.assertTrue(np.all(result.half_width <= 0.01))
+        self.assertAlmostEqual(result.value.sum(), 1.0)
+
+    def test_max_samples(self):
+        """Test that an unreachable target stops at max_samples"""
+        result = run_until_precise(uniform_draws, relative_error=1e-6, batch_size=1000,
+                                   max_samples=50_000, seed=3)
+        self.assertFalse(result.converged)
+        self.assertEqual(result.n_samples, 50_000)
+
+    def test_coverage(self):
+        """Test that the intervals cover the true mean at about the requested rate"""
+        rng = np.random.default_rng(4)
+        covered = []
+        for _ in range(200):
+            result = run_until_precise(uniform_draws, half_width=0.01, batch_size=256, seed=rng)
+            low, high = result.confidence_interval()
+            covered.append(low <= 0.5 <= high)
+        self.assertGreater(np.mean(covered), 0.9)
+
+    def test_reproducible(self):
+        """Test that the same seed gives the same result"""
+        first = run_until_precise(uniform_draws, half_width=0.01, seed=5)
+        second = run_until_precise(uniform_draws, half_width=0.01, seed=5)
+        self.assertEqual((first.value, first.n_samples), (second.value, second.n_samples))
+
+    def test_invalid_input(self):
+        """Test invalid targets and batch settings"""
+        for kwargs in ({}, {'half_width': 0.1, 'relative_error': 0.1}, {'half_width': 0},
+                       {'half_width': 0.1, 'confidence': 1.0},
+                       {'half_width': 0.1, 'batch_size': 100, 'max_samples': 10}):
+            with self.assertRaises(ValueError):
+                run_until_precise(uniform_draws, **kwargs)
+
+if __name__ == '__main__':
+    unittest.main()
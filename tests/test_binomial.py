@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for large-n binomial evaluation
+"""
+
+import unittest
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.binomial import (binomial_log_pmf, binomial_window, binomial_pmf_window,
+                             binomial_log_sf, binomial_log_cdf, binomial_sf)
+
+def exact_log_tail(n, successes, numerator, denominator):
+    """Exact log of sum P(X = k) for p = numerator / denominator (integer arithmetic)"""
+    total = sum(math.comb(n, k) * numerator**k * (denominator - numerator)**(n - k)
+                for k in successes)
+    return math.log(total) - n * math.log(denominator)
+
+class TestBinomialLogPmf(unittest.TestCase):
+    """Tests for the log-space PMF"""
+
+    def test_matches_exact_values(self):
+        """Test log PMF against exact integer arithmetic, far tails included"""
+        n = 2000
+        for k in (0, 1, 17, 600, 1400, 1999, 2000):
+            self.assertAlmostEqual(binomial_log_pmf(k, n, 0.3),
+                                   exact_log_tail(n, [k], 3, 10), delta=1e-11)
+
+    def test_matches_scipy_for_small_n(self):
+        """Test the PMF against scipy on the slides' sizes"""
+        for n, p in ((1, 0.5), (10, 0.5), (20, 0.8), (100, 0.05)):
+            x = np.arange(-1, n + 2)
+            np.testing.assert_allclose(np.exp(binomial_log_pmf(x, n, p)),
+                                       stats.binom.pmf(x, n, p), rtol=1e-12, atol=1e-300)
+
+    def test_edge_cases(self):
+        """Test non-integers, degenerate p and invalid arguments"""
+        self.assertEqual(binomial_log_pmf(2.5, 10, 0.5), -np.inf)
+        self.assertEqual(binomial_log_pmf(0, 10, 0.0), 0.0)
+        self.assertEqual(binomial_log_pmf(1, 10, 0.0), -np.inf)
+        with self.assertRaises(ValueError):
+            binomial_log_pmf(1, 10, 1.5)
+        with self.assertRaises(ValueError):
+            binomial_window(-1, 0.5)
+
+class TestBinomialWindow(unittest.TestCase):
+    """Tests for windowed evaluation with huge n"""
+
+    def test_small_n_uses_full_support(self):
+        """Test that small supports are evaluated in full"""
+        self.assertEqual(binomial_window(20, 0.1), (0, 20))
+        x, pmf = binomial_pmf_window(20, 0.8)
+        np.testing.assert_array_equal(x, np.arange(21))
+
+    def test_huge_n_window_holds_the_mass(self):
+        """Test that the window for n = 10^9 is narrow and sums to 1"""
+        n, p = 10**9, 0.3
+        low, high = binomial_window(n, p)
+        std = math.sqrt(n * p * (1 - p))
+        self.assertLess(high - low, 20 * std)
+        self.assertTrue(low < n * p < high)
+        x, pmf = binomial_pmf_window(n, p)
+        self.assertAlmostEqual(pmf.sum(), 1.0, delta=1e-12)
+
+    def test_max_points(self):
+        """Test that max_points bounds the evaluated points"""
+        x, pmf = binomial_pmf_window(10**12, 0.5, max_points=200)
+        self.assertLessEqual(len(x), 200)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        self.assertAlmostEqual(pmf.max(), stats.norm.pdf(0, scale=math.sqrt(2.5e11)), delta=1e-9)
+
+class TestBinomialTails(unittest.TestCase):
+    """Tests for survival functions"""
+
+    def test_log_sf_matches_exact_tails(self):
+        """Test log tails, including ones that underflow float64"""
+        n = 2000
+        for k in (650, 900, 1500, 1990):
+            self.assertAlmostEqual(binomial_log_sf(k, n, 0.3),
+                                   exact_log_tail(n, range(k + 1, n + 1), 3, 10), delta=1e-9)
+        self.assertAlmostEqual(binomial_log_cdf(10, n, 0.3),
+                               exact_log_tail(n, range(11), 3, 10), delta=1e-9)
+        self.assertEqual(binomial_log_sf(n, n, 0.3), -np.inf)
+
+    def test_huge_n_far_tail(self):
+        """Test a tail 40 standard deviations out at n = 10^9"""
+        n, p = 10**9, 0.3
+        k = int(n * p + 40 * math.sqrt(n * p * (1 - p)))
+        self.assertEqual(stats.binom.sf(k, n, p), 0.0)
+        log_sf = binomial_log_sf(k, n, p)
+        # Normal approximation: about -z^2 / 2 - log(z sqrt(2 pi)), skewed by the third moment
+        self.assertTrue(-830 < log_sf < -790)
+
+    def test_sf_avoids_cancellation(self):
+        """Test that sf keeps precision where 1 - cdf rounds to 0"""
+        n, p = 10**6, 0.5
+        k = n // 2 + 5000
+        self.assertEqual(1 - stats.binom.cdf(k, n, p), 0.0)
+        self.assertGreater(binomial_sf(k, n, p), 0.0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for file descriptor level output capture
+"""
+
+import unittest
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.capture import RingBuffer, FDOutputCapture
+from tests.test_utils import OutputCapture
+
+class TestRingBuffer(unittest.TestCase):
+    """Tests for the bounded capture buffer"""
+
+    def test_keeps_most_recent_bytes(self):
+        """Test that only the newest bytes are kept"""
+        buffer = RingBuffer(max_bytes=10)
+        buffer.write(b"0123456789")
+        buffer.write(b"abc")
+        self.assertEqual(buffer.getvalue(), "3456789abc")
+        self.assertEqual(buffer.total_bytes, 13)
+        self.assertEqual(buffer.dropped_bytes, 3)
+
+    def test_single_large_write(self):
+        """Test a write larger than the whole buffer"""
+        buffer = RingBuffer(max_bytes=4)
+        buffer.write(b"abcdefgh")
+        self.assertEqual(buffer.getvalue(), "efgh")
+
+    def test_invalid_size(self):
+        """Test that the buffer size must be positive"""
+        with self.assertRaises(ValueError):
+            RingBuffer(max_bytes=0)
+
+class TestFDOutputCapture(unittest.TestCase):
+    """Tests for capturing stdout and stderr file descriptors"""
+
+    def test_print_and_raw_writes(self):
+        """Test capturing print() and direct descriptor writes"""
+        with FDOutputCapture() as capture:
+            print("from print")
+            sys.stdout.flush()
+            os.write(1, b"from fd 1\n")
+            print("to stderr", file=sys.stderr)
+
+        self.assertEqual(capture.get_stdout(), "from print\nfrom fd 1\n")
+        self.assertEqual(capture.get_stderr(), "to stderr\n")
+        self.assertEqual(capture.get_combined(), "from print\nfrom fd 1\nto stderr\n")
+
+    def test_subprocess_output(self):
+        """Test capturing output written by a child process"""
+        with FDOutputCapture() as capture:
+            subprocess.run([sys.executable, "-c", "print('child says hi')"], check=True)
+        self.assertIn("child says hi", capture.get_stdout())
+
+    def test_discard_stream(self):
+        """Test that discarded streams are not kept"""
+        with FDOutputCapture(discard=("stdout",)) as capture:
+            print("thrown away")
+            print("kept", file=sys.stderr)
+        self.assertEqual(capture.get_stdout(), "")
+        self.assertEqual(capture.get_stderr(), "kept\n")
+
+    def test_bounded_memory(self):
+        """Test that verbose output never grows the buffer past its limit"""
+        line = "simulation step finished with a verbose status message\n"
+        with FDOutputCapture(max_bytes=4096) as capture:
+            for i in range(100000):
+                sys.stdout.write(line)
+            print("last line")
+
+        self.assertTrue(capture.truncated)
+        self.assertLessEqual(len(capture.get_stdout()), 4096)
+        self.assertTrue(capture.get_stdout().endswith("last line\n"))
+
+    def test_streams_restored(self):
+        """Test that stdout and stderr are restored after the block"""
+        original_stdout, original_stderr = sys.stdout, sys.stderr
+        with FDOutputCapture():
+            pass
+        self.assertIs(sys.stdout, original_stdout)
+        self.assertIs(sys.stderr, original_stderr)
+
+    def test_invalid_discard(self):
+        """Test that unknown stream names are rejected"""
+        with self.assertRaises(ValueError):
+            FDOutputCapture(discard=("stdlog",))
+
+class TestOutputCapture(unittest.TestCase):
+    """Tests for the capture used by the slide tests"""
+
+    def test_captures_at_descriptor_level(self):
+        """Test that slide tests also see child process and raw descriptor output"""
+        with OutputCapture() as capture:
+            print("from print")
+            sys.stdout.flush()
+            subprocess.run([sys.executable, "-c", "print('child says hi')"], check=True)
+            os.write(2, b"from fd 2\n")
+        self.assertEqual(capture.get_stdout(), "from print\nchild says hi\n")
+        self.assertEqual(capture.get_combined(), "from print\nchild says hi\nfrom fd 2\n")
+
+    def test_bounded_and_discarded(self):
+        """Test the buffer limit and discarded streams"""
+        with OutputCapture(max_bytes=1024, discard=("stderr",)) as capture:
+            for i in range(10000):
+                print(f"step {i}")
+            print("dropped", file=sys.stderr)
+        self.assertTrue(capture.truncated)
+        self.assertTrue(capture.get_stdout().endswith("step 9999\n"))
+        self.assertEqual(capture.get_stderr(), "")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the discrete distribution algebra
+"""
+
+import unittest
+import sys
+from fractions import Fraction
+from pathlib import Path
+
+import numpy as np
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.discrete import DiscreteDistribution
+
+def exact_dice_sum(n_dice, sides=6):
+    """Exact probabilities of the sum of n dice by integer convolution"""
+    counts = np.array([1], dtype=object)
+    for _ in range(n_dice):
+        counts = np.convolve(counts, np.ones(sides, dtype=object))
+    return np.array([float(Fraction(int(count), sides ** n_dice)) for count in counts])
+
+class TestEvents(unittest.TestCase):
+    """Tests for event masks on a single die"""
+
+    def setUp(self):
+        self.die = DiscreteDistribution.die(6)
+        self.even = self.die.event(lambda x: x % 2 == 0)
+        self.six = self.die.event([6])
+
+    def test_event_forms(self):
+        """Test predicates, outcome lists and masks describe the same event"""
+        np.testing.assert_array_equal(self.even, self.die.event([2, 4, 6]))
+        np.testing.assert_array_equal(self.even, self.die.event(self.even))
+        self.assertEqual(self.die.outcomes(self.even).tolist(), [2, 4, 6])
+
+    def test_set_operations(self):
+        """Test complement, union and intersection"""
+        self.assertAlmostEqual(self.die.prob(~self.even), 0.5)
+        self.assertAlmostEqual(self.die.prob(self.even | ~self.even), 1.0)
+        self.assertAlmostEqual(self.die.prob(self.even & self.six), 1/6)
+        self.assertAlmostEqual(self.die.prob(~self.six), 5/6)
+
+    def test_conditioning(self):
+        """Test conditional probabilities and conditioned distributions"""
+        self.assertAlmostEqual(self.die.conditional_prob(self.six, self.even), 1/3)
+        given_even = self.die.condition(self.even)
+        self.assertEqual(given_even.values.tolist(), [2, 4, 6])
+        self.assertAlmostEqual(given_even.mean, 4.0)
+        with self.assertRaises(ValueError):
+            self.die.condition([7])
+
+    def test_non_vectorized_predicate_rejected(self):
+        """Test that scalar predicates raise a clear error"""
+        with self.assertRaises(ValueError):
+            self.die.event(lambda x: True)
+
+class TestDistribution(unittest.TestCase):
+    """Tests for construction, statistics and sums"""
+
+    def test_weights_normalized_and_merged(self):
+        """Test that weights are normalized and duplicate outcomes merged"""
+        dist = DiscreteDistribution([3, 1, 1], [2, 1, 1])
+        self.assertEqual(dist.values.tolist(), [1, 3])
+        np.testing.assert_allclose(dist.probabilities, [0.5, 0.5])
+
+    def test_invalid_probabilities(self):
+        """Test that negative or all-zero weights are rejected"""
+        with self.assertRaises(ValueError):
+            DiscreteDistribution([1, 2], [0.5, -0.5])
+        with self.assertRaises(ValueError):
+            DiscreteDistribution([1, 2], [0, 0])
+
+    def test_pmf_cdf_and_moments(self):
+        """Test lookups and moments of two dice"""
+        two_dice = DiscreteDistribution.die(6) + DiscreteDistribution.die(6)
+        np.testing.assert_allclose(two_dice.pmf([1, 2, 7, 12, 13]), [0, 1/36, 6/36, 1/36, 0])
+        self.assertAlmostEqual(float(two_dice.cdf(7)), 21/36)
+        self.assertAlmostEqual(two_dice.mean, 7.0)
+        self.assertAlmostEqual(two_dice.variance, 35/6)
+
+    def test_twenty_dice_relative_accuracy(self):
+        """Test that even the rarest sums of 20d6 are accurate"""
+        twenty = DiscreteDistribution.die(6, n_dice=20)
+        self.assertEqual(twenty.values.tolist(), list(range(20, 121)))
+        np.testing.assert_allclose(twenty.probabilities, exact_dice_sum(20), rtol=1e-12)
+        self.assertAlmostEqual(twenty.prob(lambda x: x >= 100),
+                               exact_dice_sum(20)[80:].sum(), places=15)
+
+    def test_sum_matches_repeated_addition(self):
+        """Test sum_iid against pairwise sums, including gaps in the support"""
+        coin = DiscreteDistribution([0, 10])
+        three = coin.sum_iid(3)
+        self.assertEqual(three.values.tolist(), [0, 10, 20, 30])
+        np.testing.assert_allclose(three.probabilities, [1/8, 3/8, 3/8, 1/8])
+        np.testing.assert_allclose((coin + coin + coin).probabilities, three.probabilities)
+
+    def test_large_sum_uses_fft(self):
+        """Test a sum large enough for the FFT path"""
+        many = DiscreteDistribution.die(6, n_dice=1000)
+        self.assertEqual(len(many), 5001)
+        self.assertAlmostEqual(many.probabilities.sum(), 1.0)
+        self.assertAlmostEqual(many.mean, 3500.0, places=6)
+        self.assertAlmostEqual(many.variance, 1000 * 35/12, places=3)
+
+    def test_non_integer_and_constant_sums(self):
+        """Test sums of non-integer outcomes and shifts by a constant"""
+        halves = DiscreteDistribution([0.5, 1.5]) + DiscreteDistribution([0.5, 1.5])
+        self.assertEqual(halves.values.tolist(), [1.0, 2.0, 3.0])
+        np.testing.assert_allclose(halves.probabilities, [0.25, 0.5, 0.25])
+        self.assertEqual((DiscreteDistribution.die(6) + 10).values.tolist(), list(range(11, 17)))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the JSONL error log
+"""
+
+import unittest
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests import conftest
+from tests.test_utils import (ErrorLogger, ERROR_LOG_FILE, ERROR_LOG_MAX_OUTPUT, TEST_WORKER_ENV,
+                              flush_error_log, read_error_log, summarize_errors, compact_error_log,
+                              OutputCapture)
+
+# Logs errors from a separate interpreter, like a parallel test worker
+WRITER_SCRIPT = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from tests.test_utils import ErrorLogger, OutputCapture
+error_logger = ErrorLogger(f"worker_{sys.argv[3]}", sys.argv[2])
+with OutputCapture(discard=("stdout", "stderr")):
+    for i in range(int(sys.argv[4])):
+        error_logger.log_error(expected=i, actual="x" * 500, error_type="PERFORMANCE_SLOW")
+"""
+
+class TestErrorLog(unittest.TestCase):
+    """Tests for the append-only error log"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_dir = self.temp_dir.name
+        self.error_logger = ErrorLogger("sample_test", self.log_dir)
+
+    def tearDown(self):
+        flush_error_log()
+        self.temp_dir.cleanup()
+
+    def _log(self, error_type):
+        with OutputCapture(discard=("stdout", "stderr")):
+            self.error_logger.log_error(expected="a", actual="b", error_type=error_type)
+
+    def test_single_log_file(self):
+        """Test that all errors go to one JSONL file"""
+        self._log("OUTPUT_MISMATCH")
+        self._log("PERFORMANCE_SLOW")
+        flush_error_log()
+
+        self.assertEqual([p.name for p in Path(self.log_dir).iterdir()], [ERROR_LOG_FILE])
+        lines = (Path(self.log_dir) / ERROR_LOG_FILE).read_text(encoding='utf-8').splitlines()
+        self.assertEqual([json.loads(line)["error_type"] for line in lines],
+                         ["OUTPUT_MISMATCH", "PERFORMANCE_SLOW"])
+
+    def test_clear_hides_earlier_errors(self):
+        """Test that clear_log hides errors logged before it"""
+        self._log("OUTPUT_MISMATCH")
+        self.error_logger.clear_log()
+        self._log("PERFORMANCE_SLOW")
+
+        records = read_error_log(self.log_dir)
+        self.assertEqual([record["error_type"] for record in records], ["PERFORMANCE_SLOW"])
+
+    def test_clear_without_errors_writes_nothing(self):
+        """Test that clearing an empty log does not grow it"""
+        for _ in range(5):
+            self.error_logger.clear_log()
+        flush_error_log()
+        self.assertFalse((Path(self.log_dir) / ERROR_LOG_FILE).exists())
+
+    def test_compact_keeps_only_current_errors(self):
+        """Test that compaction drops clear markers and cleared errors"""
+        self._log("OUTPUT_MISMATCH")
+        self.error_logger.clear_log()
+        self._log("PERFORMANCE_SLOW")
+        compact_error_log(self.log_dir)
+
+        lines = (Path(self.log_dir) / ERROR_LOG_FILE).read_text(encoding='utf-8').splitlines()
+        self.assertEqual([json.loads(line)["error_type"] for line in lines], ["PERFORMANCE_SLOW"])
+        self.assertEqual(len(read_error_log(self.log_dir)), 1)
+
+    def test_compacted_only_outside_workers(self):
+        """Test that parallel workers' sessions leave compaction to the parent"""
+        with mock.patch.object(conftest, "compact_error_log") as compact:
+            with mock.patch.dict(os.environ, {TEST_WORKER_ENV: "1"}):
+                conftest.pytest_sessionstart(None)
+            compact.assert_not_called()
+            with mock.patch.dict(os.environ):
+                os.environ.pop(TEST_WORKER_ENV, None)
+                conftest.pytest_sessionstart(None)
+            compact.assert_called_once()
+
+    def test_long_output_is_capped(self):
+        """Test that long captured output is shortened, keeping its end"""
+        with OutputCapture(discard=("stdout", "stderr")):
+            self.error_logger.log_error(expected="a", actual="x" * 100_000 + "Traceback")
+        record, = read_error_log(self.log_dir)
+        self.assertLess(len(record["actual"]), ERROR_LOG_MAX_OUTPUT + 100)
+        self.assertTrue(record["actual"].endswith("Traceback"))
+
+    def test_summary_by_test_and_type(self):
+        """Test counting errors by test name and error type"""
+        for _ in range(3):
+            self._log("PERFORMANCE_SLOW")
+        self._log("OUTPUT_MISMATCH")
+
+        summary = summarize_errors(self.log_dir)
+        self.assertEqual(summary["sample_test"]["PERFORMANCE_SLOW"]["count"], 3)
+        self.assertEqual(summary["sample_test"]["OUTPUT_MISMATCH"]["count"], 1)
+
+    def test_concurrent_processes(self):
+        """Test that concurrent writers never corrupt or lose lines"""
+        workers, count = 4, 200
+        processes = [subprocess.Popen([sys.executable, "-c", WRITER_SCRIPT, str(project_root),
+                                       self.log_dir, str(w), str(count)])
+                     for w in range(workers)]
+        for process in processes:
+            self.assertEqual(process.wait(timeout=60), 0)
+
+        lines = (Path(self.log_dir) / ERROR_LOG_FILE).read_text(encoding='utf-8').splitlines()
+        self.assertEqual(len(lines), workers * count)
+        for line in lines:
+            json.loads(line)  # Every line must be a complete record
+
+        summary = summarize_errors(self.log_dir)
+        for w in range(workers):
+            self.assertEqual(summary[f"worker_{w}"]["PERFORMANCE_SLOW"]["count"], count)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_child_does_not_repeat_parent_records(self):
+        """Test that records buffered before a fork are written only once"""
+        self._log("OUTPUT_MISMATCH")
+        pid = os.fork()
+        if pid == 0:
+            flush_error_log()
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+        self.assertEqual(len(read_error_log(self.log_dir)), 1)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
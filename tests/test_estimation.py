@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the variance-reduced Monte Carlo estimators
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.estimation import (ESTIMATORS, estimate_expectation, estimate_probabilities,
+                               stratified_estimate)
+
+# Interval bounds that do not fall on stratum edges
+INTERVALS = [(-np.inf, 3.01), (6.013, np.inf), (2.007, 8.003)]
+
+class TestEstimators(unittest.TestCase):
+    """Tests for the estimators and their standard errors"""
+
+    def setUp(self):
+        self.dist = stats.uniform(0, 10)
+        self.exact = np.array([self.dist.cdf(high) - self.dist.cdf(low) for low, high in INTERVALS])
+
+    def test_standard_errors_match_spread(self):
+        """Test that reported standard errors match the spread over repetitions"""
+        rng = np.random.default_rng(0)
+        for method in ESTIMATORS:
+            estimates = [estimate_probabilities(self.dist, INTERVALS, 1000, method, rng) for _ in range(200)]
+            values = np.array([estimate.value for estimate in estimates])
+            # Variances average out; standard errors from few samples per stratum do not
+            reported = np.sqrt(np.mean([estimate.std_error ** 2 for estimate in estimates], axis=0))
+            np.testing.assert_allclose(values.mean(axis=0), self.exact, atol=4 * reported.max() / np.sqrt(200) + 1e-9)
+            np.testing.assert_allclose(values.std(axis=0), reported, rtol=0.25, err_msg=method)
+
+    def test_variance_reduction(self):
+        """Test that stratified and control-variate estimates beat plain ones"""
+        rng = np.random.default_rng(1)
+        plain = estimate_probabilities(self.dist, INTERVALS, 1000, "plain", rng)
+        control = estimate_probabilities(self.dist, INTERVALS[:2], 1000, "control_variate", rng)
+        stratified = estimate_probabilities(self.dist, INTERVALS, 1000, "stratified", rng)
+        self.assertTrue(np.all(control.std_error < plain.std_error[:2]))
+        self.assertTrue(np.all(stratified.std_error < plain.std_error / 10))
+
+    def test_shapes(self):
+        """Test scalar and vector-valued functions"""
+        rng = np.random.default_rng(2)
+        for method in ESTIMATORS:
+            scalar = estimate_expectation(np.square, stats.norm(), 1000, method, rng)
+            self.assertEqual(np.shape(scalar.value), ())
+            self.assertEqual(np.shape(scalar.std_error), ())
+            self.assertAlmostEqual(scalar.value, 1.0, delta=5 * scalar.std_error + 1e-3)
+            vector = estimate_probabilities(self.dist, INTERVALS, 1000, method, rng)
+            self.assertEqual(vector.value.shape, (3,))
+            # Methods may round n down to whole pairs, strata or replicates
+            self.assertTrue(950 <= vector.n_samples <= 1000)
+            low, high = vector.confidence_interval()
+            self.assertTrue(np.all(low <= vector.value) and np.all(vector.value <= high))
+
+    def test_global_random_state(self):
+        """Test that rng=None follows np.random.seed()"""
+        np.random.seed(42)
+        first = estimate_probabilities(self.dist, INTERVALS, 100, "plain")
+        np.random.seed(42)
+        second = estimate_probabilities(self.dist, INTERVALS, 100, "plain")
+        np.testing.assert_array_equal(first.value, second.value)
+
+    def test_int_seed(self):
+        """Test that an int seed makes every method reproducible"""
+        for method in ESTIMATORS:
+            with self.subTest(method=method):
+                first = estimate_probabilities(self.dist, INTERVALS, 256, method, rng=7)
+                second = estimate_probabilities(self.dist, INTERVALS, 256, method, rng=7)
+                np.testing.assert_array_equal(first.value, second.value)
+        # The seed must not give every RQMC replicate the same scrambling
+        self.assertTrue(np.all(estimate_probabilities(self.dist, INTERVALS, 256, "sobol", rng=7).std_error > 0))
+
+    def test_invalid_input(self):
+        """Test unknown methods and too few samples"""
+        with self.assertRaises(ValueError):
+            estimate_probabilities(self.dist, INTERVALS, 100, "magic")
+        with self.assertRaises(ValueError):
+            estimate_probabilities(self.dist, INTERVALS, 3, "antithetic")
+        with self.assertRaises(ValueError):
+            stratified_estimate(np.square, self.dist, 100, strata=60)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for bitset events and sample spaces
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.events import SampleSpace
+from common.discrete import DiscreteDistribution
+
+class TestDiceEvents(unittest.TestCase):
+    """Tests for set operations on a single die"""
+
+    def setUp(self):
+        self.die = SampleSpace(range(1, 7))
+        self.even = self.die.event(lambda x: x % 2 == 0)
+        self.six = self.die.event([6])
+
+    def test_set_operations(self):
+        """Test complement, union, intersection and difference"""
+        self.assertEqual((~self.even).outcomes().tolist(), [1, 3, 5])
+        self.assertEqual((self.even | self.six).outcomes().tolist(), [2, 4, 6])
+        self.assertEqual((self.even & self.six).outcomes().tolist(), [6])
+        self.assertEqual((self.even - self.six).outcomes().tolist(), [2, 4])
+        self.assertEqual((self.even ^ self.die.event([1, 2])).outcomes().tolist(), [1, 4, 6])
+        self.assertEqual(~self.die.empty(), self.die.full())
+
+    def test_probabilities(self):
+        """Test probabilities and conditional probabilities"""
+        self.assertAlmostEqual(self.even.prob(), 0.5)
+        self.assertAlmostEqual((~self.six).prob(), 5/6)
+        self.assertAlmostEqual(self.six.given(self.even), 1/3)
+        self.assertEqual(len(self.even), 3)
+
+    def test_relations(self):
+        """Test subset and disjointness checks"""
+        self.assertTrue(self.six.issubset(self.even))
+        self.assertTrue(self.six.isdisjoint(~self.even))
+        self.assertFalse(self.even.isdisjoint(self.six))
+
+    def test_events_of_different_spaces(self):
+        """Test that events of different spaces cannot be combined"""
+        other = SampleSpace(range(1, 7)).event([6])
+        with self.assertRaises(ValueError):
+            self.six | other
+
+class TestSpaces(unittest.TestCase):
+    """Tests for weighted, product and large sample spaces"""
+
+    def test_complement_keeps_padding_clear(self):
+        """Test complements when the size is not a multiple of 64"""
+        space = SampleSpace(np.arange(130))
+        event = space.event(lambda x: x < 10)
+        self.assertEqual(len(~event), 120)
+        self.assertEqual(len(~~event), 10)
+
+    def test_weighted_space(self):
+        """Test probabilities of a weighted space built from a distribution"""
+        two_dice = SampleSpace.from_distribution(DiscreteDistribution.die(6, n_dice=2))
+        self.assertAlmostEqual(two_dice.event([7]).prob(), 6/36)
+        self.assertAlmostEqual((~two_dice.event([7])).prob(), 30/36)
+
+    def test_product_space_independence(self):
+        """Test that independent dice give P(A ∩ B) = P(A) P(B)"""
+        die = SampleSpace(range(1, 7))
+        two_dice = SampleSpace.product(die, die)
+        self.assertEqual(len(two_dice), 36)
+        six_first = two_dice.event(lambda rolls: rolls[:, 0] == 6)
+        six_second = two_dice.event(lambda rolls: rolls[:, 1] == 6)
+        self.assertAlmostEqual((six_first & six_second).prob(), six_first.prob() * six_second.prob())
+        with self.assertRaises(ValueError):
+            two_dice.event([6])
+
+    def test_large_space_matches_masks(self):
+        """Test bitset results against boolean masks on a large space"""
+        rng = np.random.default_rng(0)
+        size = 1_000_003
+        weights = rng.random(size)
+        space = SampleSpace(np.arange(size), weights)
+        mask_a, mask_b = rng.random(size) < 0.3, rng.random(size) < 0.6
+        a, b = space.event(mask_a), space.event(mask_b)
+        np.testing.assert_array_equal((a | ~b).mask(), mask_a | ~mask_b)
+        self.assertEqual(len(a & b), int(np.sum(mask_a & mask_b)))
+        self.assertAlmostEqual((a & b).prob(), weights[mask_a & mask_b].sum() / weights.sum())
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
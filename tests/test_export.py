@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for exporting slide results
+"""
+
+import unittest
+import argparse
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.results import SlideResult
+from common.export import METRICS_TABLE, results_to_frame, export_results, load_results
+import main
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+class TestExport(unittest.TestCase):
+    """Tests for the long-format result table"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.temp_dir.name)
+        first = SlideResult(slide="2b", title="Histogram")
+        first.add_metrics(chi_square=15.08, degrees_of_freedom=19, interpretation="Good fit")
+        first.add_table("bins", bin_start=[0.0, 0.5], count=[48, 52])
+        second = SlideResult(slide="4", title="Binomial")
+        second.add_metrics(mean=5.0)
+        self.results = [first, second]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_long_format(self):
+        """Test that metrics and table cells become one row per value"""
+        frame = results_to_frame(self.results)
+        self.assertEqual(list(frame.columns), ["slide", "table", "row", "column", "value"])
+        # Text metrics are skipped: 2 + 4 values for slide 2b, 1 for slide 4
+        self.assertEqual(len(frame), 7)
+        metrics = frame[frame["table"] == METRICS_TABLE]
+        self.assertEqual(set(metrics["column"]), {"chi_square", "degrees_of_freedom", "mean"})
+        counts = frame[(frame["table"] == "bins") & (frame["column"] == "count")]
+        self.assertEqual(counts["row"].tolist(), [0, 1])
+        self.assertEqual(counts["value"].tolist(), [48.0, 52.0])
+
+    def test_json_round_trip(self):
+        """Test JSON export and loading"""
+        path = self.out_dir / "results.json"
+        self.assertEqual(export_results(self.results, path), 7)
+        self.assertIn("value", json.loads(path.read_text()))
+        loaded = load_results(path)
+        self.assertEqual(loaded["value"].tolist(), results_to_frame(self.results)["value"].tolist())
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet_round_trip(self):
+        """Test Parquet export and loading"""
+        path = self.out_dir / "nested" / "results.parquet"
+        export_results(self.results, path)
+        loaded = load_results(path)
+        self.assertEqual(len(loaded), 7)
+        self.assertEqual(loaded["slide"].astype(str).tolist()[:2], ["2b", "2b"])
+
+    def test_unknown_format(self):
+        """Test that unsupported file extensions are rejected"""
+        with self.assertRaises(ValueError):
+            export_results(self.results, self.out_dir / "results.csv")
+
+class TestExportCommand(unittest.TestCase):
+    """Tests for main.py --export and --slides"""
+
+    def test_slide_list(self):
+        """Test that every slide, including slide 1, can be named in --slides"""
+        self.assertEqual(main.parse_slide_list("1"), ["1"])
+        self.assertEqual(main.parse_slide_list(",".join(main.SLIDE_IDS)), main.SLIDE_IDS)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            main.parse_slide_list("1,11")
+
+    def test_default_export_has_every_slide(self):
+        """Test that --export without --slides exports all slides, slide 1 included"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "results.json"
+            with mock.patch.object(sys, "argv", ["main.py", "--export", str(path)]), \
+                    redirect_stdout(io.StringIO()), self.assertRaises(SystemExit) as exit_info:
+                main.main()
+            self.assertEqual(exit_info.exception.code, 0)
+            slides = set(load_results(path)["slide"].astype(str))
+        self.assertIn("1", slides)
+        self.assertEqual(slides, set(main.SLIDE_IDS))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for importance sampling of rare-event tail probabilities
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.importance import (TiltedFamily, NormalFamily, BinomialFamily, PoissonFamily,
+                               tail_probability)
+
+class TestTailProbability(unittest.TestCase):
+    """Tests for tilted tail estimates of the three families"""
+
+    def assert_within_error(self, estimate, exact, max_relative_error=0.1):
+        self.assertLess(estimate.std_error / exact, max_relative_error)
+        self.assertLess(abs(estimate.value - exact), 4 * estimate.std_error)
+        low, high = estimate.confidence_interval(0.9999)
+        self.assertTrue(low <= exact <= high)
+
+    def test_normal_far_tails(self):
+        """Test 5 and 20 sigma tails from a few thousand draws"""
+        rng = np.random.default_rng(0)
+        for threshold in (5, 20):
+            self.assert_within_error(tail_probability(NormalFamily(), threshold, rng=rng),
+                                     stats.norm.sf(threshold))
+        lower = tail_probability(NormalFamily(10, 2), 0, upper=False, rng=rng)
+        self.assert_within_error(lower, stats.norm.cdf(0, 10, 2))
+
+    def test_binomial_tails(self):
+        """Test upper, lower and all-success tails"""
+        rng = np.random.default_rng(1)
+        self.assert_within_error(tail_probability(BinomialFamily(100, 0.05), 20, rng=rng),
+                                 stats.binom.sf(19, 100, 0.05))
+        self.assert_within_error(tail_probability(BinomialFamily(50, 0.8), 50, rng=rng), 0.8 ** 50)
+        lower = tail_probability(BinomialFamily(100, 0.05), 0, upper=False, rng=rng)
+        self.assert_within_error(lower, 0.95 ** 100)
+
+    def test_poisson_tails(self):
+        """Test rare counts for small and huge rates"""
+        rng = np.random.default_rng(2)
+        self.assert_within_error(tail_probability(PoissonFamily(2), 30, rng=rng),
+                                 stats.poisson.sf(29, 2))
+        self.assert_within_error(tail_probability(PoissonFamily(1e6), 1e6 + 5000, rng=rng),
+                                 stats.poisson.sf(1e6 + 4999, 1e6))
+        self.assert_within_error(tail_probability(PoissonFamily(30), 0, upper=False, rng=rng),
+                                 stats.poisson.pmf(0, 30))
+
+    def test_standard_errors_match_spread(self):
+        """Test that reported standard errors match the spread over repetitions"""
+        rng = np.random.default_rng(3)
+        estimates = [tail_probability(PoissonFamily(2), 12, n_samples=1000, rng=rng) for _ in range(200)]
+        values = np.array([estimate.value for estimate in estimates])
+        reported = np.sqrt(np.mean([estimate.std_error ** 2 for estimate in estimates]))
+        self.assertAlmostEqual(values.std() / reported, 1, delta=0.2)
+
+    def test_common_events_use_plain_sampling(self):
+        """Test thresholds on the near side of the mean"""
+        rng = np.random.default_rng(4)
+        estimate = tail_probability(BinomialFamily(50, 0.8), 35, rng=rng)
+        self.assert_within_error(estimate, stats.binom.sf(34, 50, 0.8))
+        self.assertEqual(estimate.method, "importance")
+
+    def test_global_random_state(self):
+        """Test that rng=None follows np.random.seed()"""
+        np.random.seed(42)
+        first = tail_probability(NormalFamily(), 5)
+        np.random.seed(42)
+        self.assertEqual(first.value, tail_probability(NormalFamily(), 5).value)
+
+    def test_invalid_input(self):
+        """Test invalid families and sample counts"""
+        for make in (lambda: NormalFamily(0, 0), lambda: BinomialFamily(10, 1.0),
+                     lambda: BinomialFamily(10, 1.5), lambda: PoissonFamily(0)):
+            with self.assertRaises(ValueError):
+                make()
+        with self.assertRaises(ValueError):
+            tail_probability(NormalFamily(), 5, n_samples=1)
+
+    def test_incomplete_family(self):
+        """Test that a family without sampling cannot be created"""
+        class Untiltable(TiltedFamily):
+            def cumulant(self, theta):
+                return 0.0
+
+            def tilt_for_mean(self, target):
+                return 0.0
+
+        with self.assertRaises(TypeError):
+            Untiltable()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for joint probability tables and Bayes updates
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.joint import JointTable
+
+def die_parity_table():
+    """Joint table of a die roll (rows 1-6) and its parity (columns)"""
+    table = np.zeros((6, 2))
+    for outcome in range(1, 7):
+        table[outcome - 1, outcome % 2] = 1
+    return JointTable(table, row_labels=range(1, 7), col_labels=["even", "odd"])
+
+class TestJointTable(unittest.TestCase):
+    """Tests for marginals and conditional lookups"""
+
+    def setUp(self):
+        self.joint = die_parity_table()
+
+    def test_marginals(self):
+        """Test cached marginal distributions"""
+        np.testing.assert_allclose(self.joint.row_marginal, np.full(6, 1/6))
+        np.testing.assert_allclose(self.joint.col_marginal, [0.5, 0.5])
+        self.assertAlmostEqual(self.joint.prob(col="even"), 0.5)
+        self.assertAlmostEqual(self.joint.prob(6, "even"), 1/6)
+
+    def test_conditional(self):
+        """Test P(6 | even) and P(odd | 3)"""
+        self.assertAlmostEqual(self.joint.conditional(6, "even"), 1/3)
+        self.assertAlmostEqual(self.joint.conditional(5, "even"), 0.0)
+        self.assertAlmostEqual(self.joint.conditional_col("odd", 3), 1.0)
+        np.testing.assert_allclose(self.joint.conditional([2, 4, 6], "even"), [1/3] * 3)
+
+    def test_conditional_tables_normalized(self):
+        """Test that cached conditional tables sum to 1"""
+        np.testing.assert_allclose(self.joint.row_given_col.sum(axis=0), [1, 1])
+        np.testing.assert_allclose(self.joint.col_given_row.sum(axis=1), np.ones(6))
+
+    def test_invalid_tables(self):
+        """Test validation of tables and labels"""
+        with self.assertRaises(ValueError):
+            JointTable([[0.5, -0.1], [0.3, 0.3]])
+        with self.assertRaises(ValueError):
+            JointTable(np.ones((2, 2)), row_labels=["a", "a"])
+        joint = JointTable([[1, 0], [1, 0]])
+        with self.assertRaises(ValueError):
+            joint.conditional(0, 1)
+
+class TestBayes(unittest.TestCase):
+    """Tests for posterior updates"""
+
+    def setUp(self):
+        likelihood = np.array([[0.9, 0.1], [0.5, 0.5], [0.1, 0.9]])
+        self.likelihood = likelihood
+        self.joint = JointTable.from_conditional(np.ones(3) / 3, likelihood,
+                                                 row_labels=["tails", "fair", "heads"],
+                                                 col_labels=["T", "H"])
+
+    def test_from_conditional(self):
+        """Test that the likelihood is recovered from the joint table"""
+        np.testing.assert_allclose(self.joint.col_given_row, self.likelihood)
+
+    def test_batched_posteriors(self):
+        """Test one posterior per observation"""
+        posteriors = self.joint.posteriors(["H", "T", "H"])
+        self.assertEqual(posteriors.shape, (3, 3))
+        np.testing.assert_allclose(posteriors[0], [0.1 / 1.5, 0.5 / 1.5, 0.9 / 1.5])
+        np.testing.assert_allclose(posteriors[0], self.joint.row_given_col[:, 1])
+
+    def test_update_matches_sequential(self):
+        """Test the count-based update against one-at-a-time Bayes updates"""
+        observations = np.random.default_rng(0).choice(["T", "H"], size=200, p=[0.3, 0.7])
+        posterior = np.ones(3) / 3
+        for observation in observations:
+            posterior = posterior * self.likelihood[:, self.joint.col(observation)]
+            posterior /= posterior.sum()
+        np.testing.assert_allclose(self.joint.update(observations), posterior)
+
+    def test_update_with_custom_prior(self):
+        """Test an update starting from a given prior"""
+        posterior = self.joint.update(["H"], prior=[0, 1, 1])
+        np.testing.assert_allclose(posterior, [0, 0.5 / 1.4, 0.9 / 1.4])
+
+    def test_sparse_table(self):
+        """Test that sparse and dense tables give the same answers"""
+        rng = np.random.default_rng(1)
+        dense = rng.random((40, 60)) * (rng.random((40, 60)) < 0.1)
+        dense[np.arange(40), np.arange(40)] = 1.0
+        sparse_joint = JointTable(sparse.csr_matrix(dense))
+        dense_joint = JointTable(dense)
+        self.assertTrue(sparse_joint.is_sparse)
+        self.assertAlmostEqual(sparse_joint.conditional(3, 3), dense_joint.conditional(3, 3))
+        observations = [5, 5, 12, 3]
+        np.testing.assert_allclose(sparse_joint.posteriors(observations),
+                                   dense_joint.posteriors(observations))
+        np.testing.assert_allclose(sparse_joint.update([3, 3]), dense_joint.update([3, 3]))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the parallel Monte Carlo executor and mergeable statistics
+"""
+
+import unittest
+import sys
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.montecarlo import (MonteCarloExecutor, uniform_draws, dice_rolls,
+                               coin_flips, poisson_draws, sample_means)
+from common.streaming import RunningStats, StreamingHistogram, OutcomeCounts
+
+class TestMergeablePartials(unittest.TestCase):
+    """Tests that partial statistics merge exactly"""
+
+    def setUp(self):
+        self.data = np.random.default_rng(0).normal(5.0, 2.0, 10_000)
+        self.parts = np.array_split(self.data, 3)
+
+    def test_running_stats_merge(self):
+        """Test that merged moments equal the moments of all samples"""
+        merged = RunningStats()
+        for part in self.parts:
+            merged.merge(RunningStats().update(part))
+        merged.merge(RunningStats())
+        self.assertEqual(merged.count, len(self.data))
+        self.assertAlmostEqual(merged.mean, np.mean(self.data), places=12)
+        self.assertAlmostEqual(merged.variance(ddof=1), np.var(self.data, ddof=1), places=10)
+        self.assertEqual(merged.max, self.data.max())
+
+    def test_histogram_merge(self):
+        """Test merged histogram counts and the bin check"""
+        merged = StreamingHistogram(20, (0, 10))
+        for part in self.parts:
+            merged.merge(StreamingHistogram(20, (0, 10)).update(part))
+        counts, _ = np.histogram(self.data, bins=20, range=(0, 10))
+        np.testing.assert_array_equal(merged.counts, counts)
+        with self.assertRaises(ValueError):
+            merged.merge(StreamingHistogram(10, (0, 10)))
+
+    def test_outcome_counts_merge(self):
+        """Test merged outcome counts and the outcome check"""
+        merged = OutcomeCounts(1, 6).merge(OutcomeCounts(1, 6).update([1, 2, 2]))
+        merged.merge(OutcomeCounts(1, 6).update([6]))
+        self.assertEqual(merged.counts.tolist(), [1, 2, 0, 0, 0, 1])
+        with self.assertRaises(ValueError):
+            merged.merge(OutcomeCounts(0, 6))
+
+class TestMonteCarloExecutor(unittest.TestCase):
+    """Tests for sharded simulation runs"""
+
+    def test_same_result_for_any_worker_count(self):
+        """Test that the result depends on the seed, not on the number of workers"""
+        results = []
+        for workers in (1, 2):
+            with MonteCarloExecutor(workers=workers, seed=42, shard_size=30_000) as executor:
+                stats, counts = executor.run(dice_rolls, 100_000, RunningStats(), OutcomeCounts(1, 6))
+            results.append((stats.mean, stats.variance(), counts.counts.tolist()))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(sum(results[0][2]), 100_000)
+
+    def test_pool_lifetime(self):
+        """Test that only a with block keeps the worker processes between runs"""
+        executor = MonteCarloExecutor(workers=2, seed=3, shard_size=1000)
+        executor.run(uniform_draws, 4000, RunningStats())
+        self.assertIsNone(executor._pool)
+        executor.consume_array(np.arange(4000.0), RunningStats())
+        self.assertIsNone(executor._pool)
+        with executor:
+            executor.run(uniform_draws, 4000, RunningStats())
+            pool = executor._pool
+            self.assertIsNotNone(pool)
+            executor.run(uniform_draws, 4000, RunningStats())
+            self.assertIs(executor._pool, pool)
+        self.assertIsNone(executor._pool)
+
+    def test_shards_are_independent(self):
+        """Test that shards do not repeat each other's random stream"""
+        executor = MonteCarloExecutor(workers=1, seed=1, shard_size=1000)
+        histogram = executor.run(uniform_draws, 2000, StreamingHistogram(1000, (0, 1)))
+        self.assertLess(histogram.counts.max(), 10)
+        self.assertEqual(histogram.counts.sum(), 2000)
+
+    def test_slide_samplers(self):
+        """Test the samplers for the slide simulations against their theory"""
+        executor = MonteCarloExecutor(workers=1, seed=7, shard_size=50_000, chunk_size=8192)
+        cases = [
+            (partial(coin_flips, n_trials=20, p_success=0.3), 6.0, 20 * 0.3 * 0.7),
+            (partial(poisson_draws, lam=4.0), 4.0, 4.0),
+            (partial(sample_means, sample_size=30), 0.5, 1 / 12 / 30),
+        ]
+        for sampler, mean, variance in cases:
+            with self.subTest(sampler=sampler.func.__name__):
+                stats = executor.run(sampler, 200_000, RunningStats())
+                self.assertEqual(stats.count, 200_000)
+                self.assertAlmostEqual(stats.mean, mean, delta=0.02 * mean)
+                self.assertAlmostEqual(stats.variance(), variance, delta=0.03 * variance)
+
+    def test_requires_consumer(self):
+        """Test that a run without consumers is rejected"""
+        with self.assertRaises(ValueError):
+            MonteCarloExecutor(workers=1).run(dice_rolls, 10)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the parallel test runner
+"""
+
+import unittest
+import io
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.parallel_runner import make_batches, run_parallel
+
+class TestMakeBatches(unittest.TestCase):
+    """Tests for splitting the suite into worker batches"""
+
+    def setUp(self):
+        self.nodeids = [f"tests/test_a.py::TestA::test_{i}" for i in range(10)]
+        self.nodeids += [f"tests/test_b.py::TestB::test_{i}" for i in range(6)]
+
+    def test_every_test_scheduled_once(self):
+        """Test that batching neither drops nor duplicates tests"""
+        for jobs in (1, 2, 4, 16):
+            batches = make_batches(self.nodeids, jobs)
+            flat = [nodeid for batch in batches for nodeid in batch]
+            self.assertEqual(flat, self.nodeids)
+
+    def test_batches_do_not_mix_files(self):
+        """Test that each batch belongs to a single test file"""
+        for batch in make_batches(self.nodeids, 2):
+            self.assertEqual(len({nodeid.split("::")[0] for nodeid in batch}), 1)
+
+    def test_more_jobs_give_smaller_batches(self):
+        """Test that more workers get more batches to balance the load"""
+        self.assertLess(len(make_batches(self.nodeids, 1)), len(make_batches(self.nodeids, 2)))
+        self.assertEqual(len(make_batches(self.nodeids, 16)), len(self.nodeids))
+
+class TestRunParallel(unittest.TestCase):
+    """Tests for running batches in worker processes"""
+
+    def test_dead_worker_fails_its_tests(self):
+        """Test that a worker dying mid-batch fails its test instead of hanging"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "test_ok.py").write_text("def test_ok():\n    pass\n")
+            (root / "test_crash.py").write_text(
+                "import os\n\ndef test_crash():\n    os._exit(1)\n\ndef test_after():\n    pass\n")
+            output = io.StringIO()
+            with redirect_stdout(output):
+                success = run_parallel([temp_dir], jobs=2, rootdir=temp_dir)
+        self.assertFalse(success)
+        self.assertIn("FAILED: test_crash.py::test_crash", output.getvalue())
+        self.assertIn("died while running this batch", output.getvalue())
+        self.assertIn("2 passed, 1 failed, 0 skipped", output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the large-rate and batched Poisson engine
+"""
+
+import unittest
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.poisson import (poisson_log_pmf, poisson_pmf, poisson_cdf, poisson_sf,
+                            poisson_window, poisson_pmf_window, poisson_samples)
+
+class TestPoissonPmf(unittest.TestCase):
+    """Tests for PMF, CDF and survival function"""
+
+    def test_matches_scipy(self):
+        """Test the PMF against scipy for the slides' rates"""
+        for lam in (0.5, 1, 2, 8, 15):
+            x = np.arange(0, 60)
+            np.testing.assert_allclose(poisson_pmf(x, lam), stats.poisson.pmf(x, lam), rtol=1e-12)
+
+    def test_exact_far_tail(self):
+        """Test a far-tail log PMF against the exact formula"""
+        self.assertAlmostEqual(poisson_log_pmf(60, 3), -3 + 60 * math.log(3) - math.lgamma(61),
+                               delta=1e-12)
+
+    def test_batched_rates(self):
+        """Test broadcasting over counts and rates"""
+        lambdas = np.array([1.0, 3.0, 10.0])
+        x = np.arange(20)
+        batched = poisson_pmf(x[:, None], lambdas)
+        self.assertEqual(batched.shape, (20, 3))
+        for i, lam in enumerate(lambdas):
+            np.testing.assert_allclose(batched[:, i], stats.poisson.pmf(x, lam), rtol=1e-12)
+        np.testing.assert_allclose(poisson_cdf(5, lambdas), stats.poisson.cdf(5, lambdas))
+
+    def test_sf_and_edge_cases(self):
+        """Test the survival function, invalid counts and invalid rates"""
+        self.assertAlmostEqual(poisson_sf(3, 2), 1 - stats.poisson.cdf(3, 2), places=14)
+        self.assertGreater(poisson_sf(100, 2), 0.0)
+        self.assertEqual(poisson_log_pmf(-1, 2), -np.inf)
+        self.assertEqual(poisson_log_pmf(1.5, 2), -np.inf)
+        self.assertEqual(poisson_log_pmf(0, 2), -2.0)
+        with self.assertRaises(ValueError):
+            poisson_pmf(1, 0)
+
+class TestPoissonWindow(unittest.TestCase):
+    """Tests for mean-centered windows with huge rates"""
+
+    def test_huge_rate_window(self):
+        """Test that the window for λ = 10^9 excludes the empty left tail and holds the mass"""
+        lam = 1e9
+        low, high = poisson_window(lam)
+        self.assertTrue(low < lam < high)
+        self.assertLess(high - low, 20 * math.sqrt(lam))
+        x, pmf = poisson_pmf_window(lam)
+        self.assertAlmostEqual(pmf.sum(), 1.0, delta=1e-12)
+
+    def test_zero_tail_rejected(self):
+        """Test that a window must leave out some tail of the unbounded support"""
+        for tail in (0, -1e-3):
+            with self.assertRaises(ValueError):
+                poisson_window(4.0, tail)
+            with self.assertRaises(ValueError):
+                poisson_pmf_window(4.0, tail)
+
+    def test_max_points(self):
+        """Test that max_points bounds the evaluated points"""
+        x, pmf = poisson_pmf_window(1e9, max_points=200)
+        self.assertLessEqual(len(x), 200)
+        self.assertAlmostEqual(pmf.max(), stats.norm.pdf(0, scale=math.sqrt(1e9)), delta=1e-8)
+
+class TestPoissonSamples(unittest.TestCase):
+    """Tests for cached simulation"""
+
+    def test_samples_are_cached(self):
+        """Test that repeated requests reuse the same read-only samples"""
+        first = poisson_samples(4.0, 1000, seed=3)
+        self.assertIs(poisson_samples(4, 1000, seed=3), first)
+        self.assertFalse(first.flags.writeable)
+        self.assertIsNot(poisson_samples(4.0, 1000, seed=4), first)
+
+    def test_global_state_on_first_draw(self):
+        """Test that unseeded samples follow np.random.seed() on first use"""
+        np.random.seed(11)
+        expected = np.random.poisson(123.5, 500)
+        np.random.seed(11)
+        np.testing.assert_array_equal(poisson_samples(123.5, 500), expected)
+
+    def test_unseeded_samples_not_cached(self):
+        """Test that every unseeded request follows the current global state"""
+        np.random.seed(1)
+        first = poisson_samples(3.0, 5)
+        np.random.seed(2)
+        expected = np.random.poisson(3.0, 5)
+        np.random.seed(2)
+        second = poisson_samples(3.0, 5)
+        np.testing.assert_array_equal(second, expected)
+        self.assertIsNot(second, first)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
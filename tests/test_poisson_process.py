@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the Poisson process simulator
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.poisson_process import PoissonProcess, WindowCounts
+from common.streaming import consume, RunningStats
+
+class TestPoissonProcess(unittest.TestCase):
+    """Tests for intensities and event streams"""
+
+    def setUp(self):
+        # Quiet nights, busy days, moderate evenings (rates per hour)
+        self.daily = PoissonProcess([2.0, 30.0, 10.0], breakpoints=[8, 18], period=24)
+
+    def test_validation(self):
+        """Test that inconsistent rates and breakpoints are rejected"""
+        with self.assertRaises(ValueError):
+            PoissonProcess([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            PoissonProcess([1.0, 2.0], breakpoints=[30], period=24)
+        with self.assertRaises(ValueError):
+            PoissonProcess([1.0, 0.0], breakpoints=[5])
+
+    def test_cumulative_intensity(self):
+        """Test expected counts of a periodic profile"""
+        self.assertAlmostEqual(self.daily.expected_count(0, 24), 8 * 2 + 10 * 30 + 6 * 10)
+        self.assertAlmostEqual(self.daily.expected_count(24 * 3 + 7, 24 * 3 + 9), 2 + 30)
+        self.assertAlmostEqual(PoissonProcess(4.0).expected_count(1.5, 4.0), 10.0)
+
+    def test_event_times_are_sorted_chunks(self):
+        """Test chunk sizes, ordering and range of the timestamps"""
+        chunks = list(PoissonProcess(50.0).event_times(100.0, chunk_size=1000,
+                                                       rng=np.random.default_rng(1)))
+        self.assertTrue(all(len(chunk) <= 1000 for chunk in chunks))
+        times = np.concatenate(chunks)
+        self.assertTrue(np.all(np.diff(times) > 0))
+        self.assertTrue(0 <= times[0] and times[-1] < 100.0)
+        self.assertAlmostEqual(len(times), 5000, delta=5 * np.sqrt(5000))
+
+    def test_int_seed(self):
+        """Test that an integer rng gives reproducible events and counts"""
+        process = PoissonProcess(5.0)
+        events = np.concatenate(list(process.event_times(10.0, rng=7)))
+        np.testing.assert_array_equal(np.concatenate(list(process.event_times(10.0, rng=7))), events)
+        counts = np.concatenate(list(process.window_counts(10.0, 1.0, rng=7)))
+        np.testing.assert_array_equal(np.concatenate(list(process.window_counts(10.0, 1.0, rng=7))),
+                                      counts)
+
+    def test_zero_rate_segment_has_no_events(self):
+        """Test that no events fall in a segment with rate 0"""
+        process = PoissonProcess([5.0, 0.0, 5.0], breakpoints=[10, 20])
+        times = np.concatenate(list(process.event_times(30.0, rng=np.random.default_rng(2))))
+        self.assertFalse(np.any((times > 10) & (times < 20)))
+
+    def test_interarrival_times_are_exponential(self):
+        """Test the gaps of a homogeneous process against Exp(rate)"""
+        times = np.concatenate(list(PoissonProcess(3.0).event_times(2000.0, rng=np.random.default_rng(3))))
+        result = stats.kstest(np.diff(times), stats.expon(scale=1 / 3.0).cdf)
+        self.assertGreater(result.pvalue, 0.001)
+
+class TestWindowCounts(unittest.TestCase):
+    """Tests for streaming window aggregation"""
+
+    def test_counts_match_binning(self):
+        """Test streamed counts against binning all timestamps at once"""
+        rng = np.random.default_rng(4)
+        process = PoissonProcess([2.0, 30.0, 10.0], breakpoints=[8, 18], period=24)
+        counter = WindowCounts(1.0, 24 * 30)
+        chunks = list(process.event_times(24 * 30, chunk_size=777, rng=rng))
+        consume(chunks, counter)
+        times = np.concatenate(chunks)
+        np.testing.assert_array_equal(counter.counts, np.bincount(times.astype(int), minlength=24 * 30))
+        hourly = counter.counts.reshape(30, 24).mean(axis=0)
+        self.assertAlmostEqual(hourly[3], 2.0, delta=1.0)
+        self.assertAlmostEqual(hourly[12], 30.0, delta=4.0)
+
+    def test_unsorted_and_partial_windows(self):
+        """Test unsorted input, out-of-range times and a short last window"""
+        counter = WindowCounts(0.7, 9.5)
+        times = np.random.default_rng(5).uniform(-1, 11, 1000)
+        counter.update(times)
+        inside = times[(times >= 0) & (times < 9.5)]
+        expected = np.bincount(np.minimum((inside // 0.7).astype(int), 13), minlength=14)
+        np.testing.assert_array_equal(counter.counts, expected)
+        counter.merge(WindowCounts(0.7, 9.5).update([0.1]))
+        self.assertEqual(counter.counts[0], expected[0] + 1)
+
+    def test_direct_window_counts(self):
+        """Test directly drawn window counts against the process rate"""
+        stats_per_second = RunningStats()
+        total = consume(PoissonProcess(1000.0).window_counts(3600 * 24, 1.0, chunk_windows=10_000,
+                                                            rng=np.random.default_rng(6)),
+                        stats_per_second)
+        self.assertEqual(total, 3600 * 24)
+        self.assertAlmostEqual(stats_per_second.mean, 1000.0, delta=1.0)
+        self.assertAlmostEqual(stats_per_second.variance(), 1000.0, delta=30.0)
+
+    def test_direct_counts_of_a_short_last_window(self):
+        """Test that the last, shorter window gets a proportionally smaller mean"""
+        counts = np.concatenate(list(PoissonProcess(1000.0).window_counts(
+            2.5, 1.0, rng=np.random.default_rng(7))))
+        self.assertEqual(len(counts), 3)
+        self.assertTrue(400 < counts[2] < 600)
+        self.assertTrue(850 < counts[0] < 1150)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the quasi-Monte Carlo sampling mode
+"""
+
+import unittest
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common import qmc
+from common.qmc import (SAMPLING_ENV, get_sampling_mode, set_sampling_mode, qmc_engine,
+                        uniform_samples)
+from common.streaming import uniform_chunks, coin_flip_chunks
+from common.estimation import estimate_probabilities
+
+# Interval bounds that do not fall on the points of small QMC sets
+INTERVALS = [(-np.inf, 3.01), (6.013, np.inf), (2.007, 8.003)]
+
+class TestSamplingMode(unittest.TestCase):
+    """Tests for sampling mode selection and sampling in each mode"""
+
+    def setUp(self):
+        self.saved_env = os.environ.get(SAMPLING_ENV)
+        self.saved_mode = qmc._active_sampling
+
+    def tearDown(self):
+        qmc._active_sampling = self.saved_mode
+        if self.saved_env is None:
+            os.environ.pop(SAMPLING_ENV, None)
+        else:
+            os.environ[SAMPLING_ENV] = self.saved_env
+
+    def test_default_mode_is_random(self):
+        """Test that the default mode keeps NumPy's random numbers"""
+        qmc._active_sampling = None
+        os.environ.pop(SAMPLING_ENV, None)
+        self.assertEqual(get_sampling_mode(), "random")
+        np.random.seed(42)
+        expected = np.random.uniform(0, 10, 1000)
+        np.random.seed(42)
+        np.testing.assert_array_equal(uniform_samples(0, 10, 1000), expected)
+
+    def test_mode_from_environment(self):
+        """Test that the mode can be selected through the environment"""
+        qmc._active_sampling = None
+        os.environ[SAMPLING_ENV] = "halton"
+        self.assertEqual(get_sampling_mode(), "halton")
+
+    def test_invalid_mode(self):
+        """Test that unknown modes are rejected"""
+        with self.assertRaises(ValueError):
+            set_sampling_mode("lattice")
+        with self.assertRaises(ValueError):
+            qmc_engine(2, "random")
+        with self.assertRaises(ValueError):
+            qmc_engine(qmc.SOBOL_MAX_DIMENSION + 1, "sobol")
+
+    def test_low_discrepancy(self):
+        """Test that QMC samples are far more even than random ones"""
+        for mode in ("sobol", "halton"):
+            set_sampling_mode(mode)
+            samples = uniform_samples(0, 10, 1024, rng=np.random.default_rng(0))
+            self.assertEqual(samples.shape, (1024,))
+            self.assertTrue(np.all((samples >= 0) & (samples < 10)))
+            counts = np.histogram(samples, bins=32, range=(0, 10))[0]
+            self.assertLessEqual(counts.max() - counts.min(), 2)
+            self.assertIsInstance(uniform_samples(0, 1), float)
+
+    def test_reproducible_with_global_seed(self):
+        """Test that np.random.seed() fixes the scrambling"""
+        set_sampling_mode("sobol")
+        np.random.seed(42)
+        first = uniform_samples(0, 1, 100)
+        np.random.seed(42)
+        np.testing.assert_array_equal(uniform_samples(0, 1, 100), first)
+        self.assertFalse(np.array_equal(uniform_samples(0, 1, 100), first))
+
+    def test_older_scipy_seed_keyword(self):
+        """Test that engines built with SciPy's old seed argument match rng"""
+        expected = qmc_engine(3, "sobol", np.random.default_rng(5)).random(8)
+        saved = qmc._SEED_KEYWORD
+        qmc._SEED_KEYWORD = "seed"
+        try:
+            for mode in ("sobol", "halton"):
+                engine = qmc_engine(3, mode, np.random.default_rng(5))
+                self.assertEqual(engine.random(8).shape, (8, 3))
+            np.testing.assert_array_equal(qmc_engine(3, "sobol", np.random.default_rng(5)).random(8),
+                                          expected)
+        finally:
+            qmc._SEED_KEYWORD = saved
+
+    def test_rows_are_points(self):
+        """Test that each row of a 2-D draw is one multi-dimensional point"""
+        set_sampling_mode("sobol")
+        means = uniform_samples(0, 1, (4096, 10), rng=np.random.default_rng(1)).mean(axis=1)
+        self.assertAlmostEqual(means.mean(), 0.5, places=4)
+        self.assertAlmostEqual(means.std(), np.sqrt(1 / 120), delta=0.005)
+
+    def test_chunks_continue_one_sequence(self):
+        """Test that chunked QMC draws equal one draw of the same sequence"""
+        set_sampling_mode("sobol")
+        chunked = np.concatenate(list(uniform_chunks(0, 1, 1000, 256, np.random.default_rng(2))))
+        whole = uniform_samples(0, 1, 1000, rng=np.random.default_rng(2))
+        np.testing.assert_array_equal(chunked, whole)
+
+    def test_coin_flips(self):
+        """Test that QMC coin flips have the binomial moments"""
+        set_sampling_mode("halton")
+        successes = np.concatenate(list(coin_flip_chunks(10, 0.5, 4000, 1000, np.random.default_rng(3))))
+        self.assertEqual(len(successes), 4000)
+        self.assertAlmostEqual(successes.mean(), 5, delta=0.02)
+        self.assertAlmostEqual(successes.std(), np.sqrt(2.5), delta=0.05)
+
+class TestRandomizedQmc(unittest.TestCase):
+    """Tests for randomized-QMC error estimates"""
+
+    def test_faster_convergence(self):
+        """Test that 16x more points cut the RQMC error far more than 4x"""
+        dist = stats.uniform(0, 10)
+        exact = np.array([dist.cdf(high) - dist.cdf(low) for low, high in INTERVALS])
+        rng = np.random.default_rng(4)
+        errors = {}
+        for n in (1024, 16384):
+            values = np.array([estimate_probabilities(dist, INTERVALS, n, "sobol", rng).value
+                               for _ in range(30)])
+            errors[n] = np.sqrt(np.mean((values - exact) ** 2))
+        self.assertGreater(errors[1024] / errors[16384], 8)
+
+    def test_standard_errors_match_spread(self):
+        """Test that replicate-based standard errors match the spread"""
+        dist = stats.uniform(0, 10)
+        rng = np.random.default_rng(5)
+        for method in ("sobol", "halton"):
+            estimates = [estimate_probabilities(dist, INTERVALS, 1024, method, rng) for _ in range(100)]
+            values = np.array([estimate.value for estimate in estimates])
+            reported = np.sqrt(np.mean([estimate.std_error ** 2 for estimate in estimates], axis=0))
+            np.testing.assert_allclose(values.std(axis=0), reported, rtol=0.3, err_msg=method)
+            self.assertEqual(estimates[0].method, method)
+            self.assertEqual(estimates[0].n_samples, 1024)
+
+    def test_too_few_points(self):
+        """Test that RQMC needs a point per replicate"""
+        with self.assertRaises(ValueError):
+            estimate_probabilities(stats.uniform(0, 10), INTERVALS, 10, "sobol")
+
+if __name__ == '__main__':
+    unittest.main()
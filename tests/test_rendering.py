@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for shared rendering settings
+"""
+
+import unittest
+import os
+import re
+import sys
+import tempfile
+from unittest import mock
+from pathlib import Path
+
+# Suppress matplotlib warnings
+import warnings
+warnings.filterwarnings("ignore", category=DeprecationWarning, module="matplotlib")
+warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend for tests
+import matplotlib.pyplot as plt
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common import rendering
+from common.rendering import (RENDER_PROFILES, RENDER_PROFILE_ENV, OUTPUT_FORMAT_ENV, OUTPUT_DIR_ENV,
+                              get_render_profile, set_render_profile, set_output_format,
+                              set_output_dir, save_figure, multipage_pdf)
+from common.display import HEADLESS_ENV, is_headless, show_figure, open_in_browser
+
+class TestRenderProfiles(unittest.TestCase):
+    """Tests for render profile selection"""
+
+    def setUp(self):
+        self.saved_env = os.environ.get(RENDER_PROFILE_ENV)
+        self.saved_profile = rendering._active_profile
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        rendering._active_profile = self.saved_profile
+        if self.saved_env is None:
+            os.environ.pop(RENDER_PROFILE_ENV, None)
+        else:
+            os.environ[RENDER_PROFILE_ENV] = self.saved_env
+        rendering.apply_render_profile()
+        plt.close('all')
+        self.temp_dir.cleanup()
+
+    def test_default_profile_is_print(self):
+        """Test that the default profile keeps the original 300 dpi output"""
+        rendering._active_profile = None
+        os.environ.pop(RENDER_PROFILE_ENV, None)
+        self.assertEqual(get_render_profile(), "print")
+        self.assertEqual(RENDER_PROFILES["print"]["dpi"], 300)
+
+    def test_profile_from_environment(self):
+        """Test that the profile can be selected through the environment"""
+        rendering._active_profile = None
+        os.environ[RENDER_PROFILE_ENV] = "draft"
+        self.assertEqual(get_render_profile(), "draft")
+
+    def test_invalid_profile(self):
+        """Test that unknown profiles are rejected"""
+        with self.assertRaises(ValueError):
+            set_render_profile("poster")
+
+    def test_draft_is_smaller_than_print(self):
+        """Test that draft figures are rendered at lower resolution"""
+        sizes = {}
+        for name in ("draft", "print"):
+            set_render_profile(name)
+            fig = plt.figure(figsize=(4, 3))
+            plt.plot([0, 1, 2], [0, 1, 0], marker='o')
+            path = save_figure(Path(self.temp_dir.name) / f"{name}.png", fig)
+            plt.close(fig)
+            sizes[name] = path.stat().st_size
+
+        self.assertLess(sizes["draft"], sizes["print"])
+
+    def test_switching_profiles_restores_settings(self):
+        """Test that switching from draft to print undoes the draft settings"""
+        keys = ("lines.antialiased", "scatter.marker", "path.simplify_threshold")
+        set_render_profile("print")
+        before = {key: matplotlib.rcParams[key] for key in keys}
+        set_render_profile("draft")
+        self.assertFalse(matplotlib.rcParams["lines.antialiased"])
+        set_render_profile("print")
+        self.assertEqual({key: matplotlib.rcParams[key] for key in keys}, before)
+        self.assertTrue(matplotlib.rcParams["lines.antialiased"])
+        self.assertEqual(matplotlib.rcParams["scatter.marker"], "o")
+
+class TestOutputFormats(unittest.TestCase):
+    """Tests for figure output formats and directories"""
+
+    def setUp(self):
+        self.saved_env = {name: os.environ.get(name) for name in (OUTPUT_FORMAT_ENV, OUTPUT_DIR_ENV)}
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.slide_dir = Path(self.temp_dir.name) / "slide99"
+        self.slide_dir.mkdir()
+
+    def tearDown(self):
+        rendering._output_format = None
+        rendering._output_dir = None
+        for name, value in self.saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        plt.close('all')
+        self.temp_dir.cleanup()
+
+    def _save_test_figure(self):
+        fig = plt.figure(figsize=(4, 3))
+        plt.hist([1, 2, 2, 3, 3, 3], bins=3)
+        path = save_figure(self.slide_dir / "test_plot.png", fig)
+        plt.close(fig)
+        return path
+
+    def test_default_format_is_png(self):
+        """Test that figures stay next to the slide as PNG by default"""
+        rendering._output_format = None
+        rendering._output_dir = None
+        os.environ.pop(OUTPUT_FORMAT_ENV, None)
+        os.environ.pop(OUTPUT_DIR_ENV, None)
+        path = self._save_test_figure()
+        self.assertEqual(path, self.slide_dir / "test_plot.png")
+        self.assertTrue(path.exists())
+
+    def test_svg_and_webp_formats(self):
+        """Test that the selected format changes the written file"""
+        for fmt in ("svg", "webp"):
+            set_output_format(fmt)
+            path = self._save_test_figure()
+            self.assertEqual(path.suffix, f".{fmt}")
+            self.assertTrue(path.exists())
+
+        self.assertTrue((self.slide_dir / "test_plot.svg").read_text().lstrip().startswith("<?xml"))
+
+    def test_output_dir(self):
+        """Test that the output directory keeps one folder per slide"""
+        out_dir = Path(self.temp_dir.name) / "build"
+        set_output_dir(out_dir)
+        path = self._save_test_figure()
+        self.assertEqual(path, out_dir.absolute() / "slide99" / "test_plot.png")
+        self.assertTrue(path.exists())
+        self.assertFalse((self.slide_dir / "test_plot.png").exists())
+
+    def test_multipage_pdf(self):
+        """Test that figures saved inside multipage_pdf share one file"""
+        pdf_path = Path(self.temp_dir.name) / "all_slides.pdf"
+        with multipage_pdf(pdf_path):
+            first = self._save_test_figure()
+            second = self._save_test_figure()
+
+        self.assertEqual(first, pdf_path)
+        self.assertEqual(second, pdf_path)
+        self.assertEqual(len(re.findall(rb"/Type\s*/Page[^s]", pdf_path.read_bytes())), 2)
+        self.assertEqual(list(self.slide_dir.iterdir()), [])
+
+class TestHeadlessMode(unittest.TestCase):
+    """Tests for headless execution"""
+
+    def setUp(self):
+        self.saved_env = os.environ.get(HEADLESS_ENV)
+        os.environ[HEADLESS_ENV] = "1"
+
+    def tearDown(self):
+        if self.saved_env is None:
+            os.environ.pop(HEADLESS_ENV, None)
+        else:
+            os.environ[HEADLESS_ENV] = self.saved_env
+
+    def test_headless_from_environment(self):
+        """Test that headless mode is read from the environment"""
+        self.assertTrue(is_headless())
+        os.environ[HEADLESS_ENV] = "0"
+        self.assertFalse(is_headless())
+
+    def test_browser_not_opened(self):
+        """Test that headless mode never launches the browser"""
+        with mock.patch("webbrowser.open") as browser_open:
+            opened = open_in_browser(project_root / "slide03" / "slide3.html")
+        self.assertFalse(opened)
+        browser_open.assert_not_called()
+
+    def test_show_does_not_block(self):
+        """Test that headless mode never calls plt.show"""
+        with mock.patch.object(plt, "show") as plt_show:
+            show_figure()
+        plt_show.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
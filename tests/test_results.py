@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for structured slide results and quiet mode
+"""
+
+import unittest
+import io
+import json
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from common.results import SlideResult, to_builtin
+from common.watcher import slide_id_from_dir
+from main import SLIDE_IDS, import_slide_module, list_slides
+
+class TestSlideResult(unittest.TestCase):
+    """Tests for the SlideResult container"""
+
+    def test_numpy_values_become_builtin(self):
+        """Test that numpy scalars and arrays convert to plain Python values"""
+        value = to_builtin({"a": np.float64(0.5), "b": np.arange(3), 1: (np.int64(2),)})
+        self.assertEqual(value, {"a": 0.5, "b": [0, 1, 2], "1": [2]})
+        self.assertIsInstance(value["b"][0], int)
+
+    def test_tables_and_rows(self):
+        """Test column tables and their row view"""
+        result = SlideResult(slide="1", title="Test")
+        result.add_table("dice", outcome=np.arange(1, 4), probability=[1/6] * 3)
+        self.assertEqual(result.table_rows("dice")[0], {"outcome": 1, "probability": 1/6})
+
+    def test_unequal_columns_rejected(self):
+        """Test that tables with columns of different lengths are rejected"""
+        result = SlideResult(slide="1", title="Test")
+        with self.assertRaises(ValueError):
+            result.add_table("bad", x=[1, 2], y=[1])
+
+    def test_json_round_trip(self):
+        """Test that results serialize to JSON"""
+        result = SlideResult(slide="2", title="Uniform", artifacts=[Path("plot.png")])
+        result.add_metrics(mean=np.float64(5.0), n=np.int64(10))
+        data = json.loads(result.to_json())
+        self.assertEqual(data["metrics"], {"mean": 5.0, "n": 10})
+        self.assertEqual(data["artifacts"], ["plot.png"])
+
+class TestQuietMode(unittest.TestCase):
+    """Tests that every slide returns data without printing in quiet mode"""
+
+    def test_every_slide_listed(self):
+        """Test that SLIDE_IDS covers every slide package, including slide 1"""
+        slide_dirs = {slide_id_from_dir(path.name) for path in project_root.glob("slide*/")
+                      if (path / "__init__.py").exists()}
+        self.assertEqual(set(SLIDE_IDS), slide_dirs)
+        self.assertEqual(SLIDE_IDS[0], "1")
+
+    def test_list_matches_slide_ids(self):
+        """Test that --list shows exactly the slides --all runs, in the same order"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            list_slides()
+        listed = [line.split(".")[0].strip() for line in output.getvalue().splitlines()[2:]]
+        self.assertEqual(listed, SLIDE_IDS)
+
+    def test_all_slides_quiet(self):
+        """Test quiet mode of every slide"""
+        for slide_number in SLIDE_IDS:
+            with self.subTest(slide=slide_number):
+                module = import_slide_module(slide_number)
+                plt.close('all')  # Figures left open by other tests
+                output = io.StringIO()
+                with redirect_stdout(output):
+                    result = module.main(quiet=True)
+                self.assertIsInstance(result, SlideResult)
+                self.assertEqual(output.getvalue(), "")
+                self.assertEqual(plt.get_fignums(), [])
+                self.assertTrue(result.metrics or result.tables)
+                json.loads(result.to_json())
+
+    def test_quiet_matches_printed_values(self):
+        """Test that quiet results agree with the printed demonstration"""
+        module = import_slide_module("2b")
+        result = module.main(quiet=True)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            uniform_data, counts, bins = module.create_uniform_histogram()
+        plt.close('all')
+        self.assertEqual(result.tables["bins"]["count"], counts.astype(int).tolist())
+        self.assertEqual(result.metrics["n_samples"], len(uniform_data))
+        self.assertIn(f"Chi-square statistic: {result.metrics['chi_square']:.3f}", output.getvalue())
+
+    def test_quiet_uses_printed_analysis(self):
+        """Test that slide 1c prints the statistics its quiet result reports"""
+        module = import_slide_module("1c")
+        result = module.main(quiet=True)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            rolls, counts, chi2_stat = module.simulate_and_analyze_rolls(1000)
+        self.assertEqual(result.tables["simulation"]["count"], counts.tolist())
+        self.assertAlmostEqual(result.metrics["chi2_stat"], chi2_stat)
+        self.assertAlmostEqual(result.metrics["chi2_critical"], stats.chi2.ppf(0.95, df=5))
+        self.assertIn(f"Critical value (α=0.05): {result.metrics['chi2_critical']:.3f}", output.getvalue())
+
+    def test_stratified_errors_positive(self):
+        """Test that slide 2e's example bounds give stratified errors above 0"""
+        table = import_slide_module("2e").main(quiet=True).tables["probability_estimates"]
+        errors = [error for method, error in zip(table["method"], table["std_error"])
+                  if method == "stratified"]
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(error > 0 for error in errors))
+
+    def test_rules_printed_from_computed_values(self):
+        """Test that slide 1a prints and reports the same probability rules"""
+        module = import_slide_module("1a")
+        rules = module.probability_rules()
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(module.demonstrate_probability_rules(), rules)
+        self.assertIn(f"= {rules['prob_6_and_even']:.3f} / {rules['prob_even']:.3f} = "
+                      f"{rules['conditional_probability']:.3f}", output.getvalue())
+        metrics = module.main(quiet=True).metrics
+        self.assertEqual({name: metrics[name] for name in module.PROBABILITY_RULES},
+                         {name: rules[name] for name in module.PROBABILITY_RULES})
+
+    def test_probabilities_derived_from_events(self):
+        """Test that slide 1a's combined probabilities come from the events"""
+        metrics = import_slide_module("1a").main(quiet=True).metrics
+        self.assertAlmostEqual(metrics["prob_even"], 1/2)
+        self.assertAlmostEqual(metrics["prob_greater_than_4"], 1/3)
+        self.assertAlmostEqual(metrics["prob_not_1"], 5/6)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the alias-method sampler
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.sampling import AliasSampler, build_alias_table, random_source
+from common.discrete import DiscreteDistribution
+
+class TestAliasTable(unittest.TestCase):
+    """Tests for building the alias table"""
+
+    def test_table_reproduces_pmf(self):
+        """Test that the table's columns add back up to the PMF"""
+        probabilities = np.random.default_rng(0).random(50)
+        probabilities /= probabilities.sum()
+        accept, alias = build_alias_table(probabilities)
+        n = len(probabilities)
+        recovered = accept / n + np.bincount(alias, weights=(1 - accept) / n, minlength=n)
+        np.testing.assert_allclose(recovered, probabilities)
+
+    def test_invalid_pmf(self):
+        """Test that invalid PMFs are rejected"""
+        with self.assertRaises(ValueError):
+            build_alias_table([0.5, -0.5])
+        with self.assertRaises(ValueError):
+            build_alias_table([0, 0])
+
+class TestAliasSampler(unittest.TestCase):
+    """Tests for drawing samples"""
+
+    def test_loaded_die_frequencies(self):
+        """Test frequencies of a loaded die"""
+        probabilities = [0.5, 0.1, 0.1, 0.1, 0.1, 0.1]
+        sampler = AliasSampler(np.arange(1, 7), probabilities, rng=0)
+        rolls = sampler.sample(200_000)
+        self.assertEqual(set(np.unique(rolls)), set(range(1, 7)))
+        np.testing.assert_allclose(np.bincount(rolls, minlength=7)[1:] / len(rolls),
+                                   probabilities, atol=0.005)
+
+    def test_binomial_table_goodness_of_fit(self):
+        """Test samples from a binomial PMF table with a chi-square test"""
+        successes = np.arange(21)
+        table = {"successes": successes, "probability": stats.binom.pmf(successes, 20, 0.8)}
+        sampler = AliasSampler.from_table(table, "successes", rng=1)
+        counts = np.bincount(sampler.sample(100_000), minlength=21)
+        expected = table["probability"] * counts.sum()
+        keep = expected > 5
+        _, p_value = stats.chisquare(counts[keep], expected[keep] * counts[keep].sum() / expected[keep].sum())
+        self.assertGreater(p_value, 0.001)
+
+    def test_zero_probability_never_drawn(self):
+        """Test that impossible outcomes are never sampled"""
+        sampler = AliasSampler(["a", "b", "c"], [0.5, 0.0, 0.5], rng=2)
+        self.assertNotIn("b", set(sampler.sample(10_000)))
+
+    def test_shapes_and_reproducibility(self):
+        """Test output shapes and seeding through np.random.seed"""
+        sampler = AliasSampler([1, 2, 3], [1, 2, 3])
+        self.assertEqual(sampler.sample((4, 5)).shape, (4, 5))
+        self.assertIn(sampler.sample(), (1, 2, 3))
+        np.random.seed(42)
+        first = sampler.sample(100)
+        np.random.seed(42)
+        np.testing.assert_array_equal(first, sampler.sample(100))
+
+    def test_int_seed(self):
+        """Test that an int seed gives the same draws on every call"""
+        sampler = AliasSampler([1, 2, 3], [1, 2, 3])
+        np.testing.assert_array_equal(sampler.sample(100, rng=7), sampler.sample(100, rng=7))
+        seeded = AliasSampler([1, 2, 3], [1, 2, 3], rng=7)
+        np.testing.assert_array_equal(seeded.sample(100), sampler.sample(100, rng=7))
+        with self.assertRaises(TypeError):
+            sampler.sample(10, rng="seed")
+
+    def test_random_source(self):
+        """Test how rng arguments are normalized"""
+        self.assertIs(random_source(None), np.random)
+        generator = np.random.default_rng(1)
+        self.assertIs(random_source(generator), generator)
+        self.assertIsInstance(random_source(np.random.SeedSequence(1)), np.random.Generator)
+        for invalid in (1.5, True, [1, 2]):
+            with self.assertRaises(TypeError):
+                random_source(invalid)
+
+    def test_distribution_sample(self):
+        """Test DiscreteDistribution.sample for the sum of 20 dice"""
+        twenty = DiscreteDistribution.die(6, n_dice=20)
+        samples = twenty.sample(100_000, rng=np.random.default_rng(3))
+        self.assertAlmostEqual(samples.mean(), twenty.mean, delta=0.15)
+        self.assertAlmostEqual(samples.var(), twenty.variance, delta=2.0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
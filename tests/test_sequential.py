@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for sequential (SPRT) fairness tests
+"""
+
+import unittest
+import sys
+from itertools import count
+from pathlib import Path
+
+import numpy as np
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.sequential import SequentialTest, check_fairness, fairness_verdict
+
+def blocks(rolls, block_size):
+    return (rolls[start:start + block_size] for start in range(0, len(rolls), block_size))
+
+class TestSequentialTest(unittest.TestCase):
+    """Tests for decisions, stopping times and error rates"""
+
+    def test_block_size_does_not_matter(self):
+        """Test that the decision is made at the same roll for any block size"""
+        rolls = np.random.default_rng(0).integers(1, 7, 5000)
+        results = {(test.decision, test.n_samples, tuple(test.log_likelihood_ratios.round(12)))
+                   for test in (SequentialTest.fairness().run(blocks(rolls, size)) for size in (1, 7, 100, 5000))}
+        self.assertEqual(len(results), 1)
+        decision, n_samples, _ = results.pop()
+        self.assertEqual(decision, "accept")
+        self.assertLess(n_samples, 5000)
+
+    def test_error_rates(self):
+        """Test fair and loaded dice against alpha = beta = 0.05"""
+        rng = np.random.default_rng(1)
+        loaded = np.append(np.full(5, (1 - 0.3) / 5), 0.3)
+        decisions = {"fair": [], "loaded": []}
+        samples = {"fair": [], "loaded": []}
+        for _ in range(200):
+            for name, probabilities in (("fair", np.full(6, 1 / 6)), ("loaded", loaded)):
+                stream = (rng.choice(np.arange(1, 7), 50, p=probabilities) for _ in count())
+                test = SequentialTest.fairness(bias=0.05).run(stream)
+                decisions[name].append(test.decision)
+                samples[name].append(test.n_samples)
+        self.assertLess(decisions["fair"].count("reject") / 200, 0.1)
+        self.assertEqual(decisions["loaded"].count("accept"), 0)
+        # A die this loaded is caught long before a fair one is cleared
+        self.assertLess(np.mean(samples["loaded"]), np.mean(samples["fair"]) / 3)
+
+    def test_stops_reading_the_stream(self):
+        """Test that run() does not consume blocks after the decision"""
+        rng = np.random.default_rng(2)
+        consumed = []
+
+        def stream():
+            while True:
+                consumed.append(1)
+                yield np.full(10, 6)
+
+        test = SequentialTest.fairness().run(stream())
+        self.assertEqual(test.decision, "reject")
+        self.assertEqual(len(consumed), int(np.ceil(test.n_samples / 10)))
+        before = test.n_samples
+        test.update(rng.integers(1, 7, 100))
+        self.assertEqual(test.n_samples, before)
+
+    def test_simple_coin(self):
+        """Test a simple SPRT for a coin with outcomes 0 and 1"""
+        rng = np.random.default_rng(3)
+        biased = SequentialTest.simple([0.5, 0.5], [0.4, 0.6]).run(blocks(rng.random(10000) < 0.6, 64))
+        fair = SequentialTest.simple([0.5, 0.5], [0.4, 0.6]).run(blocks(rng.random(10000) < 0.5, 64))
+        self.assertEqual((biased.decision, fair.decision), ("reject", "accept"))
+        self.assertGreaterEqual(biased.log_likelihood_ratios[0], biased.upper)
+        self.assertLessEqual(fair.log_likelihood_ratios[0], fair.lower)
+
+    def test_undecided(self):
+        """Test a stream that ends before a decision"""
+        test = SequentialTest.fairness().run(blocks(np.arange(1, 7).repeat(2), 4))
+        self.assertIsNone(test.decision)
+        self.assertEqual(test.n_samples, 12)
+
+    def test_check_fairness(self):
+        """Test that checking recorded rolls matches running the test on blocks"""
+        rolls = np.random.default_rng(3).integers(1, 7, 3000)
+        test = check_fairness(rolls, block_size=50)
+        expected = SequentialTest.fairness().run(blocks(rolls, 50))
+        self.assertEqual((test.decision, test.n_samples), (expected.decision, expected.n_samples))
+
+    def test_fairness_verdict(self):
+        """Test the wording of every fairness decision"""
+        undecided = SequentialTest.fairness().update([1, 2, 3])
+        self.assertEqual(fairness_verdict(undecided), "undecided after 3 rolls")
+        fair = check_fairness(np.tile(np.arange(1, 7), 2000))
+        self.assertEqual(fairness_verdict(fair, 12000), f"accepted fairness after {fair.n_samples} of 12000 rolls")
+        biased = check_fairness(np.full(500, 6))
+        self.assertEqual(fairness_verdict(biased), f"rejected fairness after {biased.n_samples} rolls")
+
+    def test_invalid_input(self):
+        """Test invalid parameters and outcomes"""
+        with self.assertRaises(ValueError):
+            SequentialTest.fairness(bias=0.2)
+        with self.assertRaises(ValueError):
+            SequentialTest.fairness(alpha=0.6, beta=0.5)
+        with self.assertRaises(ValueError):
+            SequentialTest.simple([0.5, 0.5], [1.0, 0.0])
+        with self.assertRaises(ValueError):
+            SequentialTest.fairness().update([0, 1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the slide server
+"""
+
+import unittest
+import io
+import os
+import sys
+import tempfile
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Suppress matplotlib warnings
+import warnings
+warnings.filterwarnings("ignore", category=DeprecationWarning, module="matplotlib")
+warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend for tests
+import matplotlib.pyplot as plt
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import main
+from common.qmc import get_sampling_mode
+from common.rendering import save_figure
+from common.server import SlideServer, request_slide
+
+class TestSlideServer(unittest.TestCase):
+    """Tests for running slides through the slide server"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.runs = []
+        self.modes = []
+        self.server = SlideServer(self._fake_run_slide, ["1a", "3"], port=0)
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=5)
+        self.temp_dir.cleanup()
+
+    def _fake_run_slide(self, slide):
+        """Stand-in for main.run_slide that prints and saves one figure"""
+        self.runs.append(slide)
+        self.modes.append(get_sampling_mode())
+        print(f"Running slide {slide}...")
+        plt.figure(figsize=(2, 2))
+        plt.plot([0, 1], [1, 0])
+        save_figure(Path(self.temp_dir.name) / f"slide{slide}_plot.png")
+        return True
+
+    def test_run_returns_output_and_artifacts(self):
+        """Test that a run returns console output and saved figures"""
+        result = request_slide("3", port=self.port)
+
+        self.assertTrue(result["success"])
+        self.assertIn("Running slide 3...", result["output"])
+        self.assertEqual(len(result["artifacts"]), 1)
+        self.assertTrue(os.path.exists(result["artifacts"][0]))
+        self.assertEqual(self.runs, ["3"])
+
+    def test_repeated_runs_reuse_server(self):
+        """Test that the same warm server handles repeated runs"""
+        for _ in range(3):
+            result = request_slide("1a", port=self.port)
+            self.assertTrue(result["success"])
+        self.assertEqual(self.runs, ["1a", "1a", "1a"])
+
+    def test_unknown_slide(self):
+        """Test that unknown slides are rejected without running anything"""
+        result = request_slide("42", port=self.port)
+        self.assertIn("error", result)
+        self.assertEqual(self.runs, [])
+
+    def test_sampling_mode_forwarded(self):
+        """Test that a run uses the requested sampling mode and then restores the server's"""
+        server_mode = get_sampling_mode()
+        result = request_slide("3", port=self.port, sampling="sobol")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["sampling"], "sobol")
+        self.assertEqual(self.modes, ["sobol"])
+        self.assertEqual(get_sampling_mode(), server_mode)
+
+        request_slide("3", port=self.port)
+        self.assertEqual(self.modes, ["sobol", server_mode])
+
+    def test_unknown_sampling_mode(self):
+        """Test that unknown sampling modes are rejected without running anything"""
+        result = request_slide("3", port=self.port, sampling="lattice")
+        self.assertIn("error", result)
+        self.assertEqual(self.runs, [])
+
+    def test_remote_sends_sampling_mode(self):
+        """Test that --remote --sampling runs the slide in that mode on the server"""
+        argv = ["main.py", "--slide", "3", "--remote", "--port", str(self.port),
+                "--sampling", "halton"]
+        with mock.patch.object(sys, "argv", argv), mock.patch.object(main, "set_sampling_mode"), \
+                redirect_stdout(io.StringIO()), self.assertRaises(SystemExit) as exit_info:
+            main.main()
+        self.assertEqual(exit_info.exception.code, 0)
+        self.assertEqual(self.modes, ["halton"])
+
+    def test_no_server(self):
+        """Test the error raised when no server is listening"""
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertRaises(ConnectionError):
+            request_slide("3", port=self.port, timeout=2)
+
+class TestRemoteArguments(unittest.TestCase):
+    """Tests for the command line options that only apply to one command"""
+
+    def _assert_rejected(self, *options):
+        stderr = io.StringIO()
+        with mock.patch.object(sys, "argv", ["main.py", *options]), \
+                redirect_stderr(stderr), self.assertRaises(SystemExit) as exit_info:
+            main.main()
+        self.assertEqual(exit_info.exception.code, 2)
+        return stderr.getvalue()
+
+    def test_remote_without_slide(self):
+        """Test that --remote is rejected without --slide"""
+        self.assertIn("--remote can only be used with --slide", self._assert_rejected("--all", "--remote"))
+
+    def test_jobs_without_test(self):
+        """Test that --jobs is rejected without --test"""
+        self.assertIn("--jobs can only be used with --test", self._assert_rejected("--all", "--jobs", "2"))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for shared-memory sample arrays
+"""
+
+import unittest
+import pickle
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.shared_array import SharedArray, attach, detach, _attach_untracked
+from common.montecarlo import MonteCarloExecutor
+from common.streaming import RunningStats, StreamingHistogram
+
+def segment_exists(name):
+    """True if a shared memory segment with this name exists"""
+    try:
+        shm = _attach_untracked(name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+def sum_in_worker(handle):
+    """Worker task: sum the shared array"""
+    view = attach(handle)
+    total = float(view.sum())
+    detach(handle)
+    return total
+
+CRASHING_OWNER = """
+import os, signal, sys
+sys.path.insert(0, {root!r})
+from common.shared_array import SharedArray
+shared = SharedArray.from_array(range(1000))
+print(shared.name, flush=True)
+os.kill(os.getpid(), signal.SIGKILL)
+"""
+
+class TestSharedArray(unittest.TestCase):
+    """Tests for creating, attaching and releasing shared arrays"""
+
+    def test_attach_is_zero_copy(self):
+        """Test that attached views see the owner's buffer"""
+        with SharedArray.from_array(np.arange(6, dtype=np.int64).reshape(2, 3)) as shared:
+            view = attach(shared.handle)
+            self.assertEqual(view.shape, (2, 3))
+            self.assertFalse(view.flags.writeable)
+            shared.array[1, 2] = 99
+            self.assertEqual(view[1, 2], 99)
+            del view
+            detach(shared.handle)
+
+    def test_handle_is_small_and_picklable(self):
+        """Test that workers receive a handle, not the data"""
+        with SharedArray.from_array(np.zeros(100_000)) as shared:
+            payload = pickle.dumps(shared.handle)
+            self.assertLess(len(payload), 500)
+            self.assertEqual(pickle.loads(payload), shared.handle)
+
+    def test_close_unlinks(self):
+        """Test that leaving the with block removes the segment"""
+        with SharedArray(10) as shared:
+            name = shared.name
+            self.assertTrue(segment_exists(name))
+        self.assertTrue(shared.closed)
+        self.assertIsNone(shared.array)
+        self.assertFalse(segment_exists(name))
+
+    def test_garbage_collection_unlinks(self):
+        """Test that a dropped SharedArray releases its segment"""
+        shared = SharedArray(10)
+        name = shared.name
+        del shared
+        self.assertFalse(segment_exists(name))
+
+    def test_worker_exit_keeps_segment(self):
+        """Test that workers can read the array and exit without removing it"""
+        data = np.arange(1000.0)
+        with SharedArray.from_array(data) as shared:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                self.assertEqual(pool.submit(sum_in_worker, shared.handle).result(), data.sum())
+            self.assertTrue(segment_exists(shared.name))
+            self.assertEqual(shared.array.sum(), data.sum())
+
+    def test_owner_crash_cleans_up(self):
+        """Test that the segment is removed after the owner is killed"""
+        process = subprocess.run([sys.executable, "-c", CRASHING_OWNER.format(root=str(project_root))],
+                                 capture_output=True, text=True, timeout=60)
+        name = process.stdout.strip()
+        self.assertTrue(name)
+        deadline = time.time() + 10
+        while segment_exists(name) and time.time() < deadline:
+            time.sleep(0.1)
+        self.assertFalse(segment_exists(name))
+
+class TestConsumeArray(unittest.TestCase):
+    """Tests for feeding an existing array to workers through shared memory"""
+
+    def test_consume_array_matches_numpy(self):
+        """Test that sharded consumption of an array equals direct statistics"""
+        data = np.random.default_rng(4).uniform(0, 10, 50_000)
+        expected, _ = np.histogram(data, bins=20, range=(0, 10))
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                with MonteCarloExecutor(workers=workers, shard_size=12_000, chunk_size=5000) as executor:
+                    stats, histogram = executor.consume_array(data, RunningStats(),
+                                                              StreamingHistogram(20, (0, 10)))
+                self.assertEqual(stats.count, len(data))
+                self.assertAlmostEqual(stats.mean, data.mean(), places=10)
+                np.testing.assert_array_equal(histogram.counts, expected)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
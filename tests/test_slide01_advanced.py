@@ -208,7 +208,7 @@ class TestSlide01Performance(unittest.TestCase):
         
         start_time = time.time()
         
-        with OutputCapture():
+        with OutputCapture(discard=("stdout", "stderr")):
             calculate_dice_probabilities()
             simulate_dice_rolls(1000)
         
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for chunked sample generators and incremental statistics
+"""
+
+import unittest
+import sys
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib
+matplotlib.use('Agg')
+
+from common.streaming import (RunningStats, StreamingHistogram, OutcomeCounts,
+                              consume, chunk_sizes, uniform_chunks, dice_chunks,
+                              normal_chunks, coin_flip_chunks)
+from main import import_slide_module
+
+class TestChunkedGenerators(unittest.TestCase):
+    """Tests that chunked generators reproduce the batch samples"""
+
+    def test_chunk_sizes(self):
+        """Test that chunk sizes add up to the requested count"""
+        self.assertEqual(list(chunk_sizes(10, 4)), [4, 4, 2])
+        self.assertEqual(list(chunk_sizes(0, 4)), [])
+        with self.assertRaises(ValueError):
+            list(chunk_sizes(10, 0))
+
+    def test_uniform_matches_batch(self):
+        """Test slide 2's streaming uniform samples against the batch version"""
+        module = import_slide_module("2")
+        batch = module.sample_uniform(0, 10, 10_000)
+        chunks = list(module.generate_uniform_data_chunks(0, 10, 10_000, chunk_size=999))
+        self.assertEqual(len(chunks), 11)
+        np.testing.assert_array_equal(np.concatenate(chunks), batch)
+
+    def test_dice_matches_batch(self):
+        """Test slide 1's streaming dice rolls against the batch version"""
+        module = import_slide_module("1")
+        rolls, _ = module.roll_dice(5000)
+        chunks = module.simulate_dice_rolls_chunks(5000, chunk_size=700)
+        np.testing.assert_array_equal(np.concatenate(list(chunks)), rolls)
+
+    def test_normal_matches_batch(self):
+        """Test slide 3's streaming normal samples against the batch version"""
+        module = import_slide_module("3")
+        np.random.seed(7)
+        batch = module.generate_normal_samples(2, 3, 4000)
+        np.random.seed(7)
+        chunks = module.generate_normal_samples_chunks(2, 3, 4000, chunk_size=512)
+        np.testing.assert_array_equal(np.concatenate(list(chunks)), batch)
+
+    def test_coin_flips_match_loop(self):
+        """Test slide 4's success counts against one draw per experiment"""
+        module = import_slide_module("4")
+        np.random.seed(3)
+        expected = [np.sum(np.random.random(20) < 0.3) for _ in range(500)]
+        np.random.seed(3)
+        chunks = list(module.simulate_coin_flips_chunks(20, 0.3, 500, chunk_size=200))
+        self.assertEqual(len(chunks), 50)
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+    def test_generator_rng(self):
+        """Test that a Generator gives reproducible chunks"""
+        first = np.concatenate(list(dice_chunks(1000, chunk_size=300, rng=np.random.default_rng(1))))
+        second = np.concatenate(list(dice_chunks(1000, chunk_size=300, rng=np.random.default_rng(1))))
+        np.testing.assert_array_equal(first, second)
+        self.assertTrue(set(np.unique(first)) <= set(range(1, 7)))
+
+    def test_int_seed(self):
+        """Test that an integer rng seeds every stream reproducibly"""
+        streams = [lambda rng: uniform_chunks(0, 1, 10, 5, rng=rng),
+                   lambda rng: normal_chunks(0, 1, 10, 5, rng=rng),
+                   lambda rng: dice_chunks(10, chunk_size=5, rng=rng),
+                   lambda rng: coin_flip_chunks(4, 0.5, 10, 8, rng=rng)]
+        for stream in streams:
+            first = np.concatenate(list(stream(3)))
+            self.assertEqual(len(first), 10)
+            np.testing.assert_array_equal(np.concatenate(list(stream(3))), first)
+            np.testing.assert_array_equal(np.concatenate(list(stream(np.random.default_rng(3)))), first)
+
+class TestIncrementalStatistics(unittest.TestCase):
+    """Tests for the chunk consumers"""
+
+    def setUp(self):
+        self.data = np.random.default_rng(0).normal(1e6, 2.0, 100_000)
+        self.chunks = np.array_split(self.data, 37)
+
+    def test_running_stats(self):
+        """Test running moments against NumPy on the full array"""
+        stats = RunningStats()
+        self.assertEqual(consume(self.chunks, stats), len(self.data))
+        self.assertEqual(stats.count, len(self.data))
+        self.assertAlmostEqual(stats.mean, np.mean(self.data), delta=1e-9)
+        self.assertAlmostEqual(stats.variance(), np.var(self.data), delta=1e-9)
+        self.assertAlmostEqual(stats.std(ddof=1), np.std(self.data, ddof=1), delta=1e-9)
+        self.assertEqual((stats.min, stats.max), (self.data.min(), self.data.max()))
+
+    def test_histogram(self):
+        """Test accumulated histogram counts against np.histogram"""
+        histogram = StreamingHistogram(30, (1e6 - 5, 1e6 + 5))
+        consume(self.chunks, histogram)
+        counts, edges = np.histogram(self.data, bins=30, range=(1e6 - 5, 1e6 + 5))
+        np.testing.assert_array_equal(histogram.counts, counts)
+        np.testing.assert_allclose(histogram.edges, edges)
+        self.assertEqual(histogram.outside, len(self.data) - counts.sum())
+
+    def test_outcome_counts(self):
+        """Test dice outcome counts and frequencies"""
+        rolls = np.random.default_rng(2).integers(1, 7, 6000)
+        counts = OutcomeCounts(1, 6)
+        consume(np.array_split(rolls, 7), counts)
+        np.testing.assert_array_equal(counts.counts, np.bincount(rolls, minlength=7)[1:])
+        self.assertAlmostEqual(counts.frequencies().sum(), 1.0)
+        with self.assertRaises(ValueError):
+            counts.update([0, 7])
+
+    def test_bounded_memory(self):
+        """Test that memory stays at a few chunks regardless of the sample size"""
+        chunk_size = 1 << 16
+        stats = RunningStats()
+        histogram = StreamingHistogram(50, (0, 1))
+        tracemalloc.start()
+        try:
+            consume(uniform_chunks(0, 1, 64 * chunk_size, chunk_size, np.random.default_rng(5)),
+                    stats, histogram)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 8 * chunk_size * 8)
+        self.assertEqual(histogram.counts.sum(), 64 * chunk_size)
+        self.assertAlmostEqual(stats.mean, 0.5, delta=0.01)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
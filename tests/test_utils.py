@@ -5,7 +5,10 @@ Test Utilities for Output Capture and Error Logging
 """
 
 import sys
+import os
 import io
+import atexit
+import threading
 import contextlib
 import subprocess
 import json
@@ -13,6 +16,17 @@ from datetime import datetime
 from pathlib import Path
 import warnings
 
+try:
+    import fcntl
+except ImportError:  # Windows: single O_APPEND writes only
+    fcntl = None
+
+# File descriptor level capture for slides, C extensions and subprocesses
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+from common.capture import DEFAULT_MAX_BYTES, FDOutputCapture
+
 # Suppress matplotlib GUI windows during tests
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend to prevent window opening
@@ -22,35 +36,102 @@ warnings.filterwarnings("ignore", category=DeprecationWarning, module="matplotli
 warnings.filterwarnings("ignore", category=UserWarning, module="matplotlib")
 warnings.filterwarnings("ignore", message="findfont: Font family.*not found")
 
-class OutputCapture:
-    """Utility class for capturing stdout and stderr"""
+class OutputCapture(FDOutputCapture):
+    """Capture the stdout and stderr of slide code in tests
+
+    Works at the file descriptor level (common.capture.FDOutputCapture),
+    so print(), C extensions and child processes are all captured, and
+    only the newest max_bytes of each stream are kept. Streams a test
+    does not check can be discarded, e.g. discard=("stdout", "stderr").
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, discard=()):
+        super().__init__(max_bytes=max_bytes, discard=discard)
+
+# Single append-only error log shared by all tests and processes
+ERROR_LOG_FILE = "errors.jsonl"
+
+# Buffered records are written once this many are pending
+ERROR_LOG_BUFFER_SIZE = 50
+
+# Longest expected/actual text kept per record (slide output can be long)
+ERROR_LOG_MAX_OUTPUT = 4000
+
+# Set in parallel test workers, whose pytest sessions must leave the shared
+# log alone; the parent process compacts it
+TEST_WORKER_ENV = "PROB_TEST_WORKER"
+
+def _lock_file(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+class _ErrorLogSink:
+    """Buffered writer that appends whole JSON lines to the error log
+
+    Each flush is a single write on an O_APPEND descriptor, guarded by an
+    exclusive file lock where available, so several test processes can
+    share one log file without interleaving lines.
+    """
     
     def __init__(self):
-        self.stdout = io.StringIO()
-        self.stderr = io.StringIO()
-        self.original_stdout = sys.stdout
-        self.original_stderr = sys.stderr
-    
-    def __enter__(self):
-        sys.stdout = self.stdout
-        sys.stderr = self.stderr
-        return self
+        self._pending = {}
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+        # Forked children must not write the records buffered by the parent
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        sys.stdout = self.original_stdout
-        sys.stderr = self.original_stderr
+    def _reset_after_fork(self):
+        self._pending = {}
+        self._lock = threading.Lock()
     
-    def get_stdout(self):
-        """Get captured stdout"""
-        return self.stdout.getvalue()
+    def write(self, log_file, record):
+        """Queue one record for the given log file"""
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            lines = self._pending.setdefault(Path(log_file), [])
+            lines.append(line)
+            pending_count = len(lines)
+        if pending_count >= ERROR_LOG_BUFFER_SIZE:
+            self.flush()
     
-    def get_stderr(self):
-        """Get captured stderr"""
-        return self.stderr.getvalue()
-    
-    def get_combined(self):
-        """Get combined stdout and stderr"""
-        return self.get_stdout() + self.get_stderr()
+    def flush(self):
+        """Append all queued records to their log files"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for log_file, lines in pending.items():
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            data = "".join(lines).encode("utf-8")
+            fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                _lock_file(fd)
+                os.write(fd, data)
+            finally:
+                os.close(fd)  # Closing the descriptor also releases the lock
+
+    def has_pending(self, log_file):
+        """Whether records for log_file are waiting to be written"""
+        with self._lock:
+            return bool(self._pending.get(Path(log_file)))
+
+_error_log_sink = _ErrorLogSink()
+
+def _truncate_output(value, limit=ERROR_LOG_MAX_OUTPUT):
+    """Keep the start and end of long text; tracebacks end up at the end"""
+    if not isinstance(value, str) or len(value) <= limit:
+        return value
+    half = limit // 2
+    return f"{value[:half]}\n... [{len(value) - 2 * half} characters omitted] ...\n{value[-half:]}"
+
+def flush_error_log():
+    """Write buffered error records to disk"""
+    _error_log_sink.flush()
+
+def _current_test_id(test_name):
+    """Identify the running test method, falling back to the logger name"""
+    current_test = os.environ.get("PYTEST_CURRENT_TEST")
+    # PYTEST_CURRENT_TEST looks like "tests/test_x.py::TestX::test_y (call)"
+    return current_test.rsplit(" (", 1)[0] if current_test else test_name
 
 class ErrorLogger:
     """Utility class for logging test errors"""
@@ -59,29 +140,110 @@ class ErrorLogger:
         self.test_name = test_name
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
-        self.log_file = self.log_dir / f"LOG_ERROR_{test_name}.json"
+        self.log_file = self.log_dir / ERROR_LOG_FILE
     
     def log_error(self, expected, actual, error_type="OUTPUT_MISMATCH", additional_info=None):
-        """Log error details to JSON file"""
+        """Append error details to the JSONL error log"""
         error_data = {
+            "event": "error",
             "timestamp": datetime.now().isoformat(),
             "test_name": self.test_name,
+            "test_id": _current_test_id(self.test_name),
             "error_type": error_type,
-            "expected": expected,
-            "actual": actual,
-            "additional_info": additional_info or {}
+            "expected": _truncate_output(expected),
+            "actual": _truncate_output(actual),
+            "additional_info": additional_info or {},
+            "pid": os.getpid()
         }
         
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            json.dump(error_data, f, indent=2, ensure_ascii=False)
+        _error_log_sink.write(self.log_file, error_data)
         
-        print(f"ERROR LOG CREATED: {self.log_file}")
+        print(f"ERROR LOGGED: {self.log_file} [{self.test_name}: {error_type}]")
         return self.log_file
     
     def clear_log(self):
-        """Clear existing log file"""
-        if self.log_file.exists():
-            self.log_file.unlink()
+        """Mark earlier errors of the running test as cleared
+
+        The log is append-only, so clearing writes a marker record;
+        readers ignore errors of the same test logged before it. While
+        the log holds no records at all, there is nothing to clear.
+        """
+        has_records = self.log_file.exists() and self.log_file.stat().st_size > 0
+        if not (has_records or _error_log_sink.has_pending(self.log_file)):
+            return
+        _error_log_sink.write(self.log_file, {
+            "event": "clear",
+            "timestamp": datetime.now().isoformat(),
+            "test_name": self.test_name,
+            "test_id": _current_test_id(self.test_name),
+            "pid": os.getpid()
+        })
+
+def _current_errors(lines):
+    """Error records of JSON lines that no later clear marker hides"""
+    errors = {}
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # Partial line from an interrupted writer
+        test_id = record.get("test_id", record.get("test_name"))
+        test_errors = errors.setdefault(test_id, [])
+        if record.get("event") == "clear":
+            test_errors.clear()
+        else:
+            test_errors.append(record)
+    return [record for test_errors in errors.values() for record in test_errors]
+
+def read_error_log(log_dir="tests/logs"):
+    """Return the current error records, skipping cleared ones"""
+    flush_error_log()
+    log_file = Path(log_dir) / ERROR_LOG_FILE
+    if not log_file.exists():
+        return []
+    
+    with open(log_file, encoding='utf-8') as f:
+        return _current_errors(f)
+
+def compact_error_log(log_dir="tests/logs"):
+    """Rewrite the error log with only its current errors
+
+    Clear markers and the errors they hide are dropped, so the log stays
+    as large as the current failures instead of growing with every run.
+    Called once per test session; the file lock keeps concurrent writers
+    from losing records while the log is rewritten.
+    """
+    flush_error_log()
+    log_file = Path(log_dir) / ERROR_LOG_FILE
+    if not log_file.exists():
+        return
+    
+    fd = os.open(log_file, os.O_RDWR)
+    try:
+        _lock_file(fd)
+        with os.fdopen(os.dup(fd), "rb") as f:
+            lines = f.read().decode("utf-8", errors="replace").splitlines()
+        data = "".join(json.dumps(record, ensure_ascii=False, default=str) + "\n"
+                       for record in _current_errors(lines))
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, data.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+def summarize_errors(log_dir="tests/logs"):
+    """Count current errors by test name and error type
+
+    Returns:
+        dict: {test_name: {error_type: {"count": int, "last_seen": timestamp}}}
+    """
+    summary = {}
+    for record in read_error_log(log_dir):
+        entry = summary.setdefault(record["test_name"], {}).setdefault(
+            record["error_type"], {"count": 0, "last_seen": ""})
+        entry["count"] += 1
+        entry["last_seen"] = max(entry["last_seen"], record["timestamp"])
+    return summary
 
 def run_module_with_capture(module_path, args=None):
     """Run a Python module and capture its output"""
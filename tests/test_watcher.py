@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the slide watcher
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add project path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from common.watcher import SlideWatcher, slide_id_from_dir
+from main import reload_slide_module
+
+class TestSlideWatcher(unittest.TestCase):
+    """Tests for detecting changed slides"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        for slide_dir in ("slide01a", "slide03", "slide10"):
+            (self.root / slide_dir).mkdir()
+            (self.root / slide_dir / f"{slide_dir}_main.py").write_text("x = 1\n")
+        self.watcher = SlideWatcher(self.root)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _touch(self, relative_path):
+        path = self.root / relative_path
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_slide_id_from_dir(self):
+        """Test mapping of slide directories to slide numbers"""
+        self.assertEqual(slide_id_from_dir("slide01a"), "1a")
+        self.assertEqual(slide_id_from_dir("slide03"), "3")
+        self.assertEqual(slide_id_from_dir("slide10"), "10")
+        self.assertIsNone(slide_id_from_dir("tests"))
+
+    def test_no_changes(self):
+        """Test that an untouched tree reports nothing"""
+        self.assertEqual(self.watcher.poll(), [])
+
+    def test_only_changed_slides_reported(self):
+        """Test that only modified slides are reported, in slide order"""
+        self._touch("slide10/slide10_main.py")
+        self._touch("slide03/slide03_main.py")
+        self.assertEqual(self.watcher.poll(), ["3", "10"])
+        self.assertEqual(self.watcher.poll(), [])
+
+    def test_new_and_deleted_files(self):
+        """Test that added and removed files count as changes"""
+        (self.root / "slide01a" / "helpers.py").write_text("y = 2\n")
+        self.assertEqual(self.watcher.poll(), ["1a"])
+        (self.root / "slide01a" / "helpers.py").unlink()
+        self.assertEqual(self.watcher.poll(), ["1a"])
+
+class TestReloadSlideModule(unittest.TestCase):
+    """Tests for re-importing edited slides"""
+
+    def test_helper_modules_reloaded(self):
+        """Test that edits to a helper next to the *_main module take effect"""
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                mock.patch.dict(sys.modules), mock.patch.object(sys, "path", [temp_dir] + sys.path):
+            for name in [name for name in sys.modules if name.split(".")[0] == "slide04"]:
+                del sys.modules[name]
+            package = Path(temp_dir) / "slide04"
+            package.mkdir()
+            (package / "__init__.py").write_text("")
+            (package / "slide04_main.py").write_text("from slide04.helpers import VALUE\n")
+            (package / "helpers.py").write_text("VALUE = 1\n")
+            self.assertEqual(reload_slide_module("4").VALUE, 1)
+            (package / "helpers.py").write_text("VALUE = 22\n")
+            self.assertEqual(reload_slide_module("4").VALUE, 22)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)